@@ -0,0 +1,122 @@
+"""
+Event page decoding with selector specs versus full BeautifulSoup tree.
+
+QTickets and Ticketscloud extract page fields by SelectorSpec
+(escraper/parsers/selector.py) instead of building soup of the whole
+page. This benchmark compares best time and tracemalloc peak of
+decoding one page both ways: fixture page with big menu (QTickets)
+and synthetic page (Ticketscloud).
+
+Usage:
+------
+    python -m benchmarks.pages                  # print report
+    python -m benchmarks.pages --check          # fail if selectors aren't 2x better
+    python -m benchmarks.pages --min-ratio 5
+
+Ratios are measured in one process, so baseline is not needed.
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+
+from bs4 import BeautifulSoup
+
+from escraper.parsers import QTickets, Ticketscloud
+
+from .parsers import TESTDATA, ticketscloud_page
+
+
+def qtickets_page():
+    # fixture page with big menu, which fields don't need
+    body = (TESTDATA / "test_qtickets" / "event_card.html").read_text()
+    return body.replace("<footer>", "<nav><a href='#'>menu</a></nav>" * 200 + "<footer>")
+
+
+def decode_qtickets(body):
+    return QTickets()._event_data(body)
+
+
+def decode_ticketscloud(body):
+    return Ticketscloud()._event_data(body, "https://org.ticketscloud.org/events/1")
+
+
+# name: (page, decode page by selectors)
+CASES = dict(
+    qtickets=(qtickets_page, decode_qtickets),
+    ticketscloud=(lambda: ticketscloud_page(1, 1), decode_ticketscloud),
+)
+
+
+def full_soup(body):
+    return BeautifulSoup(body, "lxml")
+
+
+def best_time(function, *args, repeat=20):
+    times = list()
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function(*args)
+        times.append(time.perf_counter() - started)
+    return min(times)
+
+
+def peak_memory(function, *args):
+    tracemalloc.start()
+    try:
+        function(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_case(name, repeat=20):
+    """Time (seconds) and peak memory (bytes) of selectors and full soup for page of case."""
+    page, decode = CASES[name]
+    body = page()
+    return dict(
+        time=best_time(decode, body, repeat=repeat),
+        soup_time=best_time(full_soup, body, repeat=repeat),
+        memory=peak_memory(decode, body),
+        soup_memory=peak_memory(full_soup, body),
+    )
+
+
+def report(results):
+    lines = [f"{'page':<14}{'ms':>8}{'soup ms':>9}{'x':>6}{'peak KB':>9}{'soup KB':>9}{'x':>6}"]
+    for name, result in results.items():
+        lines.append(
+            f"{name:<14}{result['time'] * 1e3:>8.2f}{result['soup_time'] * 1e3:>9.2f}"
+            f"{result['soup_time'] / result['time']:>6.1f}"
+            f"{result['memory'] / 1024:>9.1f}{result['soup_memory'] / 1024:>9.1f}"
+            f"{result['soup_memory'] / max(result['memory'], 1):>6.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Event pages: selector specs versus full soup.")
+    parser.add_argument("--pages", nargs="*", default=list(CASES), choices=list(CASES))
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--min-ratio", type=float, default=2.0, help="min soup / selectors ratio for --check")
+    parser.add_argument("--check", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = {name: run_case(name, repeat=args.repeat) for name in args.pages}
+    print(report(results))
+
+    if args.check:
+        failed = False
+        for name, result in results.items():
+            for metric in ("time", "memory"):
+                ratio = result["soup_" + metric] / max(result[metric], 1e-9)
+                if ratio < args.min_ratio:
+                    failed = True
+                    print(f"REGRESSION {name}: {metric} only {ratio:.1f}x better than full soup", file=sys.stderr)
+        return 1 if failed else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
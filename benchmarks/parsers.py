@@ -0,0 +1,388 @@
+"""
+Offline benchmark of parsers parse path (without network).
+
+Every case takes raw payloads (api json or event page), decodes them
+the same way as parser does after fetch and parses all event tags.
+Payloads are fixtures from tests/test_data and synthetic events,
+'--scale' repeats corpus and makes descriptions longer.
+
+Usage:
+------
+    python -m benchmarks.parsers                      # run and print report
+    python -m benchmarks.parsers --scale 10           # bigger corpus
+    python -m benchmarks.parsers --save-baseline      # store events/sec as baseline
+    python -m benchmarks.parsers --check              # fail if slower than baseline (confirmed by re-runs)
+    python -m benchmarks.parsers --parsers mts radario
+
+Baseline is machine specific and is not committed: save it on the
+machine, where '--check' runs (before changes), '--check' refuses
+baseline saved on other machine.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from escraper.parsers import ALL_EVENT_TAGS, Culture, MTS, QTickets, Radario, Ticketscloud, Timepad, VK
+
+ROOT = Path(__file__).parent
+TESTDATA = ROOT.parent / "tests" / "test_data"
+BASELINE = ROOT / "baseline.json"
+
+LOREM = (
+    "<p>Концерт в <b>Двор Гостинки</b>: музыка, &laquo;смех&raquo; и <a href='#'>сюрпризы</a>.</p>"
+    "<p>Начало в 19:00. Вход&nbsp;свободный.<br/>Подробности на сайте.</p>"
+)
+
+
+def future(days, hour=19):
+    return (datetime.utcnow() + timedelta(days=days)).replace(hour=hour, minute=0, second=0, microsecond=0)
+
+
+#######################################
+## corpora
+#######################################
+def radario_fixture_corpus(scale):
+    # api json of tests (tests/testing.py)
+    from tests.testing import radario_event
+
+    return [radario_event(i) for i in range(50 * scale)]
+
+
+def radario_corpus(scale):
+    return [
+        dict(
+            id=i,
+            title=f"Концерт {i}",
+            placeAddress="190000, Санкт-Петербург, Невский проспект, 35",
+            cityName="Санкт-Петербург",
+            placeTitle="Двор Гостинки",
+            superTagName="Концерты",
+            beginDate=future(i % 30).strftime("%Y-%m-%dT%H:%M:%S.000+03:00"),
+            endDate=future(i % 30, hour=21).strftime("%Y-%m-%dT%H:%M:%S.000+03:00"),
+            description=LOREM * scale,
+            imageUri="https://images.radario.ru/1.jpg",
+            minPrice=1500.0,
+            currency="RUB",
+            ticketCount=10,
+        )
+        for i in range(50 * scale)
+    ]
+
+
+def timepad_corpus(scale):
+    return [
+        dict(
+            id=i,
+            name=f"Лекция &laquo;{i}&raquo;",
+            starts_at=future(i % 30).strftime("%Y-%m-%dT%H:%M:%S+0300"),
+            ends_at=future(i % 30, hour=21).strftime("%Y-%m-%dT%H:%M:%S+0300"),
+            location=dict(city="Санкт-Петербург", address="Невский проспект, 35"),
+            categories=[dict(name="Лекции")],
+            organization=dict(name="Лекторий <b>Пространство</b>"),
+            description_short="Лекция о космосе.",
+            description_html=LOREM * scale,
+            poster_image=dict(uploadcare_url="//ucarecdn.com/1/"),
+            registration_data=dict(is_registration_open=True, price_min=300, price_max=500),
+            ticket_types=[dict(price=500, status="ok"), dict(price=300, status="ok")],
+            url=f"https://timepad.ru/event/{i}/",
+            moderation_status="moderated",
+        )
+        for i in range(50 * scale)
+    ]
+
+
+def vk_corpus(scale):
+    return [
+        dict(
+            id=i,
+            name=f"Вечеринка {i}",
+            addresses=dict(),
+            start_date=int(future(i % 30).timestamp()),
+            finish_date=int(future(i % 30, hour=23).timestamp()),
+            description="Описание встречи. " * 20 * scale,
+            screen_name=f"event{i}",
+            site="",
+            cover=dict(enabled=1, images=[dict(url="https://vk.com/1.jpg")]),
+        )
+        for i in range(50 * scale)
+    ]
+
+
+def mts_corpus(scale):
+    pages = sorted((TESTDATA / "test_mts").glob("event_card_*.html"))
+    return [(page.read_text(), f"https://live.mts.ru/event?eventId={i}") for i in range(5 * scale) for page in pages]
+
+
+def culture_page(i, scale):
+    seances = [
+        dict(
+            startDate=(future(day - 60)).strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+            endDate=(future(day - 60, hour=21)).strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+        )
+        for day in range(120)
+    ]
+    event = dict(
+        _id=i,
+        title=f"Выставка {i}",
+        places=[dict(title="Русский музей", address="г. Санкт-Петербург, Инженерная улица, 4")],
+        seances=seances,
+        text="[HTML]" + LOREM * scale + "[/HTML]",
+        image=dict(url="https://culture.ru/1.jpg"),
+        priceMin=400,
+        saleLink="https://culture.ru/buy",
+        status="published",
+    )
+    next_data = dict(props=dict(pageProps=dict(event=event, other=["x" * 100] * 50)))
+    return (
+        "<html><head>"
+        f'<script type="application/ld+json">{json.dumps(dict(image=dict(url="https://culture.ru/1.jpg")))}</script>'
+        "</head><body><div>" + "<p>menu</p>" * 200 + "</div>"
+        f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(next_data)}</script>'
+        "</body></html>"
+    )
+
+
+def culture_corpus(scale):
+    return [(culture_page(i, scale), f"https://www.culture.ru/events/{i}/name") for i in range(10 * scale)]
+
+
+def qtickets_page(i, scale):
+    return (
+        "<html><head>"
+        f'<link rel="canonical" href="https://spb.qtickets.events/{i}-kontsert"/>'
+        "</head><body>" + "<nav><a href='#'>menu</a></nav>" * 100 +
+        '<section id="modal_content"><h1>Концерт ' + str(i) + "</h1>"
+        '<div class="event-info"><time>пятница 12 мая, 19:00</time></div>'
+        '<a class="place" href="#">Клуб Космонавт</a>'
+        '<div class="address">Санкт-Петербург, Бронницкая улица, 24, Россия</div>'
+        '<div class="center_area"><img src="https://qtickets.events/1.jpg"/></div>'
+        '<a id="buy_btn">Купить от 1500 ₽</a>'
+        '<div class="text">' + LOREM * scale + "</div>"
+        "</section></body></html>"
+    )
+
+
+def qtickets_corpus(scale):
+    return [(qtickets_page(i, scale), f"https://spb.qtickets.events/{i}-kontsert") for i in range(10 * scale)]
+
+
+def ticketscloud_page(i, scale):
+    tc_event = dict(
+        id=str(i),
+        venue=dict(address="Санкт-Петербург, Бронницкая улица, 24"),
+        tags=["Концерты"],
+        lifetime="BEGIN:VEVENT\nDTSTART;VALUE=DATE-TIME:20300101T160000Z\nDTEND;VALUE=DATE-TIME:20300101T190000Z\nEND:VEVENT",
+        media=dict(cover_original=dict(url="https://ticketscloud.org/1.jpg")),
+        org=dict(id="org"),
+        tickets_amount_vacant=10,
+    )
+    return (
+        "<html><head><script>var x = 1;</script>"
+        f"<script>tc_event = {json.dumps(tc_event)};</script>"
+        "</head><body>" + "<nav><a href='#'>menu</a></nav>" * 100 +
+        '<div class="event-info-se__title">Концерт ' + str(i) + "</div>"
+        '<div class="event-info-se__address-part"><time>1 января\n 19:00</time>'
+        "<address>Санкт-Петербург, Клуб  Космонавт</address></div>"
+        '<div class="buy-button-se__button">Купить\n от 1500 ₽</div>'
+        '<article class="col-md-9 col-sm-12 showroom-event-slide__content showroom-event-slide__content_desc">'
+        "<p>" + "Описание.Концерта " * 20 * scale + "</p></article>"
+        "</body></html>"
+    )
+
+
+def ticketscloud_corpus(scale):
+    return [(ticketscloud_page(i, scale), f"https://org.ticketscloud.org/events/{i}") for i in range(10 * scale)]
+
+
+#######################################
+## cases
+#######################################
+def new_timepad():
+    return Timepad(token="benchmark")
+
+
+def new_vk():
+    vk = VK.__new__(VK)  # without token: parse path only
+    vk.city = "Санкт-Петербург"
+    return vk
+
+
+def decode_html(parser, payload):
+    body, event_url = payload
+    return parser._event_data(body, event_url)
+
+
+def decode_json(parser, payload):
+    return payload
+
+
+# name: (parser factory, corpus, decode payload to event data)
+CASES = dict(
+    radario=(Radario, radario_corpus, decode_json),
+    radario_fixture=(Radario, radario_fixture_corpus, decode_json),
+    timepad=(new_timepad, timepad_corpus, decode_json),
+    vk=(new_vk, vk_corpus, decode_json),
+    mts=(MTS, mts_corpus, decode_html),
+    culture=(Culture, culture_corpus, decode_html),
+    qtickets=(QTickets, qtickets_corpus, decode_html),
+    ticketscloud=(Ticketscloud, ticketscloud_corpus, decode_html),
+)
+
+
+def run_case(name, scale=1, repeat=5, min_time=0.2):
+    """
+    Parse corpus 'repeat' times, return best events/sec,
+    time per tag (seconds per event) and peak memory of one run.
+    One run parses corpus again and again at least 'min_time' seconds,
+    so fast parsers (tens of µs per event) are not measured by noise.
+    """
+    parser_factory, corpus, decode = CASES[name]
+    parser = parser_factory()
+    payloads = corpus(scale)
+
+    best_time = None
+    tag_times = defaultdict(float)
+
+    for _ in range(repeat):
+        run_tag_times = defaultdict(float)
+        run_events = 0
+        start = time.perf_counter()
+
+        while run_events == 0 or time.perf_counter() - start < min_time:
+            for payload in payloads:
+                tag_start = time.perf_counter()
+                event_data = decode(parser, payload)
+                tag_end = time.perf_counter()
+                run_tag_times["<decode>"] += tag_end - tag_start
+
+                # same as BaseParser.parse, but timed per tag
+                for tag in ALL_EVENT_TAGS:
+                    tag_start = tag_end
+                    getattr(parser, "_" + tag)(event_data)
+                    tag_end = time.perf_counter()
+                    run_tag_times[tag] += tag_end - tag_start
+            run_events += len(payloads)
+
+        run_time = (time.perf_counter() - start) / run_events
+        if best_time is None or run_time < best_time:
+            best_time = run_time
+            tag_times = {tag: seconds / run_events for tag, seconds in run_tag_times.items()}
+
+    tracemalloc.start()
+    for payload in payloads:
+        parser.parse(decode(parser, payload), tags=ALL_EVENT_TAGS)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return dict(
+        events=len(payloads),
+        events_per_sec=1 / best_time,
+        tag_time=tag_times,
+        peak_memory=peak_memory,
+    )
+
+
+def machine():
+    """Machine and python, which baseline is valid for."""
+    return f"{platform.node()} {platform.machine()} {platform.processor()} python {platform.python_version()}"
+
+
+def load_baseline(path=BASELINE):
+    """Baseline dict(machine=..., events_per_sec={case@scale: events/sec}), None if it isn't saved."""
+    if not Path(path).exists():
+        return None
+    with open(path) as fp:
+        return json.load(fp)
+
+
+def save_baseline(results, scale, path=BASELINE):
+    baseline = load_baseline(path)
+    if baseline is None or baseline.get("machine") != machine():
+        baseline = dict(machine=machine(), events_per_sec=dict())
+    for name, result in results.items():
+        baseline["events_per_sec"][f"{name}@{scale}"] = round(result["events_per_sec"], 1)
+    with open(path, "w") as fp:
+        json.dump(baseline, fp, indent=4, sort_keys=True)
+        fp.write("\n")
+
+
+def regressions(results, scale, threshold, baseline):
+    """Cases slower than baseline (events/sec dict) more than 'threshold' (share)."""
+    slow = dict()
+    for name, result in results.items():
+        expected = baseline.get(f"{name}@{scale}")
+        if expected and result["events_per_sec"] < expected * (1 - threshold):
+            slow[name] = (result["events_per_sec"], expected)
+    return slow
+
+
+def report(results, baseline, scale, top_tags=4):
+    lines = [f"{'parser':<16}{'events':>8}{'events/sec':>12}{'baseline':>10}{'peak MB':>9}  slowest tags (µs/event)"]
+    for name, result in results.items():
+        expected = baseline.get(f"{name}@{scale}")
+        slowest = sorted(result["tag_time"].items(), key=lambda item: -item[1])[:top_tags]
+        lines.append(
+            f"{name:<16}{result['events']:>8}{result['events_per_sec']:>12.1f}"
+            f"{expected if expected else '-':>10}{result['peak_memory'] / 1024 ** 2:>9.2f}  "
+            + ", ".join(f"{tag} {seconds * 1e6:.0f}" for tag, seconds in slowest)
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline benchmark of escraper parsers.")
+    parser.add_argument("--parsers", nargs="*", default=list(CASES), choices=list(CASES))
+    parser.add_argument("--scale", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--min-time", type=float, default=0.1, help="min seconds of one run of case")
+    parser.add_argument("--confirm", type=int, default=2, help="re-runs of slow cases before --check fails")
+    parser.add_argument("--threshold", type=float, default=0.3, help="allowed slowdown share for --check")
+    parser.add_argument("--baseline", default=str(BASELINE))
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--check", action="store_true")
+    args = parser.parse_args(argv)
+
+    baseline = load_baseline(args.baseline)
+    if args.check and (baseline is None or baseline.get("machine") != machine()):
+        print(
+            f"No baseline of this machine in {args.baseline}: "
+            "run --save-baseline here (before changes) first.",
+            file=sys.stderr,
+        )
+        return 2
+
+    results = {
+        name: run_case(name, scale=args.scale, repeat=args.repeat, min_time=args.min_time) for name in args.parsers
+    }
+    baseline = baseline["events_per_sec"] if baseline is not None and baseline.get("machine") == machine() else dict()
+    print(report(results, baseline, args.scale))
+
+    if args.save_baseline:
+        save_baseline(results, args.scale, args.baseline)
+
+    if args.check:
+        slow = regressions(results, args.scale, args.threshold, baseline)
+        # slowdown of busy machine is transient, regression is not: best of re-runs is compared
+        for _ in range(args.confirm):
+            if not slow:
+                break
+            for name in slow:
+                result = run_case(name, scale=args.scale, repeat=args.repeat, min_time=args.min_time)
+                if result["events_per_sec"] > results[name]["events_per_sec"]:
+                    results[name] = result
+            slow = regressions(results, args.scale, args.threshold, baseline)
+        for name, (events_per_sec, expected) in slow.items():
+            print(f"REGRESSION {name}: {events_per_sec:.1f} events/sec < baseline {expected}", file=sys.stderr)
+        return 1 if slow else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+import re
+from collections import Counter, defaultdict
+from datetime import timedelta
+
+
+NOT_WORD_RE = re.compile(r"[^\w\s]+")
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize(text):
+    """
+    Lowercase text without punctuation, emoji and extra whitespace.
+
+    Examples:
+    ---------
+    >>> normalize("🎸 Концерт группы «Ёлки»!")
+    'концерт группы елки'
+    """
+    if not text:
+        return ""
+    text = NOT_WORD_RE.sub(" ", text.lower().replace("ё", "е"))
+    return WHITESPACE_RE.sub(" ", text).strip()
+
+
+def trigrams(text):
+    """Set of character trigrams of normalized text (words are padded with spaces)."""
+    text = f" {normalize(text)} "
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class DuplicateIndex:
+    """
+    Index of events from all parsers, which finds the same event
+    published on several sources.
+
+    Events are fed one by one (as they are parsed) and compared only
+    with candidates from the same blocks: date_from bucket (neighbour
+    buckets too) and words of normalized place name. Candidates are
+    duplicates, if their dates differ less than 'max_time_diff' and
+    Jaccard similarity of title trigrams is at least 'threshold'.
+    Duplicates are joined to clusters (union-find), so crawl of n events
+    takes about n * (block size) operations instead of n^2 comparisons.
+
+    Parameters:
+    -----------
+    threshold : float, default 0.5
+        Min title similarity (Jaccard of trigrams) of duplicates.
+
+    max_time_diff : timedelta, default 3 hours
+        Max difference of date_from of duplicates (and size of date bucket).
+
+    min_place_word : int, default 3
+        Place name words shorter than this don't make blocks.
+
+    Examples:
+    ---------
+    >>> index = DuplicateIndex()
+    >>> for event in radario.get_events(request_params=params) + mts.get_events(request_params=params):
+    ...     index.add(event)
+    >>> index.clusters()
+    [[event(id='RADARIO-1', ...), event(id='MTS-18634405', ...)], ...]
+    """
+
+    def __init__(self, threshold=0.5, max_time_diff=timedelta(hours=3), min_place_word=3):
+        self.threshold = threshold
+        self.max_time_diff = max_time_diff
+        self.min_place_word = min_place_word
+
+        self.events = list()
+        self._ids = dict()  # event id: position in events
+        self._parents = list()  # union-find of positions
+        self._trigrams = list()
+        # (date bucket, place word): trigram: positions of events
+        self._blocks = defaultdict(lambda: defaultdict(list))
+
+    def __repr__(self):
+        return f"<DuplicateIndex events={len(self.events)} threshold={self.threshold}>"
+
+    def __len__(self):
+        return len(self.events)
+
+    def add(self, event):
+        """
+        Add event (record with id, title, date_from and place_name tags),
+        return ids of already added duplicates of it.
+
+        Event with already added id is ignored.
+        """
+        if event.id in self._ids:
+            return list()
+
+        position = len(self.events)
+        self.events.append(event)
+        self._ids[event.id] = position
+        self._parents.append(position)
+
+        title_trigrams = trigrams(event.title)
+        self._trigrams.append(title_trigrams)
+
+        if event.date_from is None or not title_trigrams:
+            return list()
+
+        blocks = self._block_keys(event)
+        duplicates = self._duplicates(position, title_trigrams, blocks)
+
+        for duplicate in duplicates:
+            self._union(position, duplicate)
+
+        for block in blocks:
+            if block[0] == self._bucket(event.date_from):
+                postings = self._blocks[block]
+                for trigram in title_trigrams:
+                    postings[trigram].append(position)
+
+        return [self.events[duplicate].id for duplicate in duplicates]
+
+    def update(self, events):
+        for event in events:
+            self.add(event)
+
+    def cluster(self, event_id):
+        """All events of cluster of event (with event itself)."""
+        root = self._find(self._ids[event_id])
+        return [event for position, event in enumerate(self.events) if self._find(position) == root]
+
+    def clusters(self, min_size=2):
+        """Clusters of duplicate events (in order of adding)."""
+        clusters = defaultdict(list)
+        for position, event in enumerate(self.events):
+            clusters[self._find(position)].append(event)
+        return [cluster for cluster in clusters.values() if len(cluster) >= min_size]
+
+    def _bucket(self, date_from):
+        return int(date_from.timestamp() // self.max_time_diff.total_seconds())
+
+    def _block_keys(self, event):
+        # own bucket and neighbours: duplicates near bucket border are found too
+        bucket = self._bucket(event.date_from)
+        words = [word for word in normalize(event.place_name).split() if len(word) >= self.min_place_word] or [""]
+        return [(bucket + shift, word) for shift in (0, -1, 1) for word in words]
+
+    def _duplicates(self, position, title_trigrams, blocks):
+        # candidate is in several blocks with the same count of shared trigrams
+        shared = dict()
+        for block in blocks:
+            shared.update(self._candidates(block, title_trigrams))
+
+        # timestamps: naive and aware dates of different parsers are comparable
+        timestamp = self.events[position].date_from.timestamp()
+        max_time_diff = self.max_time_diff.total_seconds()
+        duplicates = list()
+        for candidate, common in shared.items():
+            similarity = common / (len(title_trigrams) + len(self._trigrams[candidate]) - common)
+            if (
+                similarity >= self.threshold
+                and abs(self.events[candidate].date_from.timestamp() - timestamp) <= max_time_diff
+            ):
+                duplicates.append(candidate)
+        return sorted(duplicates)
+
+    def _candidates(self, block, title_trigrams):
+        postings = self._blocks.get(block)
+        if not postings:
+            return ()
+        counts = Counter()
+        for trigram in title_trigrams:
+            counts.update(postings.get(trigram, ()))
+        return counts.items()
+
+    def _find(self, position):
+        parents = self._parents
+        while parents[position] != position:
+            parents[position] = parents[parents[position]]
+            position = parents[position]
+        return position
+
+    def _union(self, first, second):
+        first, second = self._find(first), self._find(second)
+        if first != second:
+            self._parents[max(first, second)] = min(first, second)
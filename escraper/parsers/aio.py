@@ -0,0 +1,116 @@
+import asyncio
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+try:
+    import aiohttp
+    import yarl
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+if aiohttp is not None:
+    ASYNC_RETRY_EXCEPTIONS = (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError)
+else:  # pragma: no cover
+    ASYNC_RETRY_EXCEPTIONS = (asyncio.TimeoutError,)
+
+
+class AsyncSessionPool:
+    """
+    aiohttp session with bounded number of connections per host.
+
+    Responses are returned as ``requests.Response`` objects, so parsers
+    handle them the same way as responses from SessionPool.
+
+    Requires aiohttp (``pip install escraper[async]``).
+
+    Parameters:
+    -----------
+    max_connections_per_host : int, default 10
+        Max number of concurrent requests to one host.
+
+    max_connections : int, default 100
+        Max number of concurrent requests at all.
+
+    keep_alive : bool, default True
+        Reuse connections between requests.
+
+    headers : dict, default None
+        Headers sent with every request of the pool.
+
+    timeout : float, default 60
+        Total timeout of one request in seconds.
+    """
+
+    def __init__(self, max_connections_per_host=10, max_connections=100, keep_alive=True, headers=None, timeout=60):
+        if aiohttp is None:
+            raise ImportError("Async parsing requires aiohttp: pip install escraper[async]")
+
+        self.max_connections_per_host = max_connections_per_host
+        self.max_connections = max_connections
+        self.keep_alive = keep_alive
+        self.headers = dict(headers or {})
+        self.timeout = timeout
+
+        self._session = None
+        self._session_loop = None
+
+    def __repr__(self):
+        return (
+            f"<AsyncSessionPool max_connections_per_host={self.max_connections_per_host} "
+            f"max_connections={self.max_connections} keep_alive={self.keep_alive}>"
+        )
+
+    @property
+    def session(self):
+        """
+        Underlying aiohttp.ClientSession. Session is bound to event loop,
+        so new one is created for every running loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections_per_host,
+                force_close=not self.keep_alive,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def get(self, url, params=None, headers=None, **kwargs):
+        # build url the same way as requests does (bool values, lists etc.)
+        url = requests.Request("GET", url, params=params).prepare().url
+
+        async with self.session.get(yarl.URL(url, encoded=True), headers=headers, **kwargs) as aio_response:
+            content = await aio_response.read()
+            return to_requests_response(aio_response, content)
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+def to_requests_response(aio_response, content):
+    response = requests.Response()
+    response.status_code = aio_response.status
+    response.reason = aio_response.reason
+    response.headers = CaseInsensitiveDict(aio_response.headers)
+    response.url = str(aio_response.url)
+    try:
+        response.encoding = aio_response.get_encoding()
+    except RuntimeError:
+        response.encoding = None  # requests will guess encoding from content
+    response._content = content
+    return response
@@ -1,13 +1,39 @@
+import asyncio
+import contextvars
+import copy
+import functools
+import time
 import warnings
 from abc import ABC, abstractmethod
-from datetime import datetime
-from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from collections import namedtuple, OrderedDict
 
 from json.decoder import JSONDecodeError
 
 import requests
 import pytz
-from bs4 import BeautifulSoup
+
+from .aio import AsyncSessionPool, ASYNC_RETRY_EXCEPTIONS
+from .cache import conditional_headers
+from .fingerprints import UNCHANGED, fingerprint
+from .ratelimit import RateLimiter
+from .records import event_type, LazyEvent
+from .retry import RetryPolicy, RetryBudget
+from .session import SessionPool
+from .text import html_to_text
+
+RETRY_EXCEPTIONS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+# request yielded by parsers flows (see BaseParser._run)
+Fetch = namedtuple("Fetch", ["args", "kwargs"])
+
+# (store method, arguments) of running get_events flow, stored when flow returns (see BaseParser._run)
+_pending_marks = contextvars.ContextVar("pending_marks", default=None)
 
 ALL_EVENT_TAGS = (
     "adress",
@@ -27,10 +53,101 @@ ALL_EVENT_TAGS = (
 )
 
 
+def memo_per_event(extractor):
+    """
+    Compute extractor once per event: other extractors of the same event
+    (e.g. _post_text calling _full_text) reuse its result (see BaseParser._memo).
+    """
+    @functools.wraps(extractor)
+    def memo_extractor(self, event_data):
+        return self._memo(event_data, extractor.__name__, extractor, self, event_data)
+
+    return memo_extractor
+
+
 class BaseParser(ABC):
     MAX_NUMBER_CONNECTION_ATTEMPTS = 3
     TIMEZONE = pytz.timezone("Europe/Moscow")
     TIMEZONE_zero = pytz.timezone("Europe/London")
+    RETRY_BUDGET = RetryBudget(max_retries=20, per_seconds=60)
+    LISTING_RETRY_POLICY = RetryPolicy(
+        max_retries=MAX_NUMBER_CONNECTION_ATTEMPTS + 2, base_delay=1.0, max_delay=60.0, budget=RETRY_BUDGET,
+    )
+    DETAIL_RETRY_POLICY = RetryPolicy(
+        max_retries=MAX_NUMBER_CONNECTION_ATTEMPTS, base_delay=0.5, max_delay=15.0, budget=RETRY_BUDGET,
+    )
+    SESSION_POOL_PARAMS = dict(pool_connections=10, pool_maxsize=10, keep_alive=True)
+    ASYNC_SESSION_POOL_PARAMS = dict(max_connections_per_host=10, keep_alive=True)
+    RATE_LIMITS = dict()  # host: (requests per second, burst)
+    CACHE_TTL = dict(listing=15 * 60, detail=6 * 60 * 60)  # seconds
+
+    # escraper.parsers.cache.ResponseCache, disabled if None
+    response_cache = None
+    # "use" - return fresh cached responses, "refresh" - request and update cache,
+    # "bypass" - don't use cache at all
+    cache_mode = "use"
+    MAX_PARSED_EVENTS = 10000  # events remembered for unchanged cached responses
+    # escraper.parsers.stats.CrawlStats, disabled if None
+    stats = None
+    # return LazyEvent records, which tags are computed on first access
+    lazy_records = False
+    # escraper.parsers.watermarks.WatermarkStore, incremental crawling disabled if None
+    watermarks = None
+    # escraper.parsers.fingerprints.FingerprintStore, unchanged events are skipped, disabled if None
+    fingerprints = None
+    # tags, which extractors use values stored by other extractors
+    TAG_DEPENDENCIES = dict(date_to=("date_from",), date_from_to=("date_from", "date_to"))
+    _event_context = None  # (event data, intermediate values), see _memo
+    # network, cache and stats state, not sent with parser to parse processes
+    _TRANSIENT_ATTRIBUTES = (
+        "_session_pool", "_async_session_pool", "_rate_limiter", "_parsed_events_", "_event_context",
+        "response_cache", "stats", "watermarks", "fingerprints", "LISTING_RETRY_POLICY", "DETAIL_RETRY_POLICY",
+    )
+
+    @property
+    def session_pool(self):
+        """
+        Keep-alive sessions used by all requests of parser
+        (see escraper.parsers.session.SessionPool).
+        """
+        if getattr(self, "_session_pool", None) is None:
+            self._session_pool = SessionPool(**self.SESSION_POOL_PARAMS)
+        return self._session_pool
+
+    @session_pool.setter
+    def session_pool(self, pool):
+        self._session_pool = pool
+
+    @property
+    def async_session_pool(self):
+        """
+        aiohttp sessions used by async requests of parser
+        (see escraper.parsers.aio.AsyncSessionPool).
+        """
+        if getattr(self, "_async_session_pool", None) is None:
+            self._async_session_pool = AsyncSessionPool(**self.ASYNC_SESSION_POOL_PARAMS)
+        return self._async_session_pool
+
+    @async_session_pool.setter
+    def async_session_pool(self, pool):
+        self._async_session_pool = pool
+
+    @property
+    def rate_limiter(self):
+        """
+        Per-host token buckets pacing requests of parser
+        (process-wide escraper.parsers.ratelimit.RateLimiter by default).
+        Source default rates are taken from RATE_LIMITS.
+        """
+        if getattr(self, "_rate_limiter", None) is None:
+            self.rate_limiter = RateLimiter.shared()
+        return self._rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, limiter):
+        for host, (rate, burst) in self.RATE_LIMITS.items():
+            limiter.set_rate(host, rate, burst, override=False)
+        self._rate_limiter = limiter
 
     @abstractmethod
     def get_event(self):
@@ -40,6 +157,119 @@ class BaseParser(ABC):
     def get_events(self) -> list:
         """Get events by request parameters (date from-to, keywords etc.)"""
 
+    async def aget_event(self, *args, **kwargs):
+        """Async get_event (same arguments)."""
+        return await self._arun(self._event_flow(*args, **kwargs))
+
+    async def aget_events(self, *args, max_workers=None, **kwargs):
+        """
+        Async get_events (same arguments, 'max_workers' is ignored:
+        async requests are bounded by async_session_pool).
+
+        Requests of all parsers may run in one event loop:
+        >>> events = await asyncio.gather(
+            Radario().aget_events(request_params=params),
+            MTS().aget_events(request_params=params),
+        )
+        """
+        return await self._arun(self._events_flow(*args, **kwargs), incremental=True)
+
+    @abstractmethod
+    def _event_flow(self):
+        """Generator of get_event requests (see _run)"""
+
+    @abstractmethod
+    def _events_flow(self):
+        """Generator of get_events requests (see _run)"""
+
+    def _fetch(self, *args, **kwargs):
+        """Request for flow, takes _request_get arguments."""
+        return Fetch(args, kwargs)
+
+    def _run(self, flow, max_workers=1, incremental=False):
+        """
+        Run flow with blocking requests.
+
+        Flow is a generator, that yields requests (see _fetch) or lists of
+        requests and receives responses (list of responses for list of
+        requests). Returned value of flow is returned.
+        Flows keep network and parsing separate, so the same flow
+        is run by blocking (_run) and async (_arun) engines.
+
+        Parameters:
+        -----------
+        max_workers : int, default 1
+            Number of threads sending requests of one list concurrently.
+            Responses are received in order of requests.
+
+        incremental : bool, default False
+            Flow of get_events: unchanged events are dropped, watermarks
+            and fingerprints set by flow are stored only when it returns,
+            so crawl failed in the middle is repeated by the next run.
+        """
+        executor = ThreadPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+        marks = list() if incremental else None
+        marks_token = _pending_marks.set(marks)
+
+        try:
+            request = next(flow)
+            while True:
+                if isinstance(request, list):
+                    if executor is not None:
+                        response = list(executor.map(lambda r: self._request_get(*r.args, **r.kwargs), request))
+                    else:
+                        response = [self._request_get(*r.args, **r.kwargs) for r in request]
+                else:
+                    response = self._request_get(*request.args, **request.kwargs)
+                request = flow.send(response)
+        except StopIteration as stop:
+            self._store_marks(marks)
+            return self._without_unchanged(stop.value)
+        finally:
+            _pending_marks.reset(marks_token)
+            if executor is not None:
+                executor.shutdown()
+
+    async def _arun(self, flow, incremental=False):
+        """
+        Run flow with async requests (see _run).
+
+        async_session_pool is closed, when the last running flow
+        of parser returns (or fails).
+        """
+        self._async_runs = getattr(self, "_async_runs", 0) + 1
+        marks = list() if incremental else None
+        marks_token = _pending_marks.set(marks)
+        try:
+            request = next(flow)
+            while True:
+                if isinstance(request, list):
+                    response = list(
+                        await asyncio.gather(*(self._arequest_get(*r.args, **r.kwargs) for r in request))
+                    )
+                else:
+                    response = await self._arequest_get(*request.args, **request.kwargs)
+                request = flow.send(response)
+        except StopIteration as stop:
+            self._store_marks(marks)
+            return self._without_unchanged(stop.value)
+        finally:
+            _pending_marks.reset(marks_token)
+            self._async_runs -= 1
+            if self._async_runs == 0 and getattr(self, "_async_session_pool", None) is not None:
+                await self._async_session_pool.close()
+
+    @staticmethod
+    def _store_marks(marks):
+        for store, args in marks or ():
+            store(*args)
+
+    def _without_unchanged(self, result):
+        # unchanged events (see fingerprints) are not returned
+        if isinstance(result, list):
+            return [event for event in result if event is not UNCHANGED]
+        return None if result is UNCHANGED else result
+
     @abstractmethod
     def _adress(self) -> str:
         """Event adress"""
@@ -92,78 +322,422 @@ class BaseParser(ABC):
     def _is_registration_open(self) -> bool:
         """Event registration status"""
 
-    def parse(self, event_data, tags=None):
+    def parse(self, event_data, tags=None, lazy=None):
+        """
+        Event record with 'tags' extracted from 'event_data'.
+
+        If 'lazy' (lazy_records by default), LazyEvent is returned:
+        tags are extracted on first access (see escraper.parsers.records).
+
+        In get_events flows of parser with fingerprints, UNCHANGED is
+        returned without extracting tags, if event data and tags didn't
+        change since previous run. New fingerprint is stored, when
+        flow returns (see _run), so failed runs don't lose events.
+        """
         if tags is None:
             raise ValueError("'tags' for event required (see escraper.ALL_EVENT_TAGS).")
 
+        # intermediate values of previous parse are not reused, even for the same event data
+        self._event_context = None
+
+        fingerprint_mark = self._fingerprint_mark(event_data, tags)
+        if fingerprint_mark is UNCHANGED:
+            return UNCHANGED
+
+        if lazy or (lazy is None and self.lazy_records):
+            for tag in tags:
+                if not hasattr(self, "_" + tag):
+                    raise TypeError(
+                        f"Unsupported event tag found: {tag}.\n"
+                        f"All available event tags: {ALL_EVENT_TAGS}."
+                    )
+            # per event state of parser (event_url etc.) is kept in snapshot
+            event = LazyEvent(copy.copy(self), event_data, tags)
+            self._mark(fingerprint_mark)
+            return event
+
+        stats = self.stats
+        tag_time = list() if stats is not None else None
+
         data = dict()
         for tag in tags:
             try:
-                data[tag] = getattr(self, "_" + tag)(event_data)
+                if tag_time is None:
+                    data[tag] = getattr(self, "_" + tag)(event_data)
+                else:
+                    started = time.perf_counter()
+                    data[tag] = getattr(self, "_" + tag)(event_data)
+                    tag_time.append((tag, time.perf_counter() - started))
             except AttributeError:
                 raise TypeError(
                     f"Unsupported event tag found: {tag}.\n"
                     f"All available event tags: {ALL_EVENT_TAGS}."
                 )
 
-        DataStorage = namedtuple("event", tags)
+        if tag_time is not None:
+            stats.record_event(self.name, tag_time)
+
+        event = event_type(tags)(**data)
+        self._mark(fingerprint_mark)
+        return event
+
+    def _fingerprint_mark(self, event_data, tags):
+        """
+        Fingerprint update of event parsed in get_events flow (see _run)
+        or None. Update of unchanged event is queued at once and UNCHANGED
+        is returned, other updates are queued when record is built.
+        """
+        marks = _pending_marks.get()
+        if self.fingerprints is None or marks is None:
+            return None
+
+        event_id = self._id(event_data)
+        event_fingerprint = fingerprint(dict(data=self._fingerprint_data(event_data), tags=sorted(tags)))
+        mark = (self.fingerprints.update, (self.name, event_id, event_fingerprint))
+        if self.fingerprints.get(self.name, event_id) == event_fingerprint:
+            marks.append(mark)  # counted as unchanged in fingerprints stats
+            return UNCHANGED
+        return mark
+
+    @staticmethod
+    def _mark(mark):
+        """Queue store update until get_events flow returns (see _run)."""
+        if mark is not None:
+            _pending_marks.get().append(mark)
+
+    def _watermark(self, key, full_refresh=False):
+        """
+        Stored cursor of listing 'key' (see watermarks) or None:
+        incremental crawling is disabled or full refresh is requested.
+        """
+        if self.watermarks is None or full_refresh:
+            return None
+        return self.watermarks.get(self.name, key)
+
+    def _set_watermark(self, key, value):
+        """Store cursor, in get_events flow - when flow returns (see _run)."""
+        if self.watermarks is None:
+            return
+        if _pending_marks.get() is None:
+            self.watermarks.set(self.name, key, value)
+        else:
+            self._mark((self.watermarks.set, (self.name, key, value)))
+
+    def _listing_days(self, date_from, date_to, watermark_key, full_refresh=False):
+        """
+        Days of listing window from 'date_from' to 'date_to' (datetimes).
+
+        With watermarks, days up to the last fully crawled one are skipped,
+        and day is set as crawled, when loop moves to the next day
+        (stored when get_events flow returns, see _set_watermark).
+        """
+        crawled = self._watermark(watermark_key, full_refresh)
+        day = date_from
+        if crawled is not None:
+            day = max(day, date_from + timedelta(days=(date.fromisoformat(crawled) - date_from.date()).days + 1))
+
+        while day <= date_to:
+            yield day
+            self._set_watermark(watermark_key, day.date().isoformat())
+            day += timedelta(days=1)
+
+    def _fingerprint_data(self, event_data):
+        """Raw event data, which fingerprint is compared (see fingerprints)."""
+        return event_data
 
-        return DataStorage(**data)
+    def _event_data(self, body, event_url=None):
+        """
+        Event data for extractors from fetched body: api json is event data
+        itself, parsers of event pages decode page here.
+        """
+        return body
+
+    def _parse_snapshot(self):
+        """
+        Copy of parser without network, cache and stats state, which is sent
+        to parse processes (see escraper.parsers.pipeline.ParseStage).
+        """
+        snapshot = copy.copy(self)
+        for name in self._TRANSIENT_ATTRIBUTES:
+            snapshot.__dict__.pop(name, None)
+        return snapshot
 
     def remove_html_tags(self, data):
-        return BeautifulSoup(data, "lxml").text
+        # the same as BeautifulSoup(data, "lxml").text, but without soup
+        return html_to_text(data)
 
-    def _request_get(self, *args, **kwargs):
+    def _memo(self, event_data, key, compute, *args):
+        """
+        Return 'compute(*args)' computed once per event: intermediate
+        results (stripped description, found soup nodes) are kept until
+        parser moves to other event data.
+        """
+        context = self._event_context
+        if context is None or context[0] is not event_data:
+            context = self._event_context = (event_data, dict())
+
+        values = context[1]
+        if key not in values:
+            values[key] = compute(*args)
+        return values[key]
+
+    def _request_get(self, *args, listing=False, **kwargs):
         """
         Send get request with specific arguments.
 
-        To avoid internet connection issues,
-        will catch ConnectionError and retry.
+        To avoid internet connection issues and throttling,
+        will catch ConnectionError and bad responses (429, 5xx)
+        and retry with backoff (see escraper.parsers.retry.RetryPolicy).
+
+        If parser has response_cache, fresh cached responses are returned
+        without request (see cache_mode).
+
+        Parameters:
+        -----------
+        listing : bool, default False
+            Request is idempotent listing call (events list page or API),
+            LISTING_RETRY_POLICY is used instead of DETAIL_RETRY_POLICY.
         """
+        if self.stats is None:
+            return self._request_get_cached(*args, listing=listing, **kwargs)
+
+        record = self.stats.start_request(self.name, args[0] if args else kwargs.get("url"))
+        response = error = None
+        try:
+            response = self._request_get_cached(*args, listing=listing, record=record, **kwargs)
+            return response
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self.stats.finish_request(record, response, error)
+
+    def _request_get_cached(self, *args, listing=False, record=None, **kwargs):
+        cache_key, response, stale_response = self._cached_response(args, kwargs, listing)
+        if response is not None:
+            if record is not None:
+                record.from_cache = True
+            return response
+
+        if stale_response is not None:
+            kwargs["headers"] = dict(kwargs.get("headers") or {}, **conditional_headers(stale_response))
+
+        response = self._request_get_with_retries(*args, listing=listing, record=record, **kwargs)
+        return self._cache_response(cache_key, response, stale_response)
+
+    def _request_get_with_retries(self, *args, listing=False, record=None, **kwargs):
+        retry_policy = self.LISTING_RETRY_POLICY if listing else self.DETAIL_RETRY_POLICY
+        url = args[0] if args else kwargs.get("url")
         attempts_count = 0
 
         while True:
             try:
-                response = requests.get(*args, **kwargs)
+                self.rate_limiter.acquire(url)
+                response = self.session_pool.get(*args, **kwargs)
 
                 if not response.ok:
-                    if response.content:
-                        try:
-                            response_status = response.json()["response_status"]
-                        except JSONDecodeError:
-                            response_status = {"error_code": response.status_code, "message": "Invalid JSON response"}
-                        except Exception as e:
-                            response_status = {"error_code": response.status_code, "message": str(e)}
-                    else:
-                        response_status = dict(
-                            error_code=response.status_code,
-                            message="response content is empty",
-                        )
-
-                    warning_msg = "Bad response: {status_code}: {message}.".format(
-                        status_code=response_status["error_code"],
-                        message=response_status["message"],
-                    )
+                    warning_msg = self._bad_response_message(response)
+
+                    if not (
+                        retry_policy.is_retryable(response)
+                        and retry_policy.can_retry(attempts_count, url)
+                    ):
+                        response = None
+                        warnings.warn(warning_msg + "\nBreak (event counts 0)", UserWarning)
+                        break
+
+                    warnings.warn(warning_msg + "\nRetry", UserWarning)
+                    retry_policy.wait(attempts_count, response)
+                    attempts_count += 1
+                    if record is not None:
+                        record.retries = attempts_count
+
+                else:
+                    break
+
+            except RETRY_EXCEPTIONS as e:
+                if not retry_policy.can_retry(attempts_count, url):
+                    raise e
+                warnings.warn(f"Connection error: {e}.\nRetry connection", UserWarning)
+                retry_policy.wait(attempts_count)
+                attempts_count += 1
+                if record is not None:
+                    record.retries = attempts_count
 
-                    if attempts_count == self.MAX_NUMBER_CONNECTION_ATTEMPTS:
+        return response
+
+    async def _arequest_get(self, *args, listing=False, **kwargs):
+        """Async _request_get (see it for arguments)."""
+        if self.stats is None:
+            return await self._arequest_get_cached(*args, listing=listing, **kwargs)
+
+        record = self.stats.start_request(self.name, args[0] if args else kwargs.get("url"))
+        response = error = None
+        try:
+            response = await self._arequest_get_cached(*args, listing=listing, record=record, **kwargs)
+            return response
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self.stats.finish_request(record, response, error)
+
+    async def _arequest_get_cached(self, *args, listing=False, record=None, **kwargs):
+        cache_key, response, stale_response = self._cached_response(args, kwargs, listing)
+        if response is not None:
+            if record is not None:
+                record.from_cache = True
+            return response
+
+        if stale_response is not None:
+            kwargs["headers"] = dict(kwargs.get("headers") or {}, **conditional_headers(stale_response))
+
+        response = await self._arequest_get_with_retries(*args, listing=listing, record=record, **kwargs)
+        return self._cache_response(cache_key, response, stale_response)
+
+    async def _arequest_get_with_retries(self, *args, listing=False, record=None, **kwargs):
+        retry_policy = self.LISTING_RETRY_POLICY if listing else self.DETAIL_RETRY_POLICY
+        url = args[0] if args else kwargs.get("url")
+        attempts_count = 0
+
+        while True:
+            try:
+                await self.rate_limiter.acquire_async(url)
+                response = await self.async_session_pool.get(*args, **kwargs)
+
+                if not response.ok:
+                    warning_msg = self._bad_response_message(response)
+
+                    if not (
+                        retry_policy.is_retryable(response)
+                        and retry_policy.can_retry(attempts_count, url)
+                    ):
                         response = None
                         warnings.warn(warning_msg + "\nBreak (event counts 0)", UserWarning)
                         break
 
                     warnings.warn(warning_msg + "\nRetry", UserWarning)
+                    await asyncio.sleep(retry_policy.delay(attempts_count, response))
                     attempts_count += 1
+                    if record is not None:
+                        record.retries = attempts_count
 
                 else:
                     break
 
-            except requests.ConnectionError as e:
-                if attempts_count == self.MAX_NUMBER_CONNECTION_ATTEMPTS:
+            except ASYNC_RETRY_EXCEPTIONS as e:
+                if not retry_policy.can_retry(attempts_count, url):
                     raise e
+                warnings.warn(f"Connection error: {e!r}.\nRetry connection", UserWarning)
+                await asyncio.sleep(retry_policy.delay(attempts_count))
                 attempts_count += 1
-                print("Retry connection")
+                if record is not None:
+                    record.retries = attempts_count
+
+        return response
+
+    def _cached_response(self, args, kwargs, listing):
+        """
+        Return cache key, fresh cached response (or None)
+        and stale cached response with validators for revalidation (or None).
+        """
+        cache = self.response_cache
+        if cache is None or self.cache_mode == "bypass":
+            return None, None, None
+
+        url = args[0] if args else kwargs.get("url")
+        cache_key = cache.key(url, params=kwargs.get("params"), headers=kwargs.get("headers"))
+        stats = cache.stats[self.name]
+        stats.lookups += 1
+
+        if self.cache_mode == "refresh":
+            return cache_key, None, None
+
+        ttl = self.CACHE_TTL["listing" if listing else "detail"]
+        response, fresh = cache.lookup(cache_key, ttl=ttl)
+        if response is None:
+            return cache_key, None, None
+
+        response.cache_key = cache_key
+        if fresh:
+            stats.hits += 1
+            return cache_key, response, None
+
+        if conditional_headers(response):
+            stats.revalidations += 1
+            return cache_key, None, response
+
+        return cache_key, None, None
+
+    def _cache_response(self, cache_key, response, stale_response=None):
+        """Store response in cache. Return stored body for 304 Not Modified."""
+        if cache_key is None or response is None:
+            return response
+
+        if response.status_code == 304 and stale_response is not None:
+            self.response_cache.touch(cache_key, response.headers)
+            self.response_cache.stats[self.name].not_modified += 1
+            stale_response.not_modified = True
+            return stale_response
+
+        if response.status_code == 200:
+            self.response_cache.set(cache_key, response)
+            response.cache_key = cache_key
 
         return response
 
+    def _parse_response(self, response, parse, tags=None):
+        """
+        Parse response by function 'parse' (without arguments).
+
+        Event parsed from cached response is remembered, and returned again
+        for the same response from cache or not modified (304) response,
+        so unchanged pages are not parsed twice. In get_events flows with
+        fingerprints event is parsed anyway to compare its fingerprint.
+        """
+        cache_key = getattr(response, "cache_key", None)
+        if cache_key is None:
+            return parse()
+
+        key = (cache_key, tuple(tags or ()))
+        check_fingerprint = self.fingerprints is not None and _pending_marks.get() is not None
+        if getattr(response, "from_cache", False) and key in self._parsed_events and not check_fingerprint:
+            self._parsed_events.move_to_end(key)
+            return self._parsed_events[key]
+
+        event = parse()
+        if event is UNCHANGED:
+            return event
+        self._parsed_events[key] = event
+        if len(self._parsed_events) > self.MAX_PARSED_EVENTS:
+            self._parsed_events.popitem(last=False)
+        return event
+
+    @property
+    def _parsed_events(self):
+        if getattr(self, "_parsed_events_", None) is None:
+            self._parsed_events_ = OrderedDict()
+        return self._parsed_events_
+
+    def _bad_response_message(self, response):
+        if response.content:
+            try:
+                response_status = response.json()["response_status"]
+            except JSONDecodeError:
+                response_status = {"error_code": response.status_code, "message": "Invalid JSON response"}
+            except Exception as e:
+                response_status = {"error_code": response.status_code, "message": str(e)}
+        else:
+            response_status = dict(
+                error_code=response.status_code,
+                message="response content is empty",
+            )
+
+        return "Bad response: {status_code}: {message}.".format(
+            status_code=response_status["error_code"],
+            message=response_status["message"],
+        )
+
     def prepare_post_text(self, post_text):
         if len(post_text) > 550:
             sentences = post_text.split(".")
@@ -0,0 +1,273 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import defaultdict
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+CACHE_MODES = ("use", "refresh", "bypass")
+
+
+class CacheStats:
+    """Cache counters of one source."""
+
+    def __init__(self):
+        self.lookups = 0
+        self.hits = 0
+        self.revalidations = 0
+        self.not_modified = 0
+
+    def __repr__(self):
+        return (
+            f"<CacheStats lookups={self.lookups} hits={self.hits} "
+            f"revalidations={self.revalidations} not_modified={self.not_modified}>"
+        )
+
+    @property
+    def hit_rate(self):
+        """Share of lookups served from cache without downloading body."""
+        if not self.lookups:
+            return 0.0
+        return (self.hits + self.not_modified) / self.lookups
+
+    @property
+    def not_modified_rate(self):
+        """Share of conditional requests answered with 304 Not Modified."""
+        if not self.revalidations:
+            return 0.0
+        return self.not_modified / self.revalidations
+
+    def as_dict(self):
+        return dict(
+            lookups=self.lookups,
+            hits=self.hits,
+            revalidations=self.revalidations,
+            not_modified=self.not_modified,
+            hit_rate=self.hit_rate,
+            not_modified_rate=self.not_modified_rate,
+        )
+
+
+VALIDATORS = ("ETag", "Last-Modified")
+
+
+def conditional_headers(response):
+    """Headers of conditional request for cached response (may be empty)."""
+    headers = dict()
+    if response.headers.get("ETag"):
+        headers["If-None-Match"] = response.headers["ETag"]
+    if response.headers.get("Last-Modified"):
+        headers["If-Modified-Since"] = response.headers["Last-Modified"]
+    return headers
+
+
+class ResponseCache:
+    """
+    On-disk cache of successful GET responses (sqlite file).
+
+    Responses are keyed by method, url, params and relevant headers,
+    stored compressed and evicted in LRU order when cache is bigger than
+    ``max_size`` bytes. Freshness (TTL) is checked on read, so every parser
+    uses its own CACHE_TTL with the same cache.
+
+    Stale responses with validators ("ETag", "Last-Modified") are
+    revalidated with conditional request, and 304 response reuses stored
+    body. Counters per source are in ``stats``.
+
+    Parameters:
+    -----------
+    path : str or Path
+        Cache file path (":memory:" for in-memory cache).
+
+    max_size : int, default 512 MB
+        Max size of stored (compressed) bodies in bytes.
+
+    compress_level : int, default 6
+        zlib compression level.
+
+    relevant_headers : tuple of str
+        Request headers that change response (part of cache key).
+
+    Examples:
+    ---------
+    >>> cache = ResponseCache("~/.cache/escraper.sqlite")
+    >>> mts = MTS()
+    >>> mts.response_cache = cache
+    >>> mts.get_events(request_params=params)  # second run within TTL is served from cache
+
+    Ignore cache or refresh it:
+    >>> mts.cache_mode = "bypass"  # or "refresh"
+    """
+
+    RELEVANT_HEADERS = ("Accept", "Accept-Language", "Authorization")
+
+    def __init__(
+        self,
+        path,
+        max_size=512 * 1024 ** 2,
+        compress_level=6,
+        relevant_headers=RELEVANT_HEADERS,
+        clock=time.time,
+    ):
+        self.path = str(path)
+        self.max_size = max_size
+        self.compress_level = compress_level
+        self.relevant_headers = tuple(relevant_headers)
+        self.clock = clock
+
+        self.stats = defaultdict(CacheStats)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, url TEXT, status_code INTEGER, headers TEXT, "
+            "encoding TEXT, body BLOB, size INTEGER, stored_at REAL, accessed_at REAL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+        self._connection.commit()
+
+    def __repr__(self):
+        return f"<ResponseCache {self.path!r} max_size={self.max_size}>"
+
+    def key(self, url, params=None, headers=None, method="GET"):
+        # prepared url contains params in the same order as request
+        prepared_url = requests.Request(method, url, params=params).prepare().url
+        headers = CaseInsensitiveDict(headers or {})
+        relevant = [(name.lower(), headers.get(name)) for name in self.relevant_headers if name in headers]
+
+        raw_key = json.dumps([method, prepared_url, relevant], ensure_ascii=False)
+        return hashlib.sha256(raw_key.encode()).hexdigest()
+
+    def get(self, key, ttl):
+        """Cached response not older than 'ttl' seconds or None."""
+        response, fresh = self.lookup(key, ttl)
+        if fresh:
+            return response
+        return None
+
+    def lookup(self, key, ttl):
+        """
+        Return cached response (or None) and its freshness.
+        Stale response may be revalidated (see conditional_headers).
+        """
+        now = self.clock()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT url, status_code, headers, encoding, body, stored_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None, False
+
+            self._connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self._connection.commit()
+
+        return self._to_response(row), now - row[5] <= ttl
+
+    def touch(self, key, headers=None):
+        """
+        Mark response as fresh again (after 304 Not Modified),
+        updating validators from 'headers'.
+        """
+        now = self.clock()
+        with self._lock:
+            row = self._connection.execute("SELECT headers FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return
+
+            stored_headers = CaseInsensitiveDict(json.loads(row[0]))
+            for name in VALIDATORS:
+                if headers and name in headers:
+                    stored_headers[name] = headers[name]
+
+            self._connection.execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ?, headers = ? WHERE key = ?",
+                (now, now, json.dumps(dict(stored_headers)), key),
+            )
+            self._connection.commit()
+
+    def set(self, key, response):
+        body = zlib.compress(response.content or b"", self.compress_level)
+        now = self.clock()
+
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.url,
+                    response.status_code,
+                    json.dumps(dict(response.headers)),
+                    response.encoding,
+                    body,
+                    len(body),
+                    now,
+                    now,
+                ),
+            )
+            self._evict()
+            self._connection.commit()
+
+    def delete(self, key):
+        with self._lock:
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._connection.commit()
+
+    def clear(self):
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+            self._connection.commit()
+
+    def summary(self):
+        """Cache counters per source."""
+        return {source: stats.as_dict() for source, stats in self.stats.items()}
+
+    @property
+    def size(self):
+        """Size of stored bodies in bytes."""
+        with self._lock:
+            return self._size()
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def _size(self):
+        return self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def _evict(self):
+        """Remove least recently used responses until cache fits in max_size."""
+        excess = self._size() - self.max_size
+        if excess <= 0:
+            return
+
+        keys = list()
+        for key, size in self._connection.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+            if excess <= 0:
+                break
+            keys.append((key,))
+            excess -= size
+
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", keys)
+
+    def _to_response(self, row):
+        url, status_code, headers, encoding, body, _ = row
+
+        response = requests.Response()
+        response.url = url
+        response.status_code = status_code
+        response.headers = CaseInsensitiveDict(json.loads(headers))
+        response.encoding = encoding
+        response._content = zlib.decompress(body)
+        response.from_cache = True
+        return response
@@ -1,8 +1,12 @@
+import bisect
 from datetime import datetime, timedelta
 
-import json, re
+import re
 
-from .base import BaseParser, ALL_EVENT_TAGS
+from .base import BaseParser, ALL_EVENT_TAGS, memo_per_event
+from .dates import parse_datetime
+from .nextdata import next_data, script_json, LD_JSON_SCRIPT
+from .seen import seen_index
 from ..emoji import add_emoji
 
 
@@ -13,29 +17,39 @@ class Culture(BaseParser):
 
     parser_prefix = "CLTR-"
     DATETIME_STRF = "%Y-%m-%dT%H:%M:%S.%fZ"
+    RATE_LIMITS = {"www.culture.ru": (4, 4)}
+    CACHE_TTL = dict(listing=30 * 60, detail=12 * 60 * 60)
 
     def __init__(self):
         self.url = self.BASE_URL
         self.timedelta_hours = self.timedelta_with_gmt0()
 
     def get_event(self, event_url=None, tags=None):
+        return self._run(self._event_flow(event_url=event_url, tags=tags))
+
+    def _event_flow(self, event_url=None, tags=None):
         if event_url is None:
-             raise ValueError("'event_url' required.")
-        body = self._request_get(event_url).text
+            raise ValueError("'event_url' required.")
+        response = yield self._fetch(event_url)
+        return self._parse_response(
+            response, lambda: self._event_from_body(response.text, event_url, tags), tags=tags,
+        )
 
-        json_body_min = body.split('<script type="application/ld+json">')[-1].split('</script>')[0]
+    def _event_from_body(self, body, event_url, tags=None):
+        event_json = self._event_data(body, event_url)
+        event = self.parse(event_json, tags=tags or ALL_EVENT_TAGS)
+        return event
 
+    def _event_data(self, body, event_url):
+        """Event json from event page."""
         self._poster_imag_ = None
-        self._poster_imag(json.loads(json_body_min))
+        self._poster_imag(script_json(body, LD_JSON_SCRIPT))
 
-        json_body = body.split('<script id="__NEXT_DATA__" type="application/json">')[-1].split('</script>')[0]
-
-        event_json = json.loads(json_body)["props"]["pageProps"]["event"]
+        event_json = next_data(body, "props.pageProps.event")
         self.event_url = event_url
-        event = self.parse(event_json, tags=tags or ALL_EVENT_TAGS)
-        return event
+        return event_json
 
-    def get_events(self, request_params={}, tags=None, existed_event_ids=[]):
+    def get_events(self, request_params={}, tags=None, existed_event_ids=None, full_refresh=False):
         """
         Parameters:
         -----------
@@ -61,8 +75,14 @@ class Culture(BaseParser):
             Event tags (title, id, url etc.,
             see all tags in 'escraper.ALL_EVENT_TAGS')
 
-        existed_event_ids : list of eventId that we need to skip
-            CLTR-18634405, CLTR-18633215, etc
+        existed_event_ids : list or SeenIndex, default None
+            eventId that we need to skip: CLTR-18634405, CLTR-18633215, etc.
+            Ids of new events are added to it
+            (see escraper.parsers.seen for persistent index).
+
+        full_refresh : bool, default False
+            Crawl all days of window, even if parser has watermarks
+            (see escraper.parsers.watermarks), and store new ones.
 
         Examples:
         ----------
@@ -74,11 +94,18 @@ class Culture(BaseParser):
         }
         >>> cltr.get_events(request_params=request_params)  # doctest: +SKIP
         """
+        return self._run(
+            self._events_flow(
+                request_params=request_params, tags=tags, existed_event_ids=existed_event_ids, full_refresh=full_refresh,
+            ),
+            incremental=True,
+        )
 
-        if "city" in request_params:
-            url = self.url + '/' + request_params['city']
-        else:
-            url = self.url + '/' + "sankt-peterburg"
+    def _events_flow(self, request_params={}, tags=None, existed_event_ids=None, full_refresh=False):
+        existed_event_ids = seen_index(existed_event_ids)
+
+        city = request_params.get('city', "sankt-peterburg")
+        url = self.url + '/' + city
 
         if "date_from" in request_params:
             date_from = datetime.strptime(request_params["date_from"], '%Y-%m-%d')
@@ -101,18 +128,15 @@ class Culture(BaseParser):
 
         for category in categories:
             category_url = url + '/' + category
-            scrape_date = date_from
-            while scrape_date <= date_to:
+            for scrape_date in self._listing_days(date_from, date_to, f"{city}/{category}", full_refresh):
                 scrape_url = category_url + f"/seanceStartDate-{scrape_date.date()}/seanceEndDate-{scrape_date.date()}"
-                response = self._request_get(scrape_url)
-                json_body = response.text.split('<script id="__NEXT_DATA__" type="application/json">')[-1].split('</script>')[0]
-                event_list_json = json.loads(json_body)["props"]["pageProps"]["events"]["items"]
+                response = yield self._fetch(scrape_url, listing=True)
+                event_list_json = next_data(response.text, "props.pageProps.events.items")
                 for event_json in event_list_json:
                     event_url = self.EVENT_URL + f"/{event_json['_id']}/{event_json['name']}"
                     if event_json['_id'] in existed_event_ids: continue
-                    events.append(self.get_event(event_url=event_url, tags=tags))
-                    existed_event_ids.append(event_json['_id'])
-                scrape_date += timedelta(days=1)
+                    events.append((yield from self._event_flow(event_url=event_url, tags=tags)))
+                    existed_event_ids.add(event_json['_id'])
 
         return events
 
@@ -131,28 +155,83 @@ class Culture(BaseParser):
         return '' #event_json["organizations"][0]["eipskSourceJson"]["category"]["name"]
 
     def _date_from(self, event_json):
+        """
+        Start of the first future seance, date_to is the end of the last
+        seance ending within 7 days from it.
+        """
+        starts, seances = self._seance_times(event_json)
         today = datetime.today()
-        date_from, date_to = None, None
-        for date in event_json['seances']:
-            if date_from is None:
-                if datetime.strptime(date['startDate'], self.DATETIME_STRF) > today:
-                    date_from = datetime.strptime(date['startDate'], self.DATETIME_STRF)
-                    date_to = datetime.strptime(date['endDate'], self.DATETIME_STRF)
+
+        first = bisect.bisect_right(starts, today)
+        if first == len(seances):
+            self._date_from_ = self._date_to_ = None
+            return None
+
+        date_from, date_to = seances[first]
+        # only seances starting within the window can end within it
+        window_end = date_from + timedelta(days=7)
+        for _, end in seances[first + 1:bisect.bisect_left(starts, window_end, first + 1)]:
+            if end - date_from < timedelta(days=7):
+                date_to = end
             else:
-                if datetime.strptime(date['endDate'], self.DATETIME_STRF)-date_from < timedelta(days=7):
-                    date_to = datetime.strptime(date['endDate'], self.DATETIME_STRF)
-                else:
-                    break
+                break
+
         self._date_from_ = date_from.astimezone(self.TIMEZONE)
         self._date_to_ = date_to.astimezone(self.TIMEZONE)
         return self._date_from_
 
+    @memo_per_event
+    def _seance_times(self, event_json):
+        """Start times and (start, end) of seances (naive datetimes), sorted by start."""
+        seances = [
+            (parse_datetime(seance['startDate'], self.DATETIME_STRF), parse_datetime(seance['endDate'], self.DATETIME_STRF))
+            for seance in event_json['seances']
+        ]
+        # stable: seances with the same start keep page order
+        seances.sort(key=lambda seance: seance[0])
+        return [start for start, _ in seances], seances
+
+    def seances(self, event_json):
+        """
+        All seances of event as list of (start, end) datetimes in TIMEZONE,
+        sorted by start.
+
+        Parameters:
+        -----------
+        event_json : dict
+            Event json from event page (see get_seances to get it by url).
+        """
+        return [
+            (start.astimezone(self.TIMEZONE), end.astimezone(self.TIMEZONE))
+            for start, end in self._seance_times(event_json)[1]
+        ]
+
+    def get_seances(self, event_url=None):
+        """
+        Seances of event (see seances) for recurring events schedule.
+
+        Examples:
+        ---------
+        >>> culture = Culture()
+        >>> culture.get_seances("https://www.culture.ru/events/1/vystavka")  # doctest: +SKIP
+        [(datetime.datetime(2021, 4, 1, 10, 0, tzinfo=<DstTzInfo 'Europe/Moscow' MSK+3:00:00 STD>), ...), ...]
+        """
+        return self._run(self._seances_flow(event_url=event_url))
+
+    def _seances_flow(self, event_url=None):
+        if event_url is None:
+            raise ValueError("'event_url' required.")
+        response = yield self._fetch(event_url)
+        return self.seances(self._event_data(response.text, event_url))
+
     def _date_to(self, event_json):
         if self._date_to_ is None:
             self._date_from(event_json)
         return self._date_to_
 
     def _date_from_to(self, event_json):
+        if self._date_from_ is None:
+            return None
         return f"{self._date_from_.date()} – {self._date_to_.date()}"
 
     def _id(self, event_json):
@@ -164,6 +243,7 @@ class Culture(BaseParser):
         else:
             return ''
 
+    @memo_per_event
     def _full_text(self, event_json) -> str:
         post_text_html = event_json["text"]
         if post_text_html:
@@ -0,0 +1,101 @@
+import re
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+
+# parsed strings kept by parse_datetime (events repeat the same timestamps)
+DATE_CACHE_SIZE = 4096
+
+_DATE = r"(?P<year>[0-9]{4})-(?P<month>[0-9]{2})-(?P<day>[0-9]{2})"
+_TIME = r"T(?P<hour>[0-9]{2}):(?P<minute>[0-9]{2}):(?P<second>[0-9]{2})"
+_BASIC_DATETIME = (
+    r"(?P<year>[0-9]{4})(?P<month>[0-9]{2})(?P<day>[0-9]{2})"
+    r"T(?P<hour>[0-9]{2})(?P<minute>[0-9]{2})(?P<second>[0-9]{2})"
+)
+_FRACTION = r"\.(?P<fraction>[0-9]{1,6})"
+_OFFSET = r"(?P<offset>Z|[+-][0-9]{2}:?[0-9]{2})"
+
+# formats of parsers, which are parsed without strptime
+_FAST_FORMATS = {
+    "%Y-%m-%d": re.compile(_DATE + r"\Z"),
+    "%Y-%m-%dT%H:%M:%S%z": re.compile(_DATE + _TIME + _OFFSET + r"\Z"),
+    "%Y-%m-%dT%H:%M:%S.%f%z": re.compile(_DATE + _TIME + _FRACTION + _OFFSET + r"\Z"),
+    # literal "Z" (not %z): result is naive, as strptime returns
+    "%Y-%m-%dT%H:%M:%S.%fZ": re.compile(_DATE + _TIME + _FRACTION + r"Z\Z"),
+    "%Y%m%dT%H%M%SZ": re.compile(_BASIC_DATETIME + r"Z\Z"),
+}
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_datetime(value, fmt, tz=None):
+    """
+    datetime.strptime(value, fmt), converted to 'tz' if given.
+
+    Results are cached (datetimes are immutable), common iso formats
+    of parsers are parsed without strptime. Result is the same as
+    strptime gives: aware for %z formats, naive otherwise, and naive
+    datetime is converted to 'tz' as local time (see datetime.astimezone).
+
+    Parameters:
+    -----------
+    value : str
+        Date string.
+
+    fmt : str
+        strptime format.
+
+    tz : tzinfo, optional
+        Timezone to convert datetime to.
+
+    Examples:
+    ---------
+    >>> parse_datetime("2020-09-10T19:00:00+03:00", "%Y-%m-%dT%H:%M:%S%z")
+    datetime.datetime(2020, 9, 10, 19, 0, tzinfo=datetime.timezone(datetime.timedelta(seconds=10800)))
+    """
+    dt = _fast_strptime(value, fmt)
+    if dt is None:
+        dt = datetime.strptime(value, fmt)
+
+    if tz is not None:
+        dt = dt.astimezone(tz)
+    return dt
+
+
+def _fast_strptime(value, fmt):
+    # None if format or value is not the simple case, strptime handles (or rejects) it
+    pattern = _FAST_FORMATS.get(fmt)
+    if pattern is None:
+        return None
+
+    match = pattern.match(value)
+    if match is None:
+        return None
+
+    fields = match.groupdict()
+    fraction = fields.get("fraction")
+    try:
+        return datetime(
+            int(fields["year"]),
+            int(fields["month"]),
+            int(fields["day"]),
+            int(fields.get("hour") or 0),
+            int(fields.get("minute") or 0),
+            int(fields.get("second") or 0),
+            int(fraction.ljust(6, "0")) if fraction else 0,
+            _offset_timezone(fields.get("offset")),
+        )
+    except ValueError:
+        return None
+
+
+def _offset_timezone(offset):
+    if offset is None:
+        return None
+    if offset == "Z":
+        return timezone.utc
+
+    hours, minutes = int(offset[1:3]), int(offset[-2:])
+    if minutes > 59:
+        raise ValueError(offset)
+    delta = timedelta(hours=hours, minutes=minutes)
+    return timezone(-delta if offset[0] == "-" else delta)
@@ -0,0 +1,150 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+
+
+class _Unchanged:
+    def __repr__(self):
+        return "UNCHANGED"
+
+    def __reduce__(self):
+        return "UNCHANGED"
+
+
+# parse result for event with the same fingerprint as in previous runs,
+# it is dropped from get_events results (see BaseParser.fingerprints)
+UNCHANGED = _Unchanged()
+
+
+def fingerprint(data):
+    """
+    Stable fingerprint (hex digest) of raw event data: json values
+    (dicts, lists, strings, numbers), other values are taken as str.
+    Dict keys order doesn't change fingerprint.
+
+    Examples:
+    ---------
+    >>> fingerprint({"id": 1, "title": "Concert"}) == fingerprint({"title": "Concert", "id": 1})
+    True
+    """
+    raw = json.dumps(data, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+class FingerprintStats:
+    """Counters of fingerprint checks of one source."""
+
+    def __init__(self):
+        self.new = 0
+        self.changed = 0
+        self.unchanged = 0
+
+    def __repr__(self):
+        return f"<FingerprintStats new={self.new} changed={self.changed} unchanged={self.unchanged}>"
+
+    def as_dict(self):
+        return dict(new=self.new, changed=self.changed, unchanged=self.unchanged)
+
+
+class FingerprintStore:
+    """
+    Fingerprints of raw event data from previous runs (sqlite file).
+
+    Parser with store (see BaseParser.fingerprints) doesn't extract tags
+    of events, which raw data and requested tags didn't change since they
+    were stored, and get_events returns only new and changed events.
+    Fingerprints are stored when get_events finishes successfully,
+    get_event always returns event. Counters per source are in ``stats``.
+
+    Parameters:
+    -----------
+    path : str or Path
+        Store file path (":memory:" for in-memory store).
+
+    Examples:
+    ---------
+    >>> radario = Radario()
+    >>> radario.fingerprints = FingerprintStore("~/.cache/escraper-fingerprints.sqlite")
+    >>> radario.get_events(request_params=params)  # all events
+    >>> radario.get_events(request_params=params)  # only new and changed events
+    >>> radario.fingerprints.summary()
+    {'radario': {'new': 0, 'changed': 2, 'unchanged': 40}}
+    """
+
+    def __init__(self, path, clock=time.time):
+        self.path = str(path)
+        self.clock = clock
+
+        self.stats = defaultdict(FingerprintStats)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS fingerprints ("
+            "source TEXT, event_id TEXT, fingerprint TEXT, updated_at REAL, PRIMARY KEY (source, event_id))"
+        )
+        self._connection.commit()
+
+    def __repr__(self):
+        return f"<FingerprintStore {self.path!r}>"
+
+    def get(self, source, event_id):
+        """Stored fingerprint of event or None."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT fingerprint FROM fingerprints WHERE source = ? AND event_id = ?", (source, str(event_id))
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def update(self, source, event_id, event_fingerprint):
+        """
+        Store fingerprint of event, return "new", "changed" or "unchanged"
+        (comparing with stored one).
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT fingerprint FROM fingerprints WHERE source = ? AND event_id = ?", (source, str(event_id))
+            ).fetchone()
+
+            if row is None:
+                status = "new"
+            elif row[0] == event_fingerprint:
+                status = "unchanged"
+            else:
+                status = "changed"
+
+            if status != "unchanged":
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?, ?)",
+                    (source, str(event_id), event_fingerprint, self.clock()),
+                )
+                self._connection.commit()
+
+            setattr(self.stats[source], status, getattr(self.stats[source], status) + 1)
+        return status
+
+    def delete(self, source, event_id=None):
+        """Forget fingerprint of event (all fingerprints of source if event_id is None)."""
+        with self._lock:
+            if event_id is None:
+                self._connection.execute("DELETE FROM fingerprints WHERE source = ?", (source,))
+            else:
+                self._connection.execute(
+                    "DELETE FROM fingerprints WHERE source = ? AND event_id = ?", (source, str(event_id))
+                )
+            self._connection.commit()
+
+    def summary(self):
+        """Counters of new, changed and unchanged events per source."""
+        return {source: stats.as_dict() for source, stats in self.stats.items()}
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM fingerprints").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
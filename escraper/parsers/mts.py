@@ -1,8 +1,9 @@
 from datetime import datetime, timedelta
 
-import json
-
-from .base import BaseParser, ALL_EVENT_TAGS
+from .base import BaseParser, ALL_EVENT_TAGS, memo_per_event
+from .dates import parse_datetime
+from .nextdata import next_data
+from .seen import seen_index
 from ..emoji import add_emoji
 
 
@@ -11,23 +12,36 @@ class MTS(BaseParser):
     BASE_URL = "https://live.mts.ru"
     parser_prefix = "MTS-"
     DATETIME_STRF = "%Y-%m-%dT%H:%M:%S%z"
+    RATE_LIMITS = {"live.mts.ru": (4, 4)}
+    CACHE_TTL = dict(listing=30 * 60, detail=12 * 60 * 60)
 
     def __init__(self):
         self.url = self.BASE_URL
         self.timedelta_hours = self.timedelta_with_gmt0()
 
     def get_event(self, event_url=None, tags=None):
+        return self._run(self._event_flow(event_url=event_url, tags=tags))
+
+    def _event_flow(self, event_url=None, tags=None):
         if event_url is None:
              raise ValueError("'event_url' required.")
-        body = self._request_get(event_url).text
-        json_body = body.split('<script id="__NEXT_DATA__" type="application/json">')[-1].split('</script>')[0]
+        response = yield self._fetch(event_url)
+        return self._parse_response(
+            response, lambda: self._event_from_body(response.text, event_url, tags), tags=tags,
+        )
 
-        event_json = json.loads(json_body)["props"]["pageProps"]["initialState"]["Announcements"]["announcementDetails"]
-        self.event_url = event_url
+    def _event_from_body(self, body, event_url, tags=None):
+        event_json = self._event_data(body, event_url)
         event = self.parse(event_json, tags=tags or ALL_EVENT_TAGS)
         return event
 
-    def get_events(self, request_params={}, tags=None, existed_event_ids=[]):
+    def _event_data(self, body, event_url):
+        """Event json from event page."""
+        event_json = next_data(body, "props.pageProps.initialState.Announcements.announcementDetails")
+        self.event_url = event_url
+        return event_json
+
+    def get_events(self, request_params={}, tags=None, existed_event_ids=None, full_refresh=False):
         """
         Parameters:
         -----------
@@ -54,8 +68,14 @@ class MTS(BaseParser):
             Event tags (title, id, url etc.,
             see all tags in 'escraper.ALL_EVENT_TAGS')
 
-        existed_event_ids : list of eventId that we need to skip
-            MTS-18634405, MTS-18633215, etc
+        existed_event_ids : list or SeenIndex, default None
+            eventId that we need to skip: MTS-18634405, MTS-18633215, etc.
+            Ids of new events are added to it
+            (see escraper.parsers.seen for persistent index).
+
+        full_refresh : bool, default False
+            Crawl all days of window, even if parser has watermarks
+            (see escraper.parsers.watermarks), and store new ones.
 
         Examples:
         ----------
@@ -67,11 +87,18 @@ class MTS(BaseParser):
         }
         >>> mts.get_events(request_params=request_params)  # doctest: +SKIP
         """
+        return self._run(
+            self._events_flow(
+                request_params=request_params, tags=tags, existed_event_ids=existed_event_ids, full_refresh=full_refresh,
+            ),
+            incremental=True,
+        )
 
-        if "city" in request_params:
-            url = self.url + '/' + request_params['city']
-        else:
-            url = self.url + '/' + "sankt-peterburg"
+    def _events_flow(self, request_params={}, tags=None, existed_event_ids=None, full_refresh=False):
+        existed_event_ids = seen_index(existed_event_ids)
+
+        city = request_params.get('city', "sankt-peterburg")
+        url = self.url + '/' + city
 
         if "date_from" in request_params:
             date_from = datetime.strptime(request_params["date_from"], '%Y-%m-%d')
@@ -95,21 +122,19 @@ class MTS(BaseParser):
         for category in categories:
 
             category_url = url + '/collections/' + category
-            scrape_date = date_from
-            while scrape_date <= date_to:
+            for scrape_date in self._listing_days(date_from, date_to, f"{city}/{category}", full_refresh):
                 scrape_url = category_url + f"?date={scrape_date.date()}"
-                response = self._request_get(scrape_url)
-                json_body = response.text.split('<script id="__NEXT_DATA__" type="application/json">')[-1].split('</script>')[0]
-                event_list_json = json.loads(json_body)["props"]["pageProps"]["initialState"]["Announcements"]["announcementPreviewCollection"]["items"]
+                response = yield self._fetch(scrape_url, listing=True)
+                event_list_json = next_data(
+                    response.text, "props.pageProps.initialState.Announcements.announcementPreviewCollection.items"
+                )
 
                 for event_json in event_list_json:
                     event_url = self.url + event_json['url']
                     event_id = self._id_from_url(event_url)
                     if event_id in existed_event_ids: continue
-                    events.append(self.get_event(event_url=event_url, tags=tags))
-                    existed_event_ids.append(event_id)
-
-                scrape_date += timedelta(days=1)
+                    events.append((yield from self._event_flow(event_url=event_url, tags=tags)))
+                    existed_event_ids.add(event_id)
 
         return events
 
@@ -127,11 +152,11 @@ class MTS(BaseParser):
         return event_json["category"]["title"]
 
     def _date_from(self, event_json):
-        self._date_from_ = datetime.strptime(event_json["eventClosestDateTime"]+'Z', self.DATETIME_STRF).astimezone(self.TIMEZONE)
+        self._date_from_ = parse_datetime(event_json["eventClosestDateTime"]+'Z', self.DATETIME_STRF, self.TIMEZONE)
         return self._date_from_
 
     def _date_to(self, event_json):
-        date_to = datetime.strptime(event_json["lastEventDateTime"]+'Z', self.DATETIME_STRF).astimezone(self.TIMEZONE)
+        date_to = parse_datetime(event_json["lastEventDateTime"]+'Z', self.DATETIME_STRF, self.TIMEZONE)
         if (date_to < self._date_from_ + timedelta(days=7)) and (date_to != self._date_from_):
             self._date_to_ = date_to
         elif self._date_from_:
@@ -154,6 +179,7 @@ class MTS(BaseParser):
     def _place_name(self, event_json):
         return event_json["venue"]["title"].strip()
 
+    @memo_per_event
     def _full_text(self, event_json) -> str:
         post_text_html = event_json["description"]
         if post_text_html:
@@ -0,0 +1,42 @@
+import json
+from json.decoder import WHITESPACE
+
+
+NEXT_DATA_SCRIPT = '<script id="__NEXT_DATA__" type="application/json">'
+LD_JSON_SCRIPT = '<script type="application/ld+json">'
+
+_decoder = json.JSONDecoder()
+
+
+def script_json(body, script_tag, path=None):
+    """
+    Decode json from the last 'script_tag' of page body.
+
+    Json is decoded in place (from script start to the end of json value),
+    without copies of page parts. If 'path' is given ("props.pageProps.event"
+    or tuple of keys), only this part of json is returned.
+
+    Raise JSONDecodeError if there is no json after script tag.
+    """
+    start = body.rfind(script_tag)
+    start = 0 if start == -1 else start + len(script_tag)
+    start = WHITESPACE.match(body, start).end()
+
+    data, _ = _decoder.raw_decode(body, start)
+
+    if path is not None:
+        for key in path.split(".") if isinstance(path, str) else path:
+            data = data[key]
+    return data
+
+
+def next_data(body, path=None):
+    """
+    Next.js page state (__NEXT_DATA__ script json) or its part by 'path'.
+
+    Examples:
+    ---------
+    >>> next_data(response.text, "props.pageProps.event")
+    {'_id': ..., 'title': ..., 'seances': [...], ...}
+    """
+    return script_json(body, NEXT_DATA_SCRIPT, path=path)
@@ -0,0 +1,182 @@
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .base import ALL_EVENT_TAGS, Fetch
+
+
+# raw payload of event: page text or api json ('body'), or fetch 'error'
+Payload = namedtuple("Payload", ["url", "body", "error"], defaults=(None,))
+
+# parser snapshot and tags of worker process (see ParseStage)
+_worker_parser = None
+_worker_tags = None
+
+
+def fetch_payloads(parser, requests, max_workers=1, json=False):
+    """
+    Fetch stage: payloads of event requests, in order of requests.
+
+    Failed requests (connection errors, bad responses) don't stop the stage,
+    error is returned in payload instead of body.
+
+    Parameters:
+    -----------
+    parser : BaseParser
+        Parser, which sends requests.
+
+    requests : list of str or Fetch
+        Event urls or requests of parser (see BaseParser._fetch).
+
+    max_workers : int, default 1
+        Number of threads sending requests concurrently.
+
+    json : bool, default False
+        Decode response json (api sources) instead of text (event pages).
+    """
+    requests = [request if isinstance(request, Fetch) else parser._fetch(request) for request in requests]
+
+    def fetch(request):
+        url = request.args[0] if request.args else request.kwargs.get("url")
+        try:
+            response = parser._request_get(*request.args, **request.kwargs)
+            if response is None:
+                raise ValueError(f"Failed to fetch {url}: bad response.")
+            return Payload(url, response.json() if json else response.text)
+        except Exception as e:
+            return Payload(url, None, e)
+
+    if max_workers <= 1:
+        return [fetch(request) for request in requests]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(fetch, requests))
+
+
+class ParseStage:
+    """
+    Parse stage: event records from payloads (see fetch_payloads).
+
+    Payloads are parsed by snapshot of parser (see BaseParser._parse_snapshot)
+    in worker processes, records are eager (lazy_records is not used) and
+    parse time isn't recorded to parser stats.
+
+    Parameters:
+    -----------
+    parser : BaseParser
+        Parser, which decodes payloads and extracts tags.
+
+    tags : list of tags, default all available event tags
+        Event tags (see escraper.ALL_EVENT_TAGS).
+
+    max_workers : int, default None
+        Number of worker processes (number of CPUs if None).
+        If 0, payloads are parsed in this process.
+
+    chunksize : int, default 16
+        Number of payloads sent to worker process at once.
+
+    mp_context : multiprocessing context, default None
+        Context of worker processes (see ProcessPoolExecutor).
+
+    Examples:
+    ---------
+    >>> with ParseStage(QTickets(), max_workers=4) as stage:
+    ...     for event in stage.map(payloads):
+    ...         print(event.title)
+    """
+
+    def __init__(self, parser, tags=None, max_workers=None, chunksize=16, mp_context=None):
+        self.parser = parser
+        self.tags = tuple(tags or ALL_EVENT_TAGS)
+        self.max_workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+        self.chunksize = chunksize
+        self.mp_context = mp_context
+        self._executor = None
+
+    def __repr__(self):
+        return f"<ParseStage parser={self.parser.name} max_workers={self.max_workers}>"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def executor(self):
+        """Pool of worker processes (started on first use)."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=self.mp_context,
+                initializer=_init_worker,
+                initargs=(self.parser._parse_snapshot(), self.tags),
+            )
+        return self._executor
+
+    def map(self, payloads, return_exceptions=True):
+        """
+        Records of payloads, in order of payloads.
+
+        If 'return_exceptions', error of payload (fetch or parse error) is
+        returned instead of record, otherwise the first error is raised.
+        Parser with fingerprints parsing in this process (max_workers=0)
+        returns UNCHANGED for unchanged events.
+        """
+        if self.max_workers == 0:
+            results = (_parse_payload(self.parser, self.tags, payload) for payload in payloads)
+        else:
+            payloads = list(payloads)
+            chunks = [payloads[i:i + self.chunksize] for i in range(0, len(payloads), self.chunksize)]
+            results = (result for chunk in self.executor.map(_parse_chunk, chunks) for result in chunk)
+
+        for event, error in results:
+            if error is not None and not return_exceptions:
+                raise error
+            yield event if error is None else error
+
+    def close(self):
+        """Stop worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+def parse_payloads(parser, payloads, tags=None, max_workers=None, return_exceptions=True, **kwargs):
+    """
+    List of records of payloads (see ParseStage, the same arguments).
+
+    Crawl may be split into fetch stage (network, bounded by sessions and
+    rate limits) and parse stage (CPU, in worker processes).
+
+    Examples:
+    ---------
+    >>> qtickets = QTickets()
+    >>> payloads = fetch_payloads(qtickets, event_urls, max_workers=4)
+    >>> events = parse_payloads(qtickets, payloads, max_workers=4)
+    >>> [event for event in events if isinstance(event, Exception)]  # errors in order of payloads
+    []
+    """
+    with ParseStage(parser, tags=tags, max_workers=max_workers, **kwargs) as stage:
+        return list(stage.map(payloads, return_exceptions=return_exceptions))
+
+
+def _init_worker(parser, tags):
+    global _worker_parser, _worker_tags
+    _worker_parser, _worker_tags = parser, tags
+
+
+def _parse_chunk(payloads):
+    return [_parse_payload(_worker_parser, _worker_tags, payload) for payload in payloads]
+
+
+def _parse_payload(parser, tags, payload):
+    # (record, None) or (None, error)
+    if payload.error is not None:
+        return None, payload.error
+    try:
+        event_data = parser._event_data(payload.body, payload.url)
+        return parser.parse(event_data, tags=tags, lazy=False), None
+    except Exception as e:
+        return None, e
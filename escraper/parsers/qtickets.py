@@ -4,9 +4,10 @@ import warnings
 from datetime import datetime, timedelta
 
 import pytz
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
-from .base import BaseParser, ALL_EVENT_TAGS
+from .base import BaseParser, ALL_EVENT_TAGS, memo_per_event
+from .selector import SelectorSpec
 from ..emoji import add_emoji
 
 
@@ -26,7 +27,18 @@ monthes = {
 }
 STRPTIME = "%d %m %H:%M"
 
-
+# event page fields used by extractors
+EVENT_SELECTORS = SelectorSpec(
+    address=("div.address", str.strip),
+    date_from_to=("div.event-info time", str.strip),
+    place_name=("a.place", str.strip),
+    text="div.text",
+    poster_imag="div.center_area img @src",
+    price=("a#buy_btn", lambda text: text.split("Купить от")[-1].strip()),
+    title=("section#modal_content h1", str.strip),
+    url="link[rel=canonical] @href",
+)
+LISTING_PAGE_STRAINER = SoupStrainer("li", {"class": "item"})
 
 
 class QTickets(BaseParser):
@@ -34,21 +46,30 @@ class QTickets(BaseParser):
     BASE_URL = "https://spb.qtickets.events"
     DATETIME_STRF = "%Y-%m-%d"
     parser_prefix = "QT-"
+    RATE_LIMITS = {"qtickets.events": (4, 4)}
+    CACHE_TTL = dict(listing=30 * 60, detail=12 * 60 * 60)
 
     def __init__(self):
         self.url = self.BASE_URL
         self.timedelta_hours = self.timedelta_with_gmt0()
 
     def get_event(self, event_url=None, tags=None):
+        return self._run(self._event_flow(event_url=event_url, tags=tags))
+
+    def _event_flow(self, event_url=None, tags=None):
         if event_url is None:
             raise ValueError("'event_id' or 'event_url' required.")
 
-        event_soup = BeautifulSoup(
-            self._request_get(event_url).text, "lxml"
+        response = yield self._fetch(event_url)
+        return self._parse_response(
+            response,
+            lambda: self.parse(self._event_data(response.text, event_url), tags=tags or ALL_EVENT_TAGS),
+            tags=tags,
         )
-        event = self.parse(event_soup, tags=tags or ALL_EVENT_TAGS)
 
-        return event
+    def _event_data(self, body, event_url=None):
+        """Event page fields (see EVENT_SELECTORS)."""
+        return EVENT_SELECTORS.extract_html(body)
 
     def get_events(self, request_params={}, tags=None):
         """
@@ -80,6 +101,9 @@ class QTickets(BaseParser):
         }
         >>> qt.get_events(request_params=request_params)  # doctest: +SKIP
         """
+        return self._run(self._events_flow(request_params=request_params, tags=tags), incremental=True)
+
+    def _events_flow(self, request_params={}, tags=None):
 
         if "city" in request_params:
             self.url = self.url.replace('spb', request_params['city'])
@@ -101,11 +125,11 @@ class QTickets(BaseParser):
         page = 1
         while True:
             url = f"{self.url}/?page={str(page)}"
-            response = self._request_get(url)
+            response = yield self._fetch(url, listing=True)
 
             dates = list()
             if response:
-                soup = BeautifulSoup(response.text, "lxml")
+                soup = BeautifulSoup(response.text, "lxml", parse_only=LISTING_PAGE_STRAINER)
                 list_event_from_soup = soup.find_all("li", {"class": "item"})
             else:
                 list_event_from_soup = list()
@@ -117,10 +141,10 @@ class QTickets(BaseParser):
                     event_card.find("time", {"class":"place"})['datetime']
                 ).astimezone(self.TIMEZONE)
                 dates.append(date)
-                event_soup = BeautifulSoup(self._request_get(event_url).text, "lxml")
+                event_fields = self._event_data((yield self._fetch(event_url)).text, event_url)
                 if date >= maximum_date and len(dates) > 9:
                     continue
-                events.append(self.parse(event_soup, tags=tags or ALL_EVENT_TAGS))
+                events.append(self.parse(event_fields, tags=tags or ALL_EVENT_TAGS))
             page += 1
 
             if dates and max(dates) >= maximum_date:
@@ -128,21 +152,19 @@ class QTickets(BaseParser):
 
         return events
 
-    def _adress(self, event_soup):
-        full_address = event_soup.find(
-            "div", {"class": "address"}
-        ).text.strip()
+    def _adress(self, event_fields):
+        full_address = event_fields["address"]
 
         full_address = full_address.replace("Санкт-Петербург, ", "")
         full_address = full_address.replace("Россия", "")
 
         return full_address
 
-    def _category(self, event_soup):
+    def _category(self, event_fields):
         return None
 
-    def _date_from(self, event_soup):
-        date_string = self._date_from_to(event_soup)
+    def _date_from(self, event_fields):
+        date_string = self._date_from_to(event_fields)
         year_now = datetime.now().year
 
         day_to = None
@@ -187,55 +209,52 @@ class QTickets(BaseParser):
 
         return self._date_from_
 
-    def _date_to(self, event_soup):
+    def _date_to(self, event_fields):
         return self._date_to_
 
-    def _date_from_to(self, event_soup):
+    def _date_from_to(self, event_fields):
         """
         Parse date from and to as string from event page.
         """
-        return event_soup.find("div", {"class": "event-info"}).find("time").text.strip()
+        return event_fields["date_from_to"]
 
 
-    def _id(self, event_soup):
-        event_url = self._url(event_soup)
+    def _id(self, event_fields):
+        event_url = self._url(event_fields)
         if event_url:
             event_id = event_url.split('/')[-1].split('-')[0]
         else:
             event_id = str(datetime.today()).replace(' ','_')
         return self.parser_prefix + event_id
 
-    def _place_name(self, event_soup):
-        return event_soup.find("a", {"class": "place"}).text.strip()
+    def _place_name(self, event_fields):
+        return event_fields["place_name"]
 
-    def _full_text(self, event_soup) -> str:
-        post_text_soup = event_soup.find("div", {"class": "text"})
-        if post_text_soup:
-            post_text = self.remove_html_tags(
-                event_soup.find("div", {"class": "text"}).text
-            ).strip()
+    @memo_per_event
+    def _full_text(self, event_fields) -> str:
+        if event_fields["text"] is not None:
+            post_text = self.remove_html_tags(event_fields["text"]).strip()
         else:
             post_text = ''
         return post_text
 
-    def _post_text(self, event_soup):
-        return self.prepare_post_text(self._full_text(event_soup))
+    def _post_text(self, event_fields):
+        return self.prepare_post_text(self._full_text(event_fields))
 
-    def _poster_imag(self, event_soup):
-        event_card_image = event_soup.find("div", {"class": "center_area"}).find("img")
-        if event_card_image is not None:
-            return event_card_image["src"]
+    def _poster_imag(self, event_fields):
+        return event_fields["poster_imag"]
 
-    def _price(self, event_soup):
-        return event_soup.find("a", {"id": "buy_btn"}).text.split('Купить от')[-1].strip()
+    def _price(self, event_fields):
+        return event_fields["price"]
 
-    def _title(self, event_soup):
+    def _title(self, event_fields):
         return add_emoji(
-            event_soup.find("section", {"id": "modal_content"}).find("h1").text.strip()
+            event_fields["title"]
         )
 
-    def _url(self, event_soup):
-        return event_soup.find("link", {"rel": "canonical"})['href']
+    def _url(self, event_fields):
+        return event_fields["url"]
+
+    def _is_registration_open(self, event_fields):
+        return re.match(r"\d+", self._price(event_fields)) is not None
 
-    def _is_registration_open(self, event_soup):
-        return re.match(r"\d+", self._price(event_soup)) is not None
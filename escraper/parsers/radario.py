@@ -2,7 +2,9 @@ import re
 import warnings
 from datetime import datetime, timedelta
 
-from .base import BaseParser, ALL_EVENT_TAGS
+from .base import BaseParser, ALL_EVENT_TAGS, memo_per_event
+from .dates import parse_datetime
+from .seen import seen_index
 from ..emoji import add_emoji
 
 
@@ -12,6 +14,8 @@ class Radario(BaseParser):
     BASE_EVENTS_API = "https://radario.ru/web-api/affiche/events"
     DATETIME_STRF = "%Y-%m-%dT%H:%M:%S.%f%z"
     parser_prefix = "RADARIO-"
+    RATE_LIMITS = {"radario.ru": (5, 5)}
+    CACHE_TTL = dict(listing=15 * 60, detail=60 * 60)
 
     AVAILABLE_CATEGORIES = [
         "concert",
@@ -30,23 +34,30 @@ class Radario(BaseParser):
         self.timedelta_hours = self.timedelta_with_gmt0()
 
     def get_event(self, event_id=None, event_url=None, tags=None):
+        return self._run(self._event_flow(event_id=event_id, event_url=event_url, tags=tags))
+
+    def _event_flow(self, event_id=None, event_url=None, tags=None):
         if event_id is None and event_url is not None:
             event_id = event_url.split('/')[-1]
         elif event_url is None and event_id is None :
             raise ValueError("'event_id' or 'event_url' required.")
 
-        event_api_url = f"{self.BASE_EVENTS_API}/{event_id}"
-        response = self._request_get(event_api_url)
+        response = yield self._event_request(event_id)
+
+        return self._event_from_response(response, tags=tags)
 
+    def _event_request(self, event_id):
+        return self._fetch(f"{self.BASE_EVENTS_API}/{event_id}")
+
+    def _event_from_response(self, response, tags=None):
         if response.status_code != 200:
             raise ValueError(f"Failed to fetch events. HTTP {response.status_code}: {response.text}")
 
-        event_json_data = response.json()
-        event = self.parse(event_json_data, tags=tags or ALL_EVENT_TAGS)
-
-        return event
+        return self._parse_response(
+            response, lambda: self.parse(response.json(), tags=tags or ALL_EVENT_TAGS), tags=tags,
+        )
 
-    def get_events(self, request_params=None, tags=None, existed_event_ids=[]):
+    def get_events(self, request_params=None, tags=None, existed_event_ids=None, max_workers=5, full_refresh=False):
         """
         Parameters:
         -----------
@@ -68,6 +79,19 @@ class Radario(BaseParser):
             Event tags (title, id, url etc.,
             see all tags in 'escraper.ALL_EVENT_TAGS')
 
+        existed_event_ids : list or SeenIndex, default None
+            Event ids that we need to skip: RADARIO-1234567, etc.
+            Ids of new events are added to it
+            (see escraper.parsers.seen for persistent index).
+
+        max_workers : int, default 5
+            Number of event pages (and next listing page) fetched concurrently.
+            Events order doesn't depend on it.
+
+        full_refresh : bool, default False
+            Crawl all window, even if parser has watermarks
+            (see escraper.parsers.watermarks), and store new ones.
+
         Examples:
         ----------
         >>> radario = Radario()
@@ -79,7 +103,17 @@ class Radario(BaseParser):
         }
         >>> radario.get_events(request_params_general=request_params)  # doctest: +SKIP
         """
+        return self._run(
+            self._events_flow(
+                request_params=request_params, tags=tags, existed_event_ids=existed_event_ids, full_refresh=full_refresh,
+            ),
+            max_workers=max_workers,
+            incremental=True,
+        )
+
+    def _events_flow(self, request_params=None, tags=None, existed_event_ids=None, full_refresh=False):
         request_params = (request_params or dict())
+        existed_event_ids = seen_index(existed_event_ids)
 
         if "city" in request_params:
             city_id = self.cities_to_id(request_params["city"])
@@ -95,7 +129,6 @@ class Radario(BaseParser):
         events = list()
 
         limit = 21
-        offset = 0
 
         from_date = datetime.today() + timedelta(days=1)
         if 'days' in request_params.keys():
@@ -105,9 +138,17 @@ class Radario(BaseParser):
 
         for cat in request_params.pop("category", [""]):
             if cat in self.AVAILABLE_CATEGORIES + [""]:
-                while 100 >= offset:
+                offset = 0
+
+                # window after the last crawled one
+                watermark_key = f"{city_id}/{cat}/{'online' if is_online else 'offline'}"
+                crawled_to = self._watermark(watermark_key, full_refresh)
+                category_from = from_date if crawled_to is None else max(from_date, datetime.fromisoformat(crawled_to))
+                if category_from >= to_date: continue
+
+                def listing_request(offset):
                     events_request_params = {
-                        "from": from_date.strftime("%Y-%m-%dT%H:%M:%S+03:00"),
+                        "from": category_from.strftime("%Y-%m-%dT%H:%M:%S+03:00"),
                         "to": to_date.strftime("%Y-%m-%dT%H:%M:%S+03:00"),
                         "cityId": city_id,
                         "limit": limit,
@@ -118,22 +159,48 @@ class Radario(BaseParser):
                     if cat != "":
                         events_request_params["superTagId"] = self.categories_to_id(cat)
 
-                    response = self._request_get(self.BASE_EVENTS_API, params=events_request_params)
+                    return self._fetch(self.BASE_EVENTS_API, params=events_request_params, listing=True)
+
+                response = yield listing_request(offset)
+                listing_failed = False
 
+                while True:
                     if response:
                         list_event_from_json = response.json()
                     else:
                         list_event_from_json = list()
+                        listing_failed = True
+
+                    page_event_ids = list()
                     for event_json in list_event_from_json:
                         event_id = self._id(event_json)
-                        if event_id in existed_event_ids: continue
+                        if event_id in existed_event_ids or event_id in page_event_ids: continue
+                        page_event_ids.append(event_id)
+
+                    listing_exhausted = len(list_event_from_json) < limit
+                    has_next_page = not listing_exhausted and 100 >= offset + (limit-1)
+
+                    # detail pages and next listing page are fetched together
+                    page_requests = [
+                        self._event_request(event_id.replace(self.parser_prefix, ""))
+                        for event_id in page_event_ids
+                    ]
+                    if has_next_page:
+                        offset += (limit-1)
+                        page_requests.append(listing_request(offset))
+
+                    responses = yield page_requests
+
+                    for event_id, event_response in zip(page_event_ids, responses):
+                        events.append(self._event_from_response(event_response, tags=tags))
+                        existed_event_ids.add(event_id)
 
-                        new_event = self.get_event(event_id=event_json['id'], tags=tags or ALL_EVENT_TAGS)
+                    if not has_next_page: break
+                    response = responses[-1]
 
-                        events.append(new_event)
-                        existed_event_ids.append(new_event.id)
-                    if len(list_event_from_json) < limit: break
-                    offset += (limit-1)
+                # window is crawled, if its last page is fetched (not cut by offset cap)
+                if listing_exhausted and not listing_failed:
+                    self._set_watermark(watermark_key, to_date.isoformat())
 
             else:
                 warnings.warn(f"Category {cat!r} is not exist", UserWarning)
@@ -170,12 +237,12 @@ class Radario(BaseParser):
         return event_json_data['superTagName'].strip()
 
     def _date_from(self, event_json_data):
-        self._date_from_ = datetime.strptime(event_json_data['beginDate'], self.DATETIME_STRF) - timedelta(hours=self.timedelta_hours)
+        self._date_from_ = parse_datetime(event_json_data['beginDate'], self.DATETIME_STRF) - timedelta(hours=self.timedelta_hours)
         self._date_from_ = self._date_from_.astimezone(self.TIMEZONE)
         return self._date_from_
 
     def _date_to(self, event_json_data):
-        self._date_to_ = datetime.strptime(event_json_data['endDate'], self.DATETIME_STRF) - timedelta(hours=self.timedelta_hours)
+        self._date_to_ = parse_datetime(event_json_data['endDate'], self.DATETIME_STRF) - timedelta(hours=self.timedelta_hours)
         self._date_to_ = self._date_to_.astimezone(self.TIMEZONE)
         return self._date_to_
 
@@ -191,6 +258,7 @@ class Radario(BaseParser):
     def _place_name(self, event_json_data):
         return event_json_data["placeTitle"].strip()
 
+    @memo_per_event
     def _full_text(self, event_json_data) -> str:
         if event_json_data["description"]:
             return self.remove_html_tags(
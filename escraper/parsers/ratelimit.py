@@ -0,0 +1,141 @@
+import asyncio
+import threading
+import time
+
+from .retry import host_from_url
+
+
+class TokenBucket:
+    """
+    Token bucket: ``rate`` tokens per second, at most ``burst`` tokens stored.
+
+    Thread-safe. ``acquire`` sleeps only when the bucket is empty,
+    ``acquire_async`` is the asyncio counterpart.
+    """
+
+    def __init__(self, rate, burst=1, clock=time.monotonic, sleep=time.sleep):
+        if rate <= 0:
+            raise ValueError("'rate' must be positive.")
+
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self.clock = clock
+        self.sleep = sleep
+
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _reserve(self):
+        """Take one token (may go below zero). Return seconds to wait for it."""
+        with self._lock:
+            now = self.clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        delay = self._reserve()
+        if delay > 0:
+            self.sleep(delay)
+        return delay
+
+    async def acquire_async(self):
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+class RateLimiter:
+    """
+    Token buckets keyed by host.
+
+    Parameters:
+    -----------
+    default_rate, default_burst : float, int, default None, 1
+        Bucket for hosts without own rate. If ``default_rate`` is None,
+        requests to such hosts are not paced.
+
+    Examples:
+    ---------
+    >>> limiter = RateLimiter.shared()
+    >>> limiter.set_rate("api.vk.com", rate=3, burst=3)
+    >>> limiter.acquire("https://api.vk.com/method/groups.search")
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, default_rate=None, default_burst=1, clock=time.monotonic, sleep=time.sleep):
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.clock = clock
+        self.sleep = sleep
+
+        self._rates = dict()
+        self._overrides = set()
+        self._buckets = dict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls):
+        """Process-wide limiter, shared between parsers."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+        return cls._shared
+
+    def set_rate(self, host, rate, burst=1, override=True):
+        """
+        Set rate (requests per second) and burst for host.
+        Rate of domain is used for all its subdomains without own rate
+        (e.g. "ticketscloud.org" for "<org_id>.ticketscloud.org").
+
+        Rates set with ``override=False`` (parsers defaults) don't replace
+        rates set at runtime with ``override=True``.
+        """
+        with self._lock:
+            if not override and host in self._overrides:
+                return
+            if override:
+                self._overrides.add(host)
+
+            self._rates[host] = (rate, burst)
+            for bucket_host in list(self._buckets):
+                bucket_domain = bucket_host.split(":")[0]
+                if bucket_domain == host or bucket_domain.endswith("." + host):
+                    del self._buckets[bucket_host]
+
+    def bucket(self, host):
+        with self._lock:
+            if host not in self._buckets:
+                rate, burst = self._rate_for(host)
+                if rate is None:
+                    return None
+                self._buckets[host] = TokenBucket(rate, burst, clock=self.clock, sleep=self.sleep)
+            return self._buckets[host]
+
+    def _rate_for(self, host):
+        domain = host.split(":")[0]
+        while domain:
+            if domain in self._rates:
+                return self._rates[domain]
+            domain = domain.partition(".")[2]
+        return self.default_rate, self.default_burst
+
+    def acquire(self, url):
+        bucket = self.bucket(host_from_url(url))
+        if bucket is not None:
+            return bucket.acquire()
+        return 0.0
+
+    async def acquire_async(self, url):
+        bucket = self.bucket(host_from_url(url))
+        if bucket is not None:
+            return await bucket.acquire_async()
+        return 0.0
@@ -0,0 +1,116 @@
+import threading
+from collections import namedtuple
+
+
+_EVENT_TYPES = dict()
+_EVENT_TYPES_LOCK = threading.Lock()
+
+
+def event_type(tags):
+    """
+    Event record type (namedtuple "event") for tags.
+
+    One type is created per distinct tags tuple and reused for all events,
+    so parsing doesn't build new class for every event. Records are plain
+    tuples without instance dict, and picklable although the type is
+    created at runtime (see make_event).
+
+    Examples:
+    ---------
+    >>> Event = event_type(("id", "title"))
+    >>> Event(id="RADARIO-1", title="Concert")
+    event(id='RADARIO-1', title='Concert')
+    >>> event_type(["id", "title"]) is Event
+    True
+    """
+    tags = tuple(tags)
+    record_type = _EVENT_TYPES.get(tags)
+    if record_type is not None:
+        return record_type
+
+    with _EVENT_TYPES_LOCK:
+        if tags not in _EVENT_TYPES:
+            record_type = namedtuple("event", tags)
+            record_type.__reduce__ = _reduce_event
+            _EVENT_TYPES[tags] = record_type
+        return _EVENT_TYPES[tags]
+
+
+def make_event(tags, values):
+    """Event record from tags and values in the same order."""
+    return event_type(tags)._make(values)
+
+
+def _reduce_event(event):
+    # type is looked up (or created) again by tags while unpickling
+    return make_event, (event._fields, tuple(event))
+
+
+class LazyEvent:
+    """
+    Event record with tags computed on first access (see BaseParser.parse).
+
+    Extractors run on snapshot of parser made while parsing, so record
+    stays correct after parser moved to other events. Tags, which
+    extractors use results of other tags (TAG_DEPENDENCIES of parser),
+    compute them first.
+
+    ``materialize()`` computes all tags and returns ordinary event record,
+    the same as eager parse does. Lazy record is pickled materialized.
+
+    Examples:
+    ---------
+    >>> events = radario.get_events(request_params=params)  # radario.lazy_records = True
+    >>> events = [event for event in events if event.date_from < deadline]  # only date_from is parsed
+    >>> events = [event.materialize() for event in events]
+    """
+
+    __slots__ = ("_fields", "_parser", "_event_data", "_values")
+
+    def __init__(self, parser, event_data, tags):
+        self._fields = tuple(tags)
+        self._parser = parser
+        self._event_data = event_data
+        self._values = dict()
+
+    def __getattr__(self, tag):
+        if tag.startswith("_") or tag not in self._fields:
+            raise AttributeError(f"'event' object has no attribute '{tag}'")
+        return self._value(tag)
+
+    def _value(self, tag):
+        if tag not in self._values:
+            for dependency in self._parser.TAG_DEPENDENCIES.get(tag, ()):
+                self._value(dependency)
+            self._values[tag] = getattr(self._parser, "_" + tag)(self._event_data)
+        return self._values[tag]
+
+    def materialize(self):
+        """Compute all tags, return event record (see event_type)."""
+        values = [self._value(tag) for tag in self._fields]
+        # parser snapshot and page data are not needed anymore
+        self._parser = self._event_data = None
+        return event_type(self._fields)._make(values)
+
+    def _asdict(self):
+        return self.materialize()._asdict()
+
+    def __iter__(self):
+        return iter(self.materialize())
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __eq__(self, other):
+        if isinstance(other, LazyEvent):
+            other = other.materialize()
+        return self.materialize() == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        computed = ", ".join(f"{tag}={self._values[tag]!r}" for tag in self._fields if tag in self._values)
+        return f"lazy event({computed}, ...)" if computed else "lazy event(...)"
+
+    def __reduce__(self):
+        return make_event, (self._fields, tuple(self.materialize()))
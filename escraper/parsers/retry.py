@@ -0,0 +1,174 @@
+import random
+import threading
+import time
+from collections import defaultdict, deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class RetryBudget:
+    """
+    Per-host retry budget: at most ``max_retries`` retries to one host
+    during ``per_seconds`` seconds. When the budget is spent, requests to
+    that host fail fast instead of hammering a struggling source.
+    """
+
+    def __init__(self, max_retries=20, per_seconds=60.0, clock=time.monotonic):
+        self.max_retries = max_retries
+        self.per_seconds = per_seconds
+        self.clock = clock
+
+        self._spent = defaultdict(deque)
+        self._lock = threading.Lock()
+
+    def spend(self, host):
+        """Take one retry from the host budget. Return False if budget is empty."""
+        now = self.clock()
+        with self._lock:
+            spent = self._spent[host]
+            while spent and now - spent[0] >= self.per_seconds:
+                spent.popleft()
+
+            if len(spent) >= self.max_retries:
+                return False
+
+            spent.append(now)
+            return True
+
+    def remaining(self, host):
+        now = self.clock()
+        with self._lock:
+            spent = [t for t in self._spent.get(host, ()) if now - t < self.per_seconds]
+            return self.max_retries - len(spent)
+
+    def reset(self):
+        with self._lock:
+            self._spent.clear()
+
+
+class RetryPolicy:
+    """
+    Capped exponential backoff with full jitter.
+
+    Delay before retry number ``n`` (starting from 0) is a random value
+    from [0, min(max_delay, base_delay * 2 ** n)]. For 429/503 responses
+    with "Retry-After" header, the server delay is used instead
+    (capped by ``max_retry_after``).
+
+    Parameters:
+    -----------
+    max_retries : int, default 3
+        Number of retries after first attempt.
+
+    base_delay, max_delay : float, default 0.5, 30
+        Backoff parameters in seconds.
+
+    retry_statuses : tuple of int, default (429, 500, 502, 503, 504)
+        Response statuses that will be retried. Other bad statuses
+        break immediately.
+
+    respect_retry_after : bool, default True
+        Use "Retry-After" header of response for delay.
+
+    max_retry_after : float, default 120
+        Max delay taken from "Retry-After" header.
+
+    budget : RetryBudget, default None
+        Shared per-host retry budget (unlimited if None).
+
+    Examples:
+    ---------
+    >>> policy = RetryPolicy(max_retries=5, base_delay=1, max_delay=60)
+    >>> radario = Radario()
+    >>> radario.LISTING_RETRY_POLICY = policy
+    """
+
+    def __init__(
+        self,
+        max_retries=3,
+        base_delay=0.5,
+        max_delay=30.0,
+        retry_statuses=RETRY_STATUSES,
+        respect_retry_after=True,
+        max_retry_after=120.0,
+        budget=None,
+        sleep=time.sleep,
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = tuple(retry_statuses)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.budget = budget
+        self.sleep = sleep
+
+    def is_retryable(self, response):
+        """
+        Bad response that worth to retry (status in retry_statuses),
+        responses without status are not retried.
+        """
+        return getattr(response, "status_code", None) in self.retry_statuses
+
+    def can_retry(self, attempt, url):
+        """
+        Check that retry number 'attempt' (starting from 0) is allowed
+        and spend one retry from host budget.
+        """
+        if attempt >= self.max_retries:
+            return False
+
+        if self.budget is not None:
+            return self.budget.spend(host_from_url(url))
+
+        return True
+
+    def delay(self, attempt, response=None):
+        """Seconds to wait before retry number 'attempt' (starting from 0)."""
+        if response is not None and self.respect_retry_after:
+            retry_after = parse_retry_after(getattr(response, "headers", None))
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    def wait(self, attempt, response=None):
+        delay = self.delay(attempt, response)
+        if delay > 0:
+            self.sleep(delay)
+        return delay
+
+
+def host_from_url(url):
+    return urlsplit(str(url)).netloc
+
+
+def parse_retry_after(headers):
+    """
+    Parse "Retry-After" header (delay-seconds or HTTP-date) to seconds.
+    Return None if header not found or invalid.
+    """
+    if not headers:
+        return None
+
+    value = headers.get("Retry-After")
+    if value is None:
+        return None
+
+    value = str(value).strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_date = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+
+    if retry_date.tzinfo is None:
+        retry_date = retry_date.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (retry_date - datetime.now(timezone.utc)).total_seconds())
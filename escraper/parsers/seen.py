@@ -0,0 +1,330 @@
+import hashlib
+import math
+import mmap
+import os
+import sqlite3
+import struct
+import threading
+import time
+import warnings
+from abc import ABC, abstractmethod
+
+
+class SeenIndex(ABC):
+    """
+    Index of seen event ids: parsers skip events, which ids are in index,
+    and add ids of new events (see 'existed_event_ids' of get_events).
+
+    Membership check is O(1) (set) or indexed lookup (sqlite), instead
+    of scanning list of all ids.
+
+    Examples:
+    ---------
+    >>> seen = SqliteSeenIndex("~/.cache/escraper-seen.sqlite")
+    >>> new_events = MTS().get_events(request_params=params, existed_event_ids=seen)
+    >>> next_run_events = MTS().get_events(request_params=params, existed_event_ids=seen)  # only new events
+    """
+
+    @abstractmethod
+    def __contains__(self, event_id):
+        """Event id is seen"""
+
+    @abstractmethod
+    def __len__(self):
+        """Number of seen event ids"""
+
+    @abstractmethod
+    def add(self, event_id):
+        """Mark event id as seen"""
+
+    def update(self, event_ids):
+        for event_id in event_ids:
+            self.add(event_id)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class MemorySeenIndex(SeenIndex):
+    """
+    Seen event ids in memory (set).
+
+    Parameters:
+    -----------
+    event_ids : iterable, default ()
+        Already seen event ids.
+    """
+
+    def __init__(self, event_ids=()):
+        self._ids = set(event_ids)
+
+    def __repr__(self):
+        return f"<MemorySeenIndex ids={len(self._ids)}>"
+
+    def __contains__(self, event_id):
+        return event_id in self._ids
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def add(self, event_id):
+        self._ids.add(event_id)
+
+    def update(self, event_ids):
+        self._ids.update(event_ids)
+
+
+class SqliteSeenIndex(SeenIndex):
+    """
+    Persistent seen event ids (sqlite file), memory doesn't grow with
+    number of ids. Ids are stored (and compared) as strings.
+
+    Parameters:
+    -----------
+    path : str or Path
+        Index file path (":memory:" for in-memory index).
+    """
+
+    def __init__(self, path, clock=time.time):
+        self.path = str(path)
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute("CREATE TABLE IF NOT EXISTS seen (event_id TEXT PRIMARY KEY, seen_at REAL)")
+        self._connection.commit()
+
+    def __repr__(self):
+        return f"<SqliteSeenIndex {self.path!r}>"
+
+    def __reduce__(self):
+        # other processes open the same file
+        return type(self), (self.path, self.clock)
+
+    def __contains__(self, event_id):
+        with self._lock:
+            row = self._connection.execute("SELECT 1 FROM seen WHERE event_id = ?", (str(event_id),)).fetchone()
+        return row is not None
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+    def add(self, event_id):
+        self.update((event_id,))
+
+    def update(self, event_ids):
+        now = self.clock()
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO seen VALUES (?, ?)", ((str(event_id), now) for event_id in event_ids),
+            )
+            self._connection.commit()
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+class BloomSeenIndex(SeenIndex):
+    """
+    Seen event ids in Bloom filter, stored in memory-mapped file.
+
+    Filter takes about 1.8 MB per million ids (error_rate=0.001) instead
+    of hundreds of MB for list of ids, and file pages are shared between
+    processes, which open the same file. Ids, which are not in filter,
+    are never reported as seen; seen ids may be false positives with
+    probability 'error_rate', if 'exact' index is not given to check them.
+
+    Parameters:
+    -----------
+    path : str or Path
+        Filter file path. New file is created, if it doesn't exist.
+
+    capacity : int, default None
+        Expected number of ids (required to create file, then stored in it).
+
+    error_rate : float, default 0.001
+        False positive probability of filter with 'capacity' ids.
+
+    exact : SeenIndex, default None
+        Exact index (e.g. SqliteSeenIndex with all ids), which checks ids
+        found in filter. Added ids are added to it too.
+
+    readonly : bool, default False
+        Open file read-only (e.g. in worker processes): ids added by
+        parsers are kept in memory of process (and added to 'exact').
+
+    Examples:
+    ---------
+    Convert archive of posted ids once:
+    >>> index = BloomSeenIndex.build("seen.bloom", archive_ids, error_rate=0.0001)
+
+    Use it in workers:
+    >>> seen = BloomSeenIndex("seen.bloom", readonly=True, exact=SqliteSeenIndex("seen.sqlite"))
+    >>> Radario().get_events(request_params=params, existed_event_ids=seen)
+    """
+
+    MAGIC = b"ESCBLOOM"
+    # magic, number of bits, number of hashes, capacity, number of added ids
+    HEADER = struct.Struct("<8sQIQQ")
+
+    def __init__(self, path, capacity=None, error_rate=0.001, exact=None, readonly=False):
+        self.path = str(path)
+        self.exact = exact
+        self.readonly = readonly
+
+        self._lock = threading.Lock()
+        self._added = set()
+
+        if not os.path.exists(self.path):
+            if readonly or capacity is None:
+                raise FileNotFoundError(f"Bloom filter {self.path!r} doesn't exist ('capacity' is required to create it).")
+            self._create(self.path, capacity, error_rate)
+
+        with open(self.path, "rb" if readonly else "r+b") as fp:
+            self._bits = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ if readonly else mmap.ACCESS_WRITE)
+
+        magic, self.num_bits, self.num_hashes, self.capacity, self._count = self.HEADER.unpack_from(self._bits)
+        if magic != self.MAGIC:
+            self._bits.close()
+            raise ValueError(f"{self.path!r} is not Bloom filter file.")
+
+    def __repr__(self):
+        return f"<BloomSeenIndex {self.path!r} bits={self.num_bits} hashes={self.num_hashes} ids={self._count}>"
+
+    def __reduce__(self):
+        # worker processes map the same file
+        return type(self), (self.path, None, None, self.exact, self.readonly)
+
+    @classmethod
+    def build(cls, path, event_ids, capacity=None, error_rate=0.001, exact=None):
+        """New filter file with 'event_ids' (capacity is number of ids by default)."""
+        event_ids = event_ids if capacity is not None or hasattr(event_ids, "__len__") else list(event_ids)
+        index = cls(path, capacity=capacity or max(len(event_ids), 1), error_rate=error_rate, exact=exact)
+        index.update(event_ids)
+        index.flush()
+        return index
+
+    @staticmethod
+    def parameters(capacity, error_rate):
+        """Number of bits and hashes of filter for 'capacity' ids with 'error_rate'."""
+        if not 0 < error_rate < 1:
+            raise ValueError("'error_rate' should be between 0 and 1.")
+        num_bits = max(8, math.ceil(-max(capacity, 1) * math.log(error_rate) / math.log(2) ** 2))
+        num_hashes = max(1, round(num_bits / max(capacity, 1) * math.log(2)))
+        return num_bits, num_hashes
+
+    def __contains__(self, event_id):
+        if event_id in self._added:
+            return True
+        if not all(self._bits[self.HEADER.size + (bit >> 3)] & (1 << (bit & 7)) for bit in self._positions(event_id)):
+            return False
+        return self.exact is None or event_id in self.exact
+
+    def __len__(self):
+        """Number of distinct ids added to filter (approximately)."""
+        return self._count + len(self._added)
+
+    def add(self, event_id):
+        if self.readonly:
+            self._added.add(event_id)
+        else:
+            with self._lock:
+                self._add(event_id)
+
+        if self.exact is not None:
+            self.exact.add(event_id)
+
+    def update(self, event_ids):
+        if self.readonly or self.exact is not None:
+            return super().update(event_ids)
+
+        with self._lock:
+            for event_id in event_ids:
+                self._add(event_id)
+
+    def flush(self):
+        """Write changes of filter (and number of ids) to file."""
+        if not self.readonly:
+            self.HEADER.pack_into(
+                self._bits, 0, self.MAGIC, self.num_bits, self.num_hashes, self.capacity, self._count,
+            )
+            self._bits.flush()
+
+    def close(self):
+        with self._lock:
+            if not self._bits.closed:
+                self.flush()
+                self._bits.close()
+
+    def _add(self, event_id):
+        new = False
+        for bit in self._positions(event_id):
+            offset, mask = self.HEADER.size + (bit >> 3), 1 << (bit & 7)
+            byte = self._bits[offset]
+            if not byte & mask:
+                self._bits[offset] = byte | mask
+                new = True
+
+        if new:
+            self._count += 1
+            if self._count == self.capacity + 1:
+                warnings.warn(
+                    f"Bloom filter {self.path!r} has more ids than capacity {self.capacity}, "
+                    "false positive rate grows.",
+                    UserWarning,
+                )
+
+    def _positions(self, event_id):
+        # double hashing: bit i = h1 + i * h2 (the same in all processes, unlike hash())
+        digest = hashlib.blake2b(str(event_id).encode(), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.num_bits for i in range(self.num_hashes)]
+
+    @classmethod
+    def _create(cls, path, capacity, error_rate):
+        num_bits, num_hashes = cls.parameters(capacity, error_rate)
+        with open(path, "wb") as fp:
+            fp.write(cls.HEADER.pack(cls.MAGIC, num_bits, num_hashes, capacity, 0))
+            fp.truncate(cls.HEADER.size + (num_bits + 7) // 8)
+
+
+class _CollectionSeenIndex(MemorySeenIndex):
+    # list (or set) of ids passed as existed_event_ids: ids of new events
+    # are also added to it, as parsers did with list before
+    def __init__(self, collection):
+        super().__init__(collection)
+        self.collection = collection
+
+    def add(self, event_id):
+        if event_id not in self._ids:
+            self._ids.add(event_id)
+            if hasattr(self.collection, "append"):
+                self.collection.append(event_id)
+            elif hasattr(self.collection, "add"):
+                self.collection.add(event_id)
+
+    update = SeenIndex.update
+
+
+def seen_index(existed_event_ids=None):
+    """
+    SeenIndex for 'existed_event_ids' argument of get_events:
+    SeenIndex as is, new MemorySeenIndex if None, list or set of ids
+    wrapped to index, which adds new ids to the list too.
+    """
+    if existed_event_ids is None:
+        return MemorySeenIndex()
+    if isinstance(existed_event_ids, SeenIndex):
+        return existed_event_ids
+    return _CollectionSeenIndex(existed_event_ids)
@@ -0,0 +1,165 @@
+import re
+
+from lxml import etree
+
+from .text import element_text
+
+
+# attributes, which soup stores as lists of values
+MULTI_VALUED_ATTRIBUTES = ("class", "rel")
+WHITESPACE_RE = re.compile(r"\s+")
+
+_STEP_RE = re.compile(
+    r"""@(?P<attribute>[\w-]+)"""
+    r"""|(?P<tag>[\w-]+)(?P<conditions>(?:\.[\w-]+|\#[\w-]+|\[[\w-]+=(?:"[^"]*"|'[^']*'|[^\]]*)\])*)"""
+)
+_CONDITION_RE = re.compile(r"""\.(?P<cls>[\w-]+)|\#(?P<id>[\w-]+)|\[(?P<name>[\w-]+)=(?P<value>"[^"]*"|'[^']*'|[^\]]*)\]""")
+
+
+class Selector:
+    """
+    Compiled field selector.
+
+    Selector is chain of steps separated by spaces, every step is the first
+    matching node inside node of previous step (as soup.find(...).find(...)):
+        "div.address", "section#modal_content h1",
+        "article[class='col-md-9 col-sm-12'] p", "link[rel=canonical] @href"
+
+    Field value is text of the last node (the same as soup tag .text)
+    or its attribute ("@href"), passed through post-processing functions.
+    Value is None, if node is not found.
+    """
+
+    def __init__(self, selector, *post_processing):
+        self.selector = selector
+        self.post_processing = post_processing
+        self.steps = list()
+        self.attribute = None
+
+        position = 0
+        for match in _STEP_RE.finditer(selector):
+            if selector[position:match.start()].strip() or self.attribute is not None:
+                raise ValueError(f"Bad selector: {selector!r}.")
+            position = match.end()
+
+            if match.group("attribute"):
+                self.attribute = match.group("attribute")
+            else:
+                self.steps.append((match.group("tag"), _compile_conditions(match.group("conditions"))))
+
+        if selector[position:].strip() or not self.steps:
+            raise ValueError(f"Bad selector: {selector!r}.")
+
+    def __repr__(self):
+        return f"<Selector {self.selector!r}>"
+
+    @property
+    def tag(self):
+        """Tag name of the first step."""
+        return self.steps[0][0]
+
+    def matches(self, node, step=0):
+        return all(_condition_matches(node, attribute, value) for attribute, value in self.steps[step][1])
+
+    def value(self, node):
+        """Field value for node matched by the first step."""
+        for step, (tag, _) in enumerate(self.steps[1:], 1):
+            for child in node.iter(tag):
+                if child is not node and self.matches(child, step):
+                    node = child
+                    break
+            else:
+                return None
+
+        value = node.get(self.attribute) if self.attribute else element_text(node)
+        if value is not None:
+            for function in self.post_processing:
+                value = function(value)
+        return value
+
+
+class SelectorSpec:
+    """
+    Declarative fields of html page: selectors are compiled once, and all
+    fields are extracted in one pass over lxml tree.
+
+    Parameters:
+    -----------
+    fields : selector string or tuple (selector, *post-processing functions)
+        See Selector.
+
+    Examples:
+    ---------
+    >>> spec = SelectorSpec(
+    ...     title=("section#modal_content h1", str.strip),
+    ...     url="link[rel=canonical] @href",
+    ... )
+    >>> spec.extract_html(body)
+    {'title': 'Концерт', 'url': 'https://spb.qtickets.events/12345-kontsert'}
+    """
+
+    def __init__(self, **fields):
+        self.selectors = dict()
+        for name, selector in fields.items():
+            if isinstance(selector, str):
+                selector = (selector,)
+            self.selectors[name] = Selector(*selector)
+
+        self._by_tag = dict()
+        for name, selector in self.selectors.items():
+            self._by_tag.setdefault(selector.tag, list()).append((name, selector))
+
+    def __repr__(self):
+        return f"<SelectorSpec {list(self.selectors)}>"
+
+    def extract(self, root):
+        """Field values of lxml tree (None for not found ones)."""
+        values = dict.fromkeys(self.selectors)
+        if root is None:
+            return values
+
+        found = set()
+        for node in root.iter(*self._by_tag):
+            for name, selector in self._by_tag[node.tag]:
+                if name not in found and selector.matches(node):
+                    found.add(name)
+                    values[name] = selector.value(node)
+
+            if len(found) == len(values):
+                break
+
+        return values
+
+    def extract_html(self, body):
+        return self.extract(etree.HTML(body))
+
+
+def squash_whitespace(text):
+    """Post-processing: strip text and replace whitespace runs with one space."""
+    return WHITESPACE_RE.sub(" ", text.strip())
+
+
+def _compile_conditions(conditions):
+    compiled = list()
+    for match in _CONDITION_RE.finditer(conditions):
+        if match.group("cls"):
+            compiled.append(("class", match.group("cls")))
+        elif match.group("id"):
+            compiled.append(("id", match.group("id")))
+        else:
+            value = match.group("value")
+            if value[:1] in ("'", '"'):
+                value = value[1:-1]
+            compiled.append((match.group("name"), value))
+    return tuple(compiled)
+
+
+def _condition_matches(node, attribute, value):
+    """The same matching as soup.find(name, {attribute: value})."""
+    node_value = node.get(attribute)
+    if node_value is None:
+        return False
+    if attribute in MULTI_VALUED_ATTRIBUTES:
+        values = node_value.split()
+        return value in values or " ".join(values) == value
+    return node_value == value
@@ -0,0 +1,109 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class SessionPool:
+    """
+    Keep-alive HTTP sessions with per-host connection pools.
+
+    One pool keeps a single ``requests.Session`` whose adapters cache up to
+    ``pool_connections`` host pools with ``pool_maxsize`` sockets each, so a
+    crawl reuses a handful of connections per source instead of opening a new
+    TCP+TLS connection for every request.
+
+    Parameters:
+    -----------
+    pool_connections : int, default 10
+        Number of per-host connection pools to keep.
+
+    pool_maxsize : int, default 10
+        Max number of sockets kept alive in each host pool
+        (should be >= number of concurrent requests to one host).
+
+    keep_alive : bool, default True
+        Reuse connections between requests.
+        If False, every request is sent with "Connection: close".
+
+    headers : dict, default None
+        Headers sent with every request of the pool.
+
+    Examples:
+    ---------
+    Per-parser pool (default):
+    >>> radario = Radario()
+    >>> radario.session_pool
+    <SessionPool ...>
+
+    Process-wide pool, shared between parsers:
+    >>> pool = SessionPool.shared()
+    >>> radario.session_pool = pool
+    >>> mts.session_pool = pool
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, pool_connections=10, pool_maxsize=10, keep_alive=True, headers=None):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.headers = dict(headers or {})
+
+        self._session = None
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"<SessionPool pool_connections={self.pool_connections} "
+            f"pool_maxsize={self.pool_maxsize} keep_alive={self.keep_alive}>"
+        )
+
+    @classmethod
+    def shared(cls, **kwargs):
+        """
+        Process-wide pool.
+
+        Keyword arguments are applied only when the pool is created
+        by the first call.
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(**kwargs)
+        return cls._shared
+
+    @property
+    def session(self):
+        """Underlying requests.Session (created on first use)."""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._make_session()
+        return self._session
+
+    def _make_session(self):
+        session = requests.Session()
+
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        session.headers.update(self.headers)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+
+        return session
+
+    def get(self, *args, **kwargs):
+        return self.session.get(*args, **kwargs)
+
+    def close(self):
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
@@ -0,0 +1,181 @@
+import threading
+import time
+from collections import Counter, defaultdict
+
+
+class RequestRecord:
+    """One logical request of parser (all its retries included)."""
+
+    __slots__ = (
+        "source", "url", "started", "latency", "status_code",
+        "size", "retries", "from_cache", "not_modified", "error",
+    )
+
+    def __init__(self, source, url, started):
+        self.source = source
+        self.url = url
+        self.started = started
+        self.latency = None
+        self.status_code = None
+        self.size = 0
+        self.retries = 0
+        self.from_cache = False
+        self.not_modified = False
+        self.error = None
+
+    def __repr__(self):
+        return (
+            f"<RequestRecord {self.source} {self.url!r} status={self.status_code} "
+            f"latency={self.latency} retries={self.retries} from_cache={self.from_cache}>"
+        )
+
+
+class SourceStats:
+    """Request and parse counters of one source."""
+
+    def __init__(self):
+        self.requests = 0
+        self.failed = 0
+        self.retries = 0
+        self.bytes = 0
+        self.cache_hits = 0
+        self.not_modified = 0
+        self.latency = 0.0
+        self.max_latency = 0.0
+        self.status_codes = Counter()
+
+        self.events = 0
+        self.parse_time = 0.0
+        self.tag_time = defaultdict(float)
+
+    def __repr__(self):
+        return (
+            f"<SourceStats requests={self.requests} failed={self.failed} retries={self.retries} "
+            f"cache_hits={self.cache_hits} events={self.events}>"
+        )
+
+    @property
+    def mean_latency(self):
+        """Mean latency of requests sent to network (seconds)."""
+        sent = self.requests - self.cache_hits
+        if sent <= 0:
+            return 0.0
+        return self.latency / sent
+
+    def as_dict(self):
+        return dict(
+            requests=self.requests,
+            failed=self.failed,
+            retries=self.retries,
+            bytes=self.bytes,
+            cache_hits=self.cache_hits,
+            not_modified=self.not_modified,
+            mean_latency=self.mean_latency,
+            max_latency=self.max_latency,
+            status_codes=dict(self.status_codes),
+            events=self.events,
+            parse_time=self.parse_time,
+            tag_time=dict(self.tag_time),
+        )
+
+
+class CrawlStats:
+    """
+    Instrumentation of parsers: latency, size, status and retries of
+    requests, cache hits and time spent in every tag while parsing.
+
+    Parser collects nothing until stats is set, so disabled
+    instrumentation costs one attribute check per request and event.
+    One CrawlStats may be shared by several parsers, counters are kept
+    per source (parser name).
+
+    Parameters:
+    -----------
+    on_request : callable, default None
+        Called with RequestRecord after every request (e.g. to log slow
+        or retried requests). Called from thread that sent request.
+
+    Examples:
+    ---------
+    >>> stats = CrawlStats()
+    >>> radario = Radario()
+    >>> radario.stats = stats
+    >>> radario.get_events(request_params=params)
+    >>> print(stats.report())
+    radario: 12 requests (0 failed, 1 retries, 0 cache hits), 1.2 MB, mean latency 0.310s ...
+    """
+
+    def __init__(self, on_request=None, clock=time.perf_counter):
+        self.on_request = on_request
+        self.clock = clock
+        self.sources = defaultdict(SourceStats)
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"<CrawlStats sources={sorted(self.sources)}>"
+
+    def start_request(self, source, url):
+        return RequestRecord(source, url, self.clock())
+
+    def finish_request(self, record, response=None, error=None):
+        record.latency = self.clock() - record.started
+        record.error = error
+        if response is not None:
+            record.status_code = response.status_code
+            record.size = len(response.content or b"")
+            record.not_modified = getattr(response, "not_modified", False)
+
+        with self._lock:
+            stats = self.sources[record.source]
+            stats.requests += 1
+            stats.retries += record.retries
+            if response is None:
+                stats.failed += 1
+            else:
+                stats.status_codes[record.status_code] += 1
+            if record.from_cache:
+                stats.cache_hits += 1
+            else:
+                stats.bytes += record.size
+                stats.latency += record.latency
+                stats.max_latency = max(stats.max_latency, record.latency)
+            if record.not_modified:
+                stats.not_modified += 1
+
+        if self.on_request is not None:
+            self.on_request(record)
+        return record
+
+    def record_event(self, source, tag_time):
+        """Add parse time of one event ('tag_time' is list of (tag, seconds))."""
+        with self._lock:
+            stats = self.sources[source]
+            stats.events += 1
+            for tag, seconds in tag_time:
+                stats.tag_time[tag] += seconds
+                stats.parse_time += seconds
+
+    def summary(self):
+        """Counters per source."""
+        with self._lock:
+            return {source: stats.as_dict() for source, stats in self.sources.items()}
+
+    def report(self, top_tags=3):
+        """End of crawl summary, one line per source."""
+        lines = list()
+        for source, stats in self.summary().items():
+            slowest = sorted(stats["tag_time"].items(), key=lambda item: -item[1])[:top_tags]
+            lines.append(
+                f"{source}: {stats['requests']} requests ({stats['failed']} failed, "
+                f"{stats['retries']} retries, {stats['cache_hits']} cache hits), "
+                f"{stats['bytes'] / 1024 ** 2:.1f} MB, mean latency {stats['mean_latency']:.3f}s, "
+                f"max latency {stats['max_latency']:.3f}s; {stats['events']} events parsed "
+                f"in {stats['parse_time']:.3f}s"
+                + (" (slowest tags: " + ", ".join(f"{tag} {seconds:.3f}s" for tag, seconds in slowest) + ")"
+                   if slowest else "")
+            )
+        return "\n".join(lines)
+
+    def reset(self):
+        with self._lock:
+            self.sources.clear()
@@ -0,0 +1,139 @@
+from bs4 import BeautifulSoup
+from lxml import etree
+
+
+# libxml2 changes these characters of plain text (newlines, NUL, BOM) and leading whitespace
+_CHANGED_CHARS = ("<", "&", "\r", "\x00", "\ufeff")
+_LEADING_WHITESPACE = " \t\n\x0c"
+
+_ASCII_SPACES = " \n\t\x0c\r"
+_PRESERVE_WHITESPACE_TAGS = ("pre", "textarea")
+# BeautifulSoup versions disagree whether contents of these tags are text
+_NOT_TEXT_TAGS = ("script", "style", "template", "rt", "rp")
+# tags, which contents installed bs4 doesn't count as text (bs4 >= 4.10)
+_SOUP_NOT_TEXT_TAGS = frozenset(
+    tag for tag in _NOT_TEXT_TAGS if BeautifulSoup(f"<p><{tag}>x</{tag}></p>", "lxml").text == ""
+)
+
+
+class _TextTarget:
+    """
+    lxml parser target collecting text the same way as BeautifulSoup
+    tree builder does: data between two tags is one string, and strings of
+    ASCII whitespace only are collapsed to "\\n" or " " (except inside pre).
+    """
+
+    def __init__(self):
+        self.strings = list()
+        self.current_data = list()
+        self.preserve_whitespace = 0
+        self.not_text = False
+
+    def _end_data(self):
+        if not self.current_data:
+            return
+        string = "".join(self.current_data)
+        self.current_data = list()
+
+        if not self.preserve_whitespace and not string.strip(_ASCII_SPACES):
+            string = "\n" if "\n" in string else " "
+        self.strings.append(string)
+
+    def start(self, tag, attrib):
+        self._end_data()
+        if tag in _PRESERVE_WHITESPACE_TAGS:
+            self.preserve_whitespace += 1
+        elif tag in _NOT_TEXT_TAGS:
+            self.not_text = True
+
+    def end(self, tag):
+        self._end_data()
+        if tag in _PRESERVE_WHITESPACE_TAGS and self.preserve_whitespace:
+            self.preserve_whitespace -= 1
+
+    def data(self, data):
+        self.current_data.append(data)
+
+    def comment(self, text):
+        self._end_data()
+
+    def doctype(self, *args):
+        self._end_data()
+
+    def pi(self, target, data=None):
+        self._end_data()
+
+    def close(self):
+        self._end_data()
+        return "".join(self.strings)
+
+
+def html_to_text(data):
+    """
+    Text of html, the same as BeautifulSoup(data, "lxml").text.
+
+    Plain strings without markup are returned as is, html is parsed by
+    lxml without building BeautifulSoup tree. Html with script, style,
+    template or ruby text tags (and any data, lxml fails with) is passed
+    to BeautifulSoup.
+
+    Examples:
+    ---------
+    >>> html_to_text("<p>Концерт &laquo;Кино&raquo;</p>")
+    'Концерт «Кино»'
+    """
+    if not isinstance(data, str):
+        return BeautifulSoup(data, "lxml").text
+
+    if not data:
+        return data
+
+    if data[0] not in _LEADING_WHITESPACE and not any(char in data for char in _CHANGED_CHARS):
+        return data
+
+    target = _TextTarget()
+    try:
+        parser = etree.HTMLParser(target=target, recover=True)
+        parser.feed(data[1:] if data[0] == "\ufeff" else data)
+        text = parser.close()
+    except (ValueError, etree.LxmlError):
+        return BeautifulSoup(data, "lxml").text
+
+    if target.not_text:
+        return BeautifulSoup(data, "lxml").text
+
+    return text
+
+
+def element_text(element):
+    """
+    Text of lxml html element, the same as .text of this tag in soup
+    (BeautifulSoup(page, "lxml")): comments are skipped and whitespace only
+    strings are collapsed to "\\n" or " " (except inside pre and textarea).
+    """
+    preserve = any(ancestor.tag in _PRESERVE_WHITESPACE_TAGS for ancestor in element.iterancestors())
+    strings = list()
+    _collect_strings(element, preserve, strings, top=True)
+    return "".join(strings)
+
+
+def _collect_strings(element, preserve, strings, top=False):
+    # text of script etc. is text only for the tag itself
+    if element.tag in _SOUP_NOT_TEXT_TAGS and not top:
+        return
+
+    preserve = preserve or element.tag in _PRESERVE_WHITESPACE_TAGS
+    # text of comments and processing instructions is not collected
+    if element.text and isinstance(element.tag, str):
+        strings.append(_soup_string(element.text, preserve))
+
+    for child in element:
+        _collect_strings(child, preserve, strings)
+        if child.tail:
+            strings.append(_soup_string(child.tail, preserve))
+
+
+def _soup_string(string, preserve):
+    if not preserve and not string.strip(_ASCII_SPACES):
+        return "\n" if "\n" in string else " "
+    return string
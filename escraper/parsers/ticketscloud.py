@@ -5,10 +5,25 @@ from datetime import datetime, timedelta
 
 import pytz
 from bs4 import BeautifulSoup
+from lxml import etree
 
-from .base import BaseParser, ALL_EVENT_TAGS
+from .base import BaseParser, ALL_EVENT_TAGS, memo_per_event
+from .dates import parse_datetime
+from .selector import SelectorSpec, squash_whitespace
 from ..emoji import add_emoji
 
+# event page fields used by extractors
+EVENT_SELECTORS = SelectorSpec(
+    date_from_to=("div.event-info-se__address-part time", squash_whitespace),
+    place_name=("div.event-info-se__address-part address", squash_whitespace),
+    description=(
+        "article[class='col-md-9 col-sm-12 showroom-event-slide__content showroom-event-slide__content_desc'] p"
+    ),
+    price=("div.buy-button-se__button", squash_whitespace),
+    title=("div.event-info-se__title", str.strip),
+)
+SENTENCE_END_RE = re.compile(r'\.(\w)')
+
 ORG_IDS = (
     '5dce558174fd6b0bcaa66524', '5e3d551b44d20ecf697408e4', '5e3bec5fea9c82d6958f8551'
 )
@@ -19,33 +34,44 @@ class Ticketscloud(BaseParser):
 
     DATETIME_STRF = "%Y%m%dT%H%M%SZ"
     parser_prefix = "TC-"
+    RATE_LIMITS = {"ticketscloud.org": (4, 4)}
     TIMEZONE = pytz.timezone("Europe/Moscow")
 
     def __init__(self):
         self.url = self.BASE_URL
 
     def get_event(self, event_url=None, tags=None):
+        return self._run(self._event_flow(event_url=event_url, tags=tags))
+
+    def _event_flow(self, event_url=None, tags=None):
         if event_url is None:
             raise ValueError("'event_id' or 'event_url' required.")
-        self.url = event_url
 
-        event_soup = BeautifulSoup(
-            self._request_get(event_url).text, "lxml"
-        )
+        response = yield self._fetch(event_url)
+        event_fields = self._event_data(response.text, event_url)
+        event = self.parse(event_fields, tags=tags or ALL_EVENT_TAGS)
+
+        return event
+
+    def _event_data(self, body, event_url):
+        """Event page fields (see EVENT_SELECTORS), event json is stored in tc_event."""
+        self.url = event_url
 
-        tags = tags or ALL_EVENT_TAGS
+        root = etree.HTML(body)
 
-        script_tags = event_soup.find_all('script')
-        for script_tag in script_tags:
-            if not script_tag.contents: continue
-            text = script_tag.contents[0]
-            if re.match('tc_event', text):
+        for script_tag in root.iter("script") if root is not None else ():
+            text = script_tag.text
+            if not text: continue
+            if text.startswith('tc_event'):
                 new_text = '='.join(text.strip().split('=')[1:])[:-1]
                 self.tc_event = json.loads(new_text)
                 break
-        event = self.parse(event_soup, tags=tags)
 
-        return event
+        return EVENT_SELECTORS.extract(root)
+
+    def _fingerprint_data(self, event_fields):
+        # event json is kept by parser, not in event fields
+        return dict(fields=event_fields, tc_event=self.tc_event)
 
     def get_events(self, org_ids=None, tags=None, city='spb'):
         """
@@ -69,6 +95,9 @@ class Ticketscloud(BaseParser):
             "url", "org_id", "poster_imag")
         >>> tcloud.get_events(org_ids=org_ids, tags=tags)  # doctest: +SKIP
         """
+        return self._run(self._events_flow(org_ids=org_ids, tags=tags, city=city), incremental=True)
+
+    def _events_flow(self, org_ids=None, tags=None, city='spb'):
         if org_ids is None: org_ids = ORG_IDS
 
         self.city = city
@@ -76,7 +105,7 @@ class Ticketscloud(BaseParser):
 
         for org_id in org_ids:
             url = f"https://{org_id}.ticketscloud.org"
-            response = self._request_get(url)
+            response = yield self._fetch(url, listing=True)
 
             if response:
                 soup = BeautifulSoup(response.text, 'lxml')
@@ -91,18 +120,18 @@ class Ticketscloud(BaseParser):
             for event_card in list_event_from_soup:
 
                 self.url = url + event_card.find('a').get('href')
-                time = datetime.strptime(
+                time = parse_datetime(
                     event_card.find(class_='ticketscloud-event-item__time').text.replace(',', ''), "%d.%m.%Y %H:%M")
 
                 city = event_card.find('span', class_=None).text
                 if (city != 'Санкт-Петербург' and self.city == 'spb') or time>datetime.now()+timedelta(days=10):
                     continue
 
-                events.append(self.get_event(event_url=self.url))
+                events.append((yield from self._event_flow(event_url=self.url)))
 
         return events
 
-    def _adress(self, event_soup):
+    def _adress(self, event_fields):
         if not 'address' in self.tc_event['venue']: return
         full_address = self.tc_event['venue']['address']
         if "онлайн" in full_address.lower():
@@ -119,64 +148,62 @@ class Ticketscloud(BaseParser):
 
         return address
 
-    def _category(self, event_soup):
+    def _category(self, event_fields):
         category = None
         if 'tags' in self.tc_event:
             category = self.tc_event['tags'][0]
         return category
 
-    def _date_from(self, event_soup):
-        return datetime.strptime(self.tc_event['lifetime'].split('\n')[1].strip().split('DATE-TIME:')[-1], self.DATETIME_STRF).astimezone(self.TIMEZONE)
+    def _date_from(self, event_fields):
+        return parse_datetime(self.tc_event['lifetime'].split('\n')[1].strip().split('DATE-TIME:')[-1], self.DATETIME_STRF, self.TIMEZONE)
 
-    def _date_to(self, event_soup):
-        return datetime.strptime(self.tc_event['lifetime'].split('\n')[2].strip().split('DATE-TIME:')[-1], self.DATETIME_STRF).astimezone(self.TIMEZONE)
+    def _date_to(self, event_fields):
+        return parse_datetime(self.tc_event['lifetime'].split('\n')[2].strip().split('DATE-TIME:')[-1], self.DATETIME_STRF, self.TIMEZONE)
 
-    def _date_from_to(self, event_soup):
+    def _date_from_to(self, event_fields):
         """
         Parse date from and to as string from event page.
         """
-        return re.sub('\s+', ' ', event_soup.find('div', class_='event-info-se__address-part').find('time').text.strip())
+        return event_fields["date_from_to"]
 
-    def _id(self, event_soup):
+    def _id(self, event_fields):
         return self.parser_prefix + self.tc_event['id']
 
-    def _place_name(self, event_soup):
-        address_name = re.sub('\s+', ' ',
-                              event_soup.find('div', class_='event-info-se__address-part').find('address').text.strip())
-        return re.sub('Санкт-Петербург, ', '', address_name)
+    def _place_name(self, event_fields):
+        return event_fields["place_name"].replace('Санкт-Петербург, ', '')
 
-    def _full_text(self, event_soup) -> str:
-        if event_soup.find('article',
-                     class_='col-md-9 col-sm-12 showroom-event-slide__content showroom-event-slide__content_desc'):
-            post_text = re.sub(r'\.(\w)', r'. \1', event_soup.find('article', class_='col-md-9 col-sm-12 showroom-event-slide__content showroom-event-slide__content_desc').find('p').text)
+    @memo_per_event
+    def _full_text(self, event_fields) -> str:
+        if event_fields["description"] is not None:
+            post_text = SENTENCE_END_RE.sub(r'. \1', event_fields["description"])
         else:
             post_text = ''
         return post_text
 
-    def _post_text(self, event_soup):
-        post_text = self._full_text(event_soup)
+    def _post_text(self, event_fields):
+        post_text = self._full_text(event_fields)
         return self.prepare_post_text(post_text)
 
-    def _poster_imag(self, event_soup):
+    def _poster_imag(self, event_fields):
         if 'cover_original' in self.tc_event['media']:
             return self.tc_event['media']['cover_original']['url']
         else:
             return
 
-    def _price(self, event_soup):
-        return re.sub('\s+', ' ', event_soup.find('div', class_='buy-button-se__button').text.strip())
+    def _price(self, event_fields):
+        return event_fields["price"]
 
-    def _title(self, event_soup):
+    def _title(self, event_fields):
         return add_emoji(
-            event_soup.find('div', class_='event-info-se__title').text.strip()
+            event_fields["title"]
         )
 
-    def _url(self, event_soup):
+    def _url(self, event_fields):
         return self.url
 
-    def _org_id(self, event_soup):
+    def _org_id(self, event_fields):
         return self.tc_event['org']['id']
 
 
-    def _is_registration_open(self, event_soup):
+    def _is_registration_open(self, event_fields):
         return self.tc_event['tickets_amount_vacant']>0
\ No newline at end of file
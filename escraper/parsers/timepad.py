@@ -1,4 +1,3 @@
-from datetime import datetime
 import os
 import itertools
 import re
@@ -7,6 +6,7 @@ from pathlib import Path
 import pytz
 
 from .base import BaseParser, ALL_EVENT_TAGS
+from .dates import parse_datetime
 from .utils import STRPTIME
 from ..emoji import add_emoji
 
@@ -34,6 +34,7 @@ class Timepad(BaseParser):
     url = "www.timepad.ru"
     events_api = "https://api.timepad.ru/v1/events"
     parser_prefix = "TIMEPAD-"
+    RATE_LIMITS = {"api.timepad.ru": (5, 5)}
     TIMEZONE = pytz.timezone("Europe/Moscow")
     FIELDS = (  # event fields in timepad request parameters
         "name",
@@ -63,6 +64,9 @@ class Timepad(BaseParser):
         self.headers = dict(Authorization=f"Bearer {self._token}")
 
     def get_event(self, event_id=None, event_url=None, tags=None):
+        return self._run(self._event_flow(event_id=event_id, event_url=event_url, tags=tags))
+
+    def _event_flow(self, event_id=None, event_url=None, tags=None):
         if event_url is not None:
             event_id = re.findall(r"(?<=event/)\d*(?=/)", event_url)[0]
 
@@ -70,7 +74,7 @@ class Timepad(BaseParser):
             raise ValueError("'event_id' or 'event_url' required.")
 
         url = self.events_api + f"/{event_id}"
-        response_json = self._request_get(url, headers=self.headers).json()
+        response_json = (yield self._fetch(url, headers=self.headers)).json()
 
         if not is_moderated(response_json):
             print("Event is not moderated")
@@ -82,7 +86,7 @@ class Timepad(BaseParser):
 
         return event
 
-    def get_events(self, request_params=None, tags=None):
+    def get_events(self, request_params=None, tags=None, full_refresh=False):
         """
         Parameters:
         -----------
@@ -132,6 +136,12 @@ class Timepad(BaseParser):
             Event tags (title, id, url etc.,
             see all tags in 'escraper.ALL_EVENT_TAGS')
 
+        full_refresh : bool, default False
+            Don't request only events created after the last crawled one,
+            even if parser has watermarks (see escraper.parsers.watermarks).
+            With watermarks, events are sorted by created_at by default,
+            other 'sort' disables incremental crawling.
+
         Examples:
         ---------
         >>> tp = Timepad()
@@ -157,23 +167,46 @@ class Timepad(BaseParser):
         >>> params = dict(starts_at_min="2020-08-11T00:00:00")
         <10 events after that starts after "2020-08-11T00:00:00">
         """
-        request_params = request_params or {}
+        return self._run(
+            self._events_flow(request_params=request_params, tags=tags, full_refresh=full_refresh), incremental=True,
+        )
+
+    def _events_flow(self, request_params=None, tags=None, full_refresh=False):
+        request_params = dict(request_params or {})
         if "fields" not in request_params:
             request_params["fields"] = ", ".join(self.FIELDS)
 
+        # incremental: events created since the last crawled one (cursor is inclusive),
+        # page sorted by other field may miss events created before its newest one
+        watermark_key = f"{request_params.get('cities', '')}/{request_params.get('category_ids', '')}"
+        incremental = (
+            self.watermarks is not None and request_params.setdefault("sort", "created_at") == "created_at"
+        )
+        if incremental:
+            if "created_at" not in request_params["fields"]:
+                request_params["fields"] += ", created_at"
+            created_at_min = self._watermark(watermark_key, full_refresh)
+            if created_at_min is not None:
+                request_params.setdefault("created_at_min", created_at_min)
+
         tags = tags or ALL_EVENT_TAGS
 
         url = self.events_api + ".json"
-        res = self._request_get(url, params=request_params, headers=self.headers)
+        res = yield self._fetch(url, params=request_params, headers=self.headers, listing=True)
 
         events_data = list()
         if res:
-            for response_json in res.json()["values"]:
+            values = res.json()["values"]
+            for response_json in values:
                 if is_moderated(response_json):
                     events_data.append(self.parse(response_json, tags=tags))
                 else:
                     events_data.append(None)
 
+            created_at = [event["created_at"] for event in values if event.get("created_at")]
+            if incremental and created_at:
+                self._set_watermark(watermark_key, max(created_at, key=lambda value: parse_datetime(value, STRPTIME)))
+
         return events_data
 
     def _adress(self, event):
@@ -211,13 +244,13 @@ class Timepad(BaseParser):
         return event["categories"][0]["name"]
 
     def _date_from(self, event):
-        dt = datetime.strptime(event["starts_at"], STRPTIME).astimezone(self.TIMEZONE)
+        dt = parse_datetime(event["starts_at"], STRPTIME, self.TIMEZONE)
 
         return dt
 
     def _date_to(self, event):
         if "ends_at" in event:
-            dt = datetime.strptime(event["ends_at"], STRPTIME).astimezone(self.TIMEZONE)
+            dt = parse_datetime(event["ends_at"], STRPTIME, self.TIMEZONE)
             return dt
         return None
 
@@ -235,9 +268,9 @@ class Timepad(BaseParser):
 
     def _full_text(self, event):
         if event.get("description_html"):
-            full_text = self.remove_html_tags(event["description_html"])
+            full_text = self._memo(event, "description_html", self.remove_html_tags, event["description_html"])
         elif event.get("description_short"):
-            full_text = self.remove_html_tags(event["description_short"])
+            full_text = self._memo(event, "description_short", self.remove_html_tags, event["description_short"])
         else:
             full_text = ""
 
@@ -247,10 +280,10 @@ class Timepad(BaseParser):
         post_text = ""
 
         if event.get("description_short"):
-            post_text = self.remove_html_tags(event["description_short"])
+            post_text = self._memo(event, "description_short", self.remove_html_tags, event["description_short"])
 
         elif event.get("description_html"):
-            post_text = self.remove_html_tags(event["description_html"])
+            post_text = self._memo(event, "description_html", self.remove_html_tags, event["description_html"])
 
         else:
             post_text = ""
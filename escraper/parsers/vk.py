@@ -1,9 +1,8 @@
-import os, time
+import os
 from datetime import datetime, timedelta
 
-import requests
-
 from .base import BaseParser, ALL_EVENT_TAGS
+from .seen import seen_index
 
 from ..emoji import add_emoji
 
@@ -17,6 +16,8 @@ class VK(BaseParser):
     parser_prefix = "VK-"
     quantity = 1000
     count_query = 100
+    RATE_LIMITS = {"api.vk.com": (3, 1)}  # VK API allows 3 requests per second
+    CACHE_TTL = dict(listing=10 * 60, detail=60 * 60)
 
     def __init__(self, token=None):
         if token is None:
@@ -36,13 +37,17 @@ class VK(BaseParser):
 
     def get_event(self, event_id=None, event_url=None):
         """Get one event by url / event_id"""
+        return self._run(self._event_flow(event_id=event_id, event_url=event_url))
+
+    def _event_flow(self, event_id=None, event_url=None):
         if event_url:
             event_id = event_url.split('/')[-1].split('?')[0]
-        event_in_list = self.get_full_event(event_id)
+        event_in_list = yield from self._full_event_flow(event_id)
         if event_in_list:
+            yield from self._addresses_flow(event_in_list)
             return self.parse(event_in_list[0], tags=ALL_EVENT_TAGS)
 
-    def get_events(self, request_params=None, existed_event_ids=[]):
+    def get_events(self, request_params=None, existed_event_ids=None):
         """
                 Parameters:
                 -----------
@@ -55,6 +60,10 @@ class VK(BaseParser):
 
                     city_id : int, default 2
                         event city (2=>St.Petersburg)
+
+                existed_event_ids : list or SeenIndex, default None
+                    Event ids that we need to skip: VK-123456, etc.
+                    (see escraper.parsers.seen for persistent index)
                 Examples:
                 ---------
                 >>> vk = VK()
@@ -64,6 +73,11 @@ class VK(BaseParser):
                 >>> vk.get_events(request_params=params)
                 <list of events from Санкт-Петербург>
             """
+        return self._run(
+            self._events_flow(request_params=request_params, existed_event_ids=existed_event_ids), incremental=True,
+        )
+
+    def _events_flow(self, request_params=None, existed_event_ids=None):
 
         request_params = request_params or {}
         if 'days' in request_params:
@@ -80,20 +94,19 @@ class VK(BaseParser):
         event_data_general = []
         offset_count_query = 0
         while self.quantity > offset_count_query:
-            res = self.request_events(count=self.count_query, offset=offset_count_query, city_id=city_id)
+            res = yield from self._request_events_flow(count=self.count_query, offset=offset_count_query, city_id=city_id)
             if 'items' not in res: assert f"Error: {res}"
             event_data_general += res['items']
             offset_count_query += self.count_query
             if res['count'] < self.quantity: self.quantity = res['count']
-            time.sleep(0.5)
 
         event_ids = self.get_ids(event_data_general, existed_event_ids)
         event_data_full = []
         for event_ids_divided in divide_list(event_ids, 200):
-            event_data_full += self.get_full_event(event_ids_divided)
-            time.sleep(0.5)
+            event_data_full += yield from self._full_event_flow(event_ids_divided)
 
         event_data_full = self.check_events(event_data_full, days)
+        yield from self._addresses_flow(event_data_full)
 
         events = list()
         for event in event_data_full:
@@ -102,19 +115,28 @@ class VK(BaseParser):
         return events
 
     def request_events(self, q='%20', city_id=2, count=250, offset=0):
+        return self._run(self._request_events_flow(q=q, city_id=city_id, count=count, offset=offset))
+
+    def _request_events_flow(self, q='%20', city_id=2, count=250, offset=0):
         site = f'{self.BASE_URL_API}/groups.search?q={q}&type=event&future=1&city_id={city_id}&count={count}&offset={offset}{self.get_end_str}'
-        req = requests.get(site)
+        req = yield self._fetch(site, listing=True)
+        if req is None: return {}
         events = req.json()
         if 'response' not in events: return {}
         return events['response']
 
-    def get_ids(self, events, existed_event_ids=[]):
+    def get_ids(self, events, existed_event_ids=None):
+        existed_event_ids = seen_index(existed_event_ids)
         return [event['id'] for event in events if self.parser_prefix + str(event['id']) not in existed_event_ids]
 
     def get_full_event(self, ids):
+        return self._run(self._full_event_flow(ids))
+
+    def _full_event_flow(self, ids):
         if len(ids) < 500:
             site = f"{self.BASE_URL_API}/groups.getById?group_ids={ids}&fields=addresses,site,description,status,cover,place,start_date,finish_date{self.get_end_str}"
-            req = requests.get(site)
+            req = yield self._fetch(site, listing=True)
+            if req is None: return []
             response = req.json()
             if 'response' in response:
                 return response['response']
@@ -134,16 +156,33 @@ class VK(BaseParser):
         return events
 
     def add_address(self, event):
-        site = f"{self.BASE_URL_API}/groups.getAddresses?group_id={event['id']}&address_ids={event['addresses']['main_address_id']}&fields=title,address{self.get_end_str}"
-        req = requests.get(site)
-        addresses = req.json()
-        if addresses['response']['count'] > 0:
+        return self._set_address(event, self._request_get(self._address_url(event)))
+
+    def _addresses_flow(self, events):
+        """
+        Fetch addresses of events before parsing, so extractors
+        don't send blocking requests (even for aget_events).
+        """
+        events = [
+            event for event in events
+            if "main_address_id" in event.get('addresses', {}) and "address" not in event['addresses']
+        ]
+        if events:
+            responses = yield [self._fetch(self._address_url(event)) for event in events]
+            for event, response in zip(events, responses):
+                self._set_address(event, response)
+
+    def _address_url(self, event):
+        return f"{self.BASE_URL_API}/groups.getAddresses?group_id={event['id']}&address_ids={event['addresses']['main_address_id']}&fields=title,address{self.get_end_str}"
+
+    def _set_address(self, event, req):
+        addresses = req.json() if req is not None else {}
+        if 'response' in addresses and addresses['response']['count'] > 0:
             event['addresses']['address'] = addresses['response']['items'][0]['address']
             event['addresses']['place_name'] = addresses['response']['items'][0]['title']
         else:
             event['addresses']['address'] = ''
             event['addresses']['place_name'] = ''
-        time.sleep(0.25)
         return event
 
     def _adress(self, event):
@@ -0,0 +1,86 @@
+import sqlite3
+import threading
+import time
+
+
+class WatermarkStore:
+    """
+    Persisted cursors of incremental crawling (sqlite file).
+
+    Parser with store (see BaseParser.watermarks) keeps cursor per
+    source and listing key (city, category): the last created_at of
+    Timepad events, the last fully crawled date of Radario, MTS and
+    Culture listings. The next get_events fetches only newer windows,
+    full_refresh=True ignores stored cursors (and stores new ones).
+
+    Parameters:
+    -----------
+    path : str or Path
+        Store file path (":memory:" for in-memory store).
+
+    Examples:
+    ---------
+    >>> mts = MTS()
+    >>> mts.watermarks = WatermarkStore("~/.cache/escraper-watermarks.sqlite")
+    >>> mts.get_events(request_params=params)  # all days of window
+    >>> mts.get_events(request_params=params)  # only days after the last crawled one
+    >>> mts.get_events(request_params=params, full_refresh=True)  # all days again
+    """
+
+    def __init__(self, path, clock=time.time):
+        self.path = str(path)
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS watermarks ("
+            "source TEXT, key TEXT, value TEXT, updated_at REAL, PRIMARY KEY (source, key))"
+        )
+        self._connection.commit()
+
+    def __repr__(self):
+        return f"<WatermarkStore {self.path!r}>"
+
+    def get(self, source, key):
+        """Stored cursor (string) or None."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM watermarks WHERE source = ? AND key = ?", (source, key)
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def set(self, source, key, value):
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO watermarks VALUES (?, ?, ?, ?)", (source, key, str(value), self.clock())
+            )
+            self._connection.commit()
+
+    def delete(self, source, key=None):
+        """Forget cursor of source for key (all cursors of source if key is None)."""
+        with self._lock:
+            if key is None:
+                self._connection.execute("DELETE FROM watermarks WHERE source = ?", (source,))
+            else:
+                self._connection.execute("DELETE FROM watermarks WHERE source = ? AND key = ?", (source, key))
+            self._connection.commit()
+
+    def items(self, source=None):
+        """Dict of (source, key): cursor."""
+        with self._lock:
+            if source is None:
+                rows = self._connection.execute("SELECT source, key, value FROM watermarks").fetchall()
+            else:
+                rows = self._connection.execute(
+                    "SELECT source, key, value FROM watermarks WHERE source = ?", (source,)
+                ).fetchall()
+        return {(source, key): value for source, key, value in rows}
+
+    def __len__(self):
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM watermarks").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
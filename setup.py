@@ -8,6 +8,8 @@ setuptools.setup(
     name="escraper",
     version="1.1.9.7",
     packages=setuptools.find_packages(),
+    python_requires=">=3.7",
     install_requires=install_requires,
+    extras_require={"async": ["aiohttp>=3.7"]},
     include_package_data=True,
 )
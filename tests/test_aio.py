@@ -0,0 +1,108 @@
+import asyncio
+import json
+
+import pytest
+
+from escraper.parsers import VK, Radario
+from escraper.parsers.ratelimit import RateLimiter
+
+from .testing import FakeServer, radario_event
+
+
+def radario_routes(path):
+    if path.startswith("/events?"):
+        return 200, json.dumps([radario_event(i) for i in (1, 2, 3)])
+    if path.startswith("/events/"):
+        return 200, json.dumps(radario_event(int(path.split("/")[-1])))
+    return 404, ""
+
+
+@pytest.fixture
+def radario(monkeypatch):
+    with FakeServer(radario_routes) as server:
+        monkeypatch.setattr(Radario, "BASE_EVENTS_API", server.url + "/events")
+        radario = Radario()
+        radario.rate_limiter = RateLimiter()
+        yield radario
+
+
+def without_emoji(events):
+    return [event._replace(title=event.title[2:]) for event in events]
+
+
+def test_aget_event(radario):
+    event = asyncio.run(radario.aget_event(event_id=2))
+
+    assert event.id == "RADARIO-2"
+    assert event.title[2:] == "test title 2"
+    assert event.adress == "Test avenue, 1"
+    assert event.price == "500₽"
+
+
+def test_aget_events_same_as_get_events(radario):
+    events = radario.get_events(existed_event_ids=[])
+    async_events = asyncio.run(radario.aget_events(existed_event_ids=[]))
+
+    assert [event.id for event in async_events] == ["RADARIO-1", "RADARIO-2", "RADARIO-3"]
+    assert without_emoji(async_events) == without_emoji(events)
+
+
+def test_aget_events_one_loop(radario):
+    async def crawl():
+        other = Radario()
+        other.rate_limiter = radario.rate_limiter
+        return await asyncio.gather(
+            radario.aget_events(existed_event_ids=[]),
+            other.aget_events(existed_event_ids=["RADARIO-1"]),
+        )
+
+    events, other_events = asyncio.run(crawl())
+
+    assert len(events) == 3
+    assert [event.id for event in other_events] == ["RADARIO-2", "RADARIO-3"]
+
+
+def test_aget_event_without_id(radario):
+    with pytest.raises(ValueError):
+        asyncio.run(radario.aget_event())
+
+
+def test_aget_events_closes_session(radario, recwarn):
+    async def crawl():
+        events = await radario.aget_events(existed_event_ids=[])
+        return events, radario.async_session_pool._session
+
+    events, session = asyncio.run(crawl())
+
+    assert len(events) == 3
+    assert session is None
+    assert not [warning for warning in recwarn if issubclass(warning.category, ResourceWarning)]
+
+
+def test_vk_aget_event_addresses_async(monkeypatch):
+    group = dict(
+        id=7, name="test group", description="text", start_date=2000000000,
+        addresses=dict(main_address_id=1), screen_name="test", cover=dict(enabled=0), site="",
+    )
+    address = dict(address="Test avenue, 1", title="Test club")
+
+    def routes(path):
+        if path.startswith("/groups.getById"):
+            return 200, json.dumps(dict(response=[group]))
+        if path.startswith("/groups.getAddresses"):
+            return 200, json.dumps(dict(response=dict(count=1, items=[address])))
+        return 404, ""
+
+    with FakeServer(routes) as server:
+        vk = VK.__new__(VK)
+        vk.BASE_URL_API = server.url
+        vk.get_end_str = ""
+        vk.city = "Санкт-Петербург"
+        vk.rate_limiter = RateLimiter()
+        monkeypatch.setattr(vk, "_request_get", None)  # no blocking requests in event loop
+
+        event = asyncio.run(vk.aget_event(event_url="https://vk.com/test"))
+
+    assert event.adress == "Test avenue, 1"
+    assert event.place_name == "Test club"
+    assert len(server.requests) == 2
@@ -0,0 +1,211 @@
+import asyncio
+
+import pytest
+
+from pathlib import Path
+
+from escraper.parsers import MTS, Radario
+from escraper.parsers.cache import ResponseCache
+from escraper.parsers.ratelimit import RateLimiter
+
+from .testing import FakeServer
+
+
+TESTDATA = Path(__file__).parent / "test_data" / "test_mts"
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def radario(tmp_path, clock):
+    radario = Radario()
+    radario.rate_limiter = RateLimiter()
+    radario.response_cache = ResponseCache(tmp_path / "cache.sqlite", clock=clock)
+    return radario
+
+
+@pytest.fixture
+def server():
+    with FakeServer(lambda path: (200, '{"path": "%s"}' % path)) as server:
+        yield server
+
+
+def test_cache_hit(radario, server):
+    first = radario._request_get(server.url + "/events/1")
+    second = radario._request_get(server.url + "/events/1")
+
+    assert len(server.requests) == 1
+    assert second.json() == first.json() == {"path": "/events/1"}
+    assert second.from_cache and not hasattr(first, "from_cache")
+
+
+def test_cache_key(radario, server):
+    radario._request_get(server.url + "/events", params={"offset": 0}, listing=True)
+    radario._request_get(server.url + "/events", params={"offset": 20}, listing=True)
+    radario._request_get(server.url + "/events", params={"offset": 0}, headers={"Authorization": "a"}, listing=True)
+    radario._request_get(server.url + "/events", params={"offset": 0}, headers={"User-Agent": "b"}, listing=True)
+
+    assert len(server.requests) == 3
+
+
+def test_cache_ttl(radario, server, clock):
+    radario._request_get(server.url + "/events", listing=True)
+    radario._request_get(server.url + "/events/1")
+
+    clock.now += Radario.CACHE_TTL["listing"] + 1
+    radario._request_get(server.url + "/events", listing=True)
+    radario._request_get(server.url + "/events/1")
+
+    assert server.requests == ["/events", "/events/1", "/events"]
+
+
+@pytest.mark.parametrize("cache_mode, requests_count", [("use", 1), ("refresh", 2), ("bypass", 2)])
+def test_cache_mode(radario, server, cache_mode, requests_count):
+    radario._request_get(server.url + "/events/1")
+    radario.cache_mode = cache_mode
+    radario._request_get(server.url + "/events/1")
+
+    assert len(server.requests) == requests_count
+
+
+def test_cache_async(radario, server):
+    radario._request_get(server.url + "/events/1")
+    response = asyncio.run(radario._arequest_get(server.url + "/events/1"))
+
+    assert response.from_cache
+    assert len(server.requests) == 1
+
+
+def test_cache_bad_response_not_stored(radario):
+    with FakeServer([(404, "")]) as server, pytest.warns(UserWarning):
+        radario._request_get(server.url + "/events/1")
+
+    assert len(radario.response_cache) == 0
+
+
+def test_cache_lru_eviction(tmp_path, clock):
+    body = bytes(range(256)) * 40  # not compressible
+    cache = ResponseCache(tmp_path / "cache.sqlite", max_size=25000, compress_level=0, clock=clock)
+
+    class Response:
+        url = "https://radario.ru"
+        status_code = 200
+        headers = {}
+        encoding = None
+        content = body
+
+    for key in ("a", "b"):
+        clock.now += 1
+        cache.set(key, Response)
+
+    clock.now += 1
+    assert cache.get("a", ttl=60).content == body
+
+    clock.now += 1
+    cache.set("c", Response)
+
+    assert cache.get("b", ttl=60) is None
+    assert cache.get("a", ttl=60) is not None
+    assert cache.get("c", ttl=60) is not None
+    assert cache.size <= 25000
+
+
+def test_cache_compressed(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite")
+
+    class Response:
+        url = "https://radario.ru"
+        status_code = 200
+        headers = {"Content-Type": "text/html; charset=utf-8"}
+        encoding = "utf-8"
+        content = "Концерт ".encode() * 1000
+
+    cache.set("a", Response)
+
+    assert cache.size < len(Response.content) / 10
+    assert cache.get("a", ttl=60).text == "Концерт " * 1000
+
+
+#######################################
+## conditional revalidation
+#######################################
+@pytest.fixture
+def mts_server():
+    body = (TESTDATA / "event_card_1.html").read_text()
+    etag = '"v1"'
+
+    def routes(path):
+        if server.request_headers[-1].get("If-None-Match") == etag:
+            return 304, "", {"ETag": etag}
+        return 200, body, {"ETag": etag, "Content-Type": "text/html; charset=utf-8"}
+
+    with FakeServer(routes) as server:
+        yield server
+
+
+@pytest.fixture
+def mts(tmp_path, clock, monkeypatch):
+    mts = MTS()
+    mts.rate_limiter = RateLimiter()
+    mts.response_cache = ResponseCache(tmp_path / "cache.sqlite", clock=clock)
+
+    mts.parse_calls = 0
+    parse = MTS.parse
+
+    def count_parse(self, *args, **kwargs):
+        self.parse_calls += 1
+        return parse(self, *args, **kwargs)
+
+    monkeypatch.setattr(MTS, "parse", count_parse)
+    return mts
+
+
+def test_revalidation_not_modified(mts, mts_server, clock):
+    event_url = mts_server.url + "/event?eventId=111"
+    event = mts.get_event(event_url=event_url)
+
+    clock.now += MTS.CACHE_TTL["detail"] + 1
+    same_event = mts.get_event(event_url=event_url)
+
+    assert mts_server.request_headers[0].get("If-None-Match") is None
+    assert mts_server.request_headers[1]["If-None-Match"] == '"v1"'
+    assert same_event is event
+    assert mts.parse_calls == 1
+
+    stats = mts.response_cache.stats["mts"]
+    assert (stats.lookups, stats.hits, stats.revalidations, stats.not_modified) == (2, 0, 1, 1)
+    assert stats.not_modified_rate == 1.0
+    assert mts.response_cache.summary()["mts"]["hit_rate"] == 0.5
+
+
+def test_revalidation_refreshes_ttl(mts, mts_server, clock):
+    event_url = mts_server.url + "/event?eventId=111"
+    mts.get_event(event_url=event_url)
+
+    clock.now += MTS.CACHE_TTL["detail"] + 1
+    mts.get_event(event_url=event_url)
+    mts.get_event(event_url=event_url)
+
+    assert len(mts_server.requests) == 2
+    assert mts.response_cache.stats["mts"].hits == 1
+    assert mts.parse_calls == 1
+
+
+def test_revalidation_without_validators(radario, server, clock):
+    radario._request_get(server.url + "/events/1")
+    clock.now += Radario.CACHE_TTL["detail"] + 1
+    radario._request_get(server.url + "/events/1")
+
+    assert "If-None-Match" not in server.request_headers[1]
+    assert radario.response_cache.stats["radario"].revalidations == 0
@@ -0,0 +1,83 @@
+import asyncio
+import time
+from pathlib import Path
+from urllib.parse import unquote
+
+import pytest
+
+from escraper.parsers import MTS
+from escraper.parsers.ratelimit import RateLimiter
+
+from .testing import Cassette, FakeServer
+
+
+TESTDATA = Path(__file__).parent / "test_data" / "test_mts"
+PARAMS = {"date_from": "2024-05-20", "date_to": "2024-05-20", "city": "test_city", "categories": ["ribbon"]}
+
+
+def mts_routes(path):
+    page = TESTDATA / (unquote(path).lstrip("/") + ".html")
+    if not page.exists():
+        return 404, ""
+    return 200, page.read_text(), {"Content-Type": "text/html; charset=utf-8"}
+
+
+def without_emoji(events):
+    return [event._replace(title=event.title[2:]) for event in events]
+
+
+@pytest.fixture
+def mts_cassette(tmp_path, monkeypatch):
+    """MTS get_events recorded from local server, server is stopped after recording."""
+    path = tmp_path / "mts.json.gz"
+
+    with FakeServer(mts_routes) as server:
+        monkeypatch.setattr(MTS, "BASE_URL", server.url)
+        with Cassette(path, mode="record") as cassette:
+            events = new_mts().get_events(request_params=dict(PARAMS), existed_event_ids=[])
+
+    return path, events, len(cassette)
+
+
+def new_mts():
+    mts = MTS()
+    mts.rate_limiter = RateLimiter()
+    return mts
+
+
+def test_cassette_replay(mts_cassette):
+    path, recorded_events, requests_count = mts_cassette
+
+    with Cassette(path) as cassette:
+        events = new_mts().get_events(request_params=dict(PARAMS), existed_event_ids=[])
+
+    assert requests_count == 4  # listing page and 3 events
+    assert len(cassette) == requests_count
+    assert len(events) == 3
+    assert without_emoji(events) == without_emoji(recorded_events)
+
+
+def test_cassette_replay_async(mts_cassette):
+    path, recorded_events, _ = mts_cassette
+
+    with Cassette(path):
+        events = asyncio.run(new_mts().aget_events(request_params=dict(PARAMS), existed_event_ids=[]))
+
+    assert without_emoji(events) == without_emoji(recorded_events)
+
+
+def test_cassette_latency(mts_cassette):
+    path, _, requests_count = mts_cassette
+
+    start = time.perf_counter()
+    with Cassette(path, latency=0.05):
+        new_mts().get_events(request_params=dict(PARAMS), existed_event_ids=[])
+
+    assert time.perf_counter() - start >= 0.05 * requests_count
+
+
+def test_cassette_unknown_request(mts_cassette):
+    path, _, _ = mts_cassette
+
+    with Cassette(path), pytest.raises(KeyError, match="not found in cassette"):
+        new_mts().get_event(event_url="http://127.0.0.1:1/unknown")
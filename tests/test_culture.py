@@ -0,0 +1,65 @@
+import random
+from datetime import datetime, timedelta
+
+from escraper.parsers import Culture
+
+
+STRF = Culture.DATETIME_STRF
+
+
+def seance(start, hours=2):
+    return dict(startDate=start.strftime(STRF), endDate=(start + timedelta(hours=hours)).strftime(STRF))
+
+
+def loop_date_from_to(event_json):
+    """Previous way to find date_from and date_to (walk all seances)."""
+    today = datetime.today()
+    date_from, date_to = None, None
+    for date in event_json['seances']:
+        if date_from is None:
+            if datetime.strptime(date['startDate'], STRF) > today:
+                date_from = datetime.strptime(date['startDate'], STRF)
+                date_to = datetime.strptime(date['endDate'], STRF)
+        else:
+            if datetime.strptime(date['endDate'], STRF) - date_from < timedelta(days=7):
+                date_to = datetime.strptime(date['endDate'], STRF)
+            else:
+                break
+    return date_from.astimezone(Culture.TIMEZONE), date_to.astimezone(Culture.TIMEZONE)
+
+
+def test_culture_date_window():
+    rnd = random.Random(0)
+    now = datetime.today().replace(microsecond=0)
+
+    for _ in range(200):
+        starts = sorted(now + timedelta(hours=rnd.randrange(-500, 1000)) for _ in range(rnd.randrange(1, 50)))
+        starts.append(now + timedelta(days=50))
+        event_json = dict(seances=[seance(start, hours=rnd.choice([1, 3, 24 * 8])) for start in starts])
+
+        culture = Culture()
+        assert (culture._date_from(event_json), culture._date_to(event_json)) == loop_date_from_to(event_json)
+
+
+def test_culture_seances():
+    now = datetime.today().replace(microsecond=0)
+    event_json = dict(seances=[seance(now + timedelta(days=2)), seance(now - timedelta(days=1))])
+
+    culture = Culture()
+    seances = culture.seances(event_json)
+
+    assert [start.replace(tzinfo=None) for start, _ in seances] == [
+        (now - timedelta(days=1)).astimezone(Culture.TIMEZONE).replace(tzinfo=None),
+        (now + timedelta(days=2)).astimezone(Culture.TIMEZONE).replace(tzinfo=None),
+    ]
+    assert culture._date_from(event_json) == seances[1][0]
+    assert culture._date_to(event_json) == seances[1][1]
+
+
+def test_culture_no_future_seances():
+    event_json = dict(seances=[seance(datetime.today() - timedelta(days=1))])
+
+    culture = Culture()
+    assert culture._date_from(event_json) is None
+    assert culture._date_to(event_json) is None
+    assert culture._date_from_to(event_json) is None
@@ -0,0 +1,79 @@
+import random
+from datetime import datetime
+
+import pytest
+import pytz
+
+from escraper.parsers.dates import parse_datetime, _FAST_FORMATS
+
+
+MOSCOW = pytz.timezone("Europe/Moscow")
+
+VALUES = [
+    ("2020-09-10", "%Y-%m-%d"),
+    ("2020-09-10T19:00:00+03:00", "%Y-%m-%dT%H:%M:%S%z"),
+    ("2020-09-10T19:00:00+0300", "%Y-%m-%dT%H:%M:%S%z"),
+    ("2020-09-10T19:00:00-05:30", "%Y-%m-%dT%H:%M:%S%z"),
+    ("2020-09-10T19:00:00Z", "%Y-%m-%dT%H:%M:%S%z"),
+    ("2020-09-10T19:00:00.000+03:00", "%Y-%m-%dT%H:%M:%S.%f%z"),
+    ("2020-09-10T19:00:00.12+03:00", "%Y-%m-%dT%H:%M:%S.%f%z"),
+    ("2020-09-10T19:00:00.123456Z", "%Y-%m-%dT%H:%M:%S.%fZ"),
+    ("20200910T160000Z", "%Y%m%dT%H%M%SZ"),
+    ("10.09.2020 19:00", "%d.%m.%Y %H:%M"),
+    # not fast path cases, strptime parses them
+    ("2020-9-1T19:00:00+03:00", "%Y-%m-%dT%H:%M:%S%z"),
+    ("2020-09-10T19:00:00+03:00:30", "%Y-%m-%dT%H:%M:%S%z"),
+]
+
+BAD_VALUES = [
+    ("2020-02-30", "%Y-%m-%d"),
+    ("2020-09-10T25:00:00+03:00", "%Y-%m-%dT%H:%M:%S%z"),
+    ("2020-09-10T19:00:00+03:99", "%Y-%m-%dT%H:%M:%S%z"),
+    ("2020-09-10T19:00:00.000", "%Y-%m-%dT%H:%M:%S.%f%z"),
+    ("2020-09-10T19:00:00", "%Y-%m-%dT%H:%M:%S.%fZ"),
+]
+
+
+@pytest.mark.parametrize("value, fmt", VALUES)
+def test_parse_datetime(value, fmt):
+    expected = datetime.strptime(value, fmt)
+    dt = parse_datetime(value, fmt)
+
+    assert dt == expected
+    assert repr(dt) == repr(expected)
+    # naive datetimes are converted as local time, the same as before
+    assert parse_datetime(value, fmt, MOSCOW) == expected.astimezone(MOSCOW)
+    assert parse_datetime(value, fmt, MOSCOW).tzinfo == expected.astimezone(MOSCOW).tzinfo
+
+
+@pytest.mark.parametrize("value, fmt", BAD_VALUES)
+def test_parse_datetime_errors(value, fmt):
+    with pytest.raises(ValueError):
+        datetime.strptime(value, fmt)
+    with pytest.raises(ValueError):
+        parse_datetime(value, fmt)
+
+
+def test_parse_datetime_random():
+    rnd = random.Random(0)
+    for _ in range(2000):
+        dt = datetime(
+            rnd.randrange(1990, 2040), rnd.randrange(1, 13), rnd.randrange(1, 29),
+            rnd.randrange(24), rnd.randrange(60), rnd.randrange(60), rnd.randrange(10 ** 6),
+        )
+        offset = rnd.choice(["Z", "+03:00", "-0130", "+00:00"])
+        fmt = rnd.choice(sorted(_FAST_FORMATS))
+        value = dt.strftime(fmt.replace("%z", offset))[:rnd.choice([None, -1])]
+
+        try:
+            expected = datetime.strptime(value, fmt)
+        except ValueError:
+            with pytest.raises(ValueError):
+                parse_datetime(value, fmt)
+            continue
+        assert repr(parse_datetime(value, fmt)) == repr(expected)
+
+
+def test_parse_datetime_cache():
+    value = "2020-09-10T19:00:00+03:00"
+    assert parse_datetime(value, "%Y-%m-%dT%H:%M:%S%z") is parse_datetime(value, "%Y-%m-%dT%H:%M:%S%z")
@@ -0,0 +1,49 @@
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+
+from escraper.dedup import DuplicateIndex, normalize, trigrams
+
+
+Event = namedtuple("Event", ["id", "title", "date_from", "place_name"])
+MSK = timezone(timedelta(hours=3))
+
+
+def test_normalize():
+    assert normalize("🎸 Концерт группы «Ёлки»!") == "концерт группы елки"
+    assert normalize(None) == ""
+    assert trigrams("Ёлки") == {" ел", "елк", "лки", "ки "}
+
+
+def test_duplicate_index():
+    date_from = datetime(2024, 5, 1, 19, tzinfo=MSK)
+    index = DuplicateIndex()
+
+    assert index.add(Event("RADARIO-1", "🎸 Концерт группы «Ёлки»", date_from, "Клуб «Космонавт»")) == []
+    # another place spelling, the same place word
+    assert index.add(Event("MTS-1", "Ёлки. Концерт группы", date_from, "Космонавт")) == ["RADARIO-1"]
+    # another event at the same place and time
+    assert index.add(Event("MTS-2", "Лекция о космосе", date_from, "Космонавт")) == []
+    # the same title in another place and another day
+    assert index.add(Event("MTS-3", "Концерт группы Ёлки", date_from, "Ленинград Центр")) == []
+    assert index.add(Event("MTS-4", "Концерт группы Ёлки", date_from + timedelta(days=1), "Космонавт")) == []
+    # date in another timezone, in the neighbour date bucket
+    utc = datetime(2024, 5, 1, 14, 5, tzinfo=timezone.utc)
+    assert index.add(Event("TIMEPAD-1", "Концерт группы Елки", utc, "Космонавт клуб")) == ["RADARIO-1", "MTS-1"]
+    assert index.add(Event("MTS-1", "Ёлки. Концерт группы", date_from, "Космонавт")) == []
+
+    assert len(index) == 6
+    assert [[event.id for event in cluster] for cluster in index.clusters()] == [["RADARIO-1", "MTS-1", "TIMEPAD-1"]]
+    assert [event.id for event in index.cluster("MTS-2")] == ["MTS-2"]
+
+
+def test_duplicate_index_without_date():
+    index = DuplicateIndex()
+    index.update(
+        [
+            Event("VK-1", "Концерт", None, ""),
+            Event("VK-2", "Концерт", None, ""),
+            Event("VK-3", "Концерт", datetime(2024, 5, 1, 19), ""),
+            Event("VK-4", "Концерт", datetime(2024, 5, 1, 20), None),
+        ]
+    )
+    assert [[event.id for event in cluster] for cluster in index.clusters()] == [["VK-3", "VK-4"]]
@@ -0,0 +1,106 @@
+import json
+import pickle
+
+import pytest
+
+from escraper.parsers import ALL_EVENT_TAGS, Radario
+from escraper.parsers.cache import ResponseCache
+from escraper.parsers.fingerprints import UNCHANGED, FingerprintStore, fingerprint
+from escraper.parsers.ratelimit import RateLimiter
+
+from .testing import FakeServer, radario_event
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = FingerprintStore(tmp_path / "fingerprints.sqlite")
+    yield store
+    store.close()
+
+
+def test_fingerprint():
+    event = radario_event(1)
+
+    assert fingerprint(event) == fingerprint(dict(reversed(list(event.items()))))
+    assert fingerprint(event) != fingerprint(dict(event, minPrice=600.0))
+    assert fingerprint(event) != fingerprint(radario_event(2))
+    assert len(fingerprint("<div>page</div>")) == 32
+
+
+def test_fingerprint_store(store, tmp_path):
+    assert store.update("radario", "RADARIO-1", "a") == "new"
+    assert store.update("radario", "RADARIO-1", "a") == "unchanged"
+    assert store.update("radario", "RADARIO-1", "b") == "changed"
+    assert store.get("radario", "RADARIO-1") == "b"
+    assert store.summary() == {"radario": dict(new=1, changed=1, unchanged=1)}
+
+    assert FingerprintStore(tmp_path / "fingerprints.sqlite").get("radario", "RADARIO-1") == "b"
+    store.delete("radario")
+    assert len(store) == 0
+
+
+def parse_flow(parser, events, tags=ALL_EVENT_TAGS):
+    # get_events flow without requests
+    return [parser.parse(event, tags=tags) for event in events]
+    yield
+
+
+def test_parse_unchanged(store):
+    radario = Radario()
+    radario.fingerprints = store
+
+    def run(events, tags=ALL_EVENT_TAGS, lazy=False):
+        radario.lazy_records = lazy
+        return [event.id for event in radario._run(parse_flow(radario, events, tags), incremental=True)]
+
+    assert run([radario_event(1)]) == ["RADARIO-1"]
+    assert run([radario_event(1)]) == []
+    assert run([dict(radario_event(1), minPrice=600.0)]) == ["RADARIO-1"]
+    assert run([dict(radario_event(1), minPrice=600.0)], lazy=True) == []
+    # other tags are extracted again
+    assert run([dict(radario_event(1), minPrice=600.0)], tags=("id", "title")) == ["RADARIO-1"]
+
+    # get_event and parse outside get_events flows don't skip events
+    assert radario.parse(radario_event(1), tags=ALL_EVENT_TAGS).id == "RADARIO-1"
+    assert radario.parse(radario_event(2), tags=ALL_EVENT_TAGS).id == "RADARIO-2"
+    assert store.get("radario", "RADARIO-2") is None
+
+    assert radario._without_unchanged([UNCHANGED, None, 1]) == [None, 1]
+    assert radario._without_unchanged(UNCHANGED) is None
+    assert pickle.loads(pickle.dumps(UNCHANGED)) is UNCHANGED
+
+
+def test_parse_failed_run_not_stored(store):
+    radario = Radario()
+    radario.fingerprints = store
+
+    with pytest.raises(TypeError):
+        radario._run(parse_flow(radario, [radario_event(1)], tags=("title", "nonexistent")), incremental=True)
+    with pytest.raises(KeyError):
+        radario._run(parse_flow(radario, [radario_event(1), dict(id=2)], tags=("id", "title")), incremental=True)
+
+    assert len(store) == 0
+    events = radario._run(parse_flow(radario, [radario_event(1)], tags=("id", "title")), incremental=True)
+    assert [event.id for event in events] == ["RADARIO-1"]
+    assert store.summary() == {"radario": dict(new=1, changed=0, unchanged=0)}
+
+
+def test_fingerprints_with_response_cache(tmp_path, store):
+    def routes(path):
+        if path.startswith("/events?"):
+            return 200, json.dumps([radario_event(i) for i in (1, 2, 3)])
+        return 200, json.dumps(radario_event(int(path.split("/")[-1])))
+
+    with FakeServer(routes) as server:
+        radario = Radario()
+        radario.BASE_EVENTS_API = server.url + "/events"
+        radario.rate_limiter = RateLimiter()
+        radario.response_cache = ResponseCache(tmp_path / "cache.sqlite")
+        radario.fingerprints = store
+
+        assert len(radario.get_events(max_workers=1)) == 3
+        # cached responses are compared with fingerprints too
+        assert radario.get_events(max_workers=1) == []
+        assert radario.get_event(event_id=2).id == "RADARIO-2"
+
+    assert store.summary() == {"radario": dict(new=3, changed=0, unchanged=3)}
@@ -5,7 +5,7 @@ from pathlib import Path
 
 from escraper.parsers import MTS
 
-from .testing import Response
+from .testing import Response, patch_requests_get
 
 
 TESTDATA = Path(__file__).parent / "test_data" / "test_mts"
@@ -31,7 +31,7 @@ def requests_get_event(monkeypatch):
 
         return Response(ok=True, text=text)
 
-    monkeypatch.setattr(requests, "get", get)
+    patch_requests_get(monkeypatch, get)
     monkeypatch.setattr(MTS, "BASE_URL", str(TESTDATA) + "/")
     #monkeypatch.setattr(MTS, "BASE_EVENTS_API", str(TESTDATA) + "/")
 
@@ -88,7 +88,7 @@ def requests_get_events(monkeypatch):
 
         return Response(ok=True, text=text)
 
-    monkeypatch.setattr(requests, "get", get)
+    patch_requests_get(monkeypatch, get)
     monkeypatch.setattr(MTS, "BASE_URL", str(TESTDATA) )
 
 
@@ -0,0 +1,42 @@
+import json
+
+import pytest
+
+from json.decoder import JSONDecodeError
+from pathlib import Path
+
+from escraper.parsers.nextdata import next_data, script_json, LD_JSON_SCRIPT
+
+
+TESTDATA = Path(__file__).parent / "test_data" / "test_mts"
+
+
+def split_next_data(body):
+    """Previous way to get __NEXT_DATA__."""
+    json_body = body.split('<script id="__NEXT_DATA__" type="application/json">')[-1].split('</script>')[0]
+    return json.loads(json_body)
+
+
+@pytest.mark.parametrize("page", sorted(TESTDATA.glob("event_card_*.html")), ids=lambda page: page.name)
+def test_next_data_fixtures(page):
+    body = page.read_text()
+
+    assert next_data(body) == split_next_data(body)
+    assert next_data(body, "props.pageProps") == split_next_data(body)["props"]["pageProps"]
+
+
+def test_next_data_path():
+    state = {"props": {"pageProps": {"event": {"title": "</script>"}}}}
+    body = (
+        f'<script type="application/ld+json">{{"image": 1}}</script>'
+        f'<script id="__NEXT_DATA__" type="application/json">\n{json.dumps(state)}\n</script><div></div>'
+    )
+
+    assert next_data(body, "props.pageProps.event") == {"title": "</script>"}
+    assert next_data(body, ("props", "pageProps")) == state["props"]["pageProps"]
+    assert script_json(body, LD_JSON_SCRIPT) == {"image": 1}
+
+
+def test_next_data_missing():
+    with pytest.raises(JSONDecodeError):
+        next_data("<html></html>")
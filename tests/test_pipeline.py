@@ -0,0 +1,91 @@
+import json
+import pickle
+from pathlib import Path
+
+import pytest
+
+from escraper.parsers import QTickets, Radario
+from escraper.parsers.cache import ResponseCache
+from escraper.parsers.pipeline import Payload, ParseStage, fetch_payloads, parse_payloads
+from escraper.parsers.ratelimit import RateLimiter
+from escraper.parsers.retry import RetryPolicy
+from escraper.parsers.stats import CrawlStats
+
+from .testing import FakeServer, radario_event
+
+
+QTICKETS_PAGE = Path(__file__).parent / "test_data" / "test_qtickets" / "event_card.html"
+
+# title has random emoji
+TAGS = ("id", "url", "adress", "place_name", "price", "full_text")
+
+
+@pytest.fixture
+def radario():
+    radario = Radario()
+    radario.rate_limiter = RateLimiter()
+    radario.DETAIL_RETRY_POLICY = RetryPolicy(max_retries=0, sleep=lambda delay: None)
+    return radario
+
+
+def test_fetch_payloads(radario):
+    def script(path):
+        if path.endswith("/2"):
+            return 404, ""
+        return 200, json.dumps(radario_event(int(path.split("/")[-1])))
+
+    with FakeServer(script) as server, pytest.warns(UserWarning):
+        urls = [f"{server.url}/events/{event_id}" for event_id in (1, 2, 3)]
+        payloads = fetch_payloads(radario, urls, max_workers=2, json=True)
+
+    assert [payload.url for payload in payloads] == urls
+    assert payloads[0].body == radario_event(1)
+    assert payloads[1].body is None
+    assert isinstance(payloads[1].error, ValueError)
+    assert payloads[2].body == radario_event(3)
+
+
+@pytest.mark.parametrize("max_workers", [0, 2])
+def test_parse_stage_order(radario, max_workers):
+    payloads = [Payload(f"url/{event_id}", radario_event(event_id)) for event_id in range(40)]
+    payloads[5] = Payload("url/5", None, ValueError("fetch failed"))
+    payloads[7] = Payload("url/7", dict(id=7))
+
+    with ParseStage(radario, tags=TAGS, max_workers=max_workers, chunksize=3) as stage:
+        events = list(stage.map(payloads))
+
+    expected = [radario.parse(payload.body, tags=TAGS) for payload in payloads if payload.url not in ("url/5", "url/7")]
+
+    assert isinstance(events.pop(5), ValueError)
+    assert isinstance(events.pop(6), KeyError)
+    assert events == expected
+
+
+def test_parse_stage_raise(radario):
+    payloads = [Payload("url/1", radario_event(1)), Payload("url/2", dict(id=2))]
+
+    with pytest.raises(KeyError):
+        parse_payloads(radario, payloads, tags=TAGS, max_workers=0, return_exceptions=False)
+
+
+def test_parse_stage_pages():
+    qtickets = QTickets()
+    body = QTICKETS_PAGE.read_text()
+    payloads = [Payload("https://spb.qtickets.events/1", body)] * 5
+
+    events = parse_payloads(qtickets, payloads, tags=TAGS, max_workers=2)
+
+    assert events == [qtickets.parse(qtickets._event_data(body), tags=TAGS)] * 5
+
+
+def test_parse_snapshot(radario, tmp_path):
+    radario.response_cache = ResponseCache(tmp_path / "cache.sqlite")
+    radario.stats = CrawlStats()
+    radario.session_pool
+
+    snapshot = pickle.loads(pickle.dumps(radario._parse_snapshot()))
+
+    assert snapshot.response_cache is None
+    assert snapshot.stats is None
+    assert snapshot.timedelta_hours == radario.timedelta_hours
+    assert radario.response_cache is not None
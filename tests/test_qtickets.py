@@ -0,0 +1,45 @@
+from pathlib import Path
+
+import pytest
+
+from bs4 import BeautifulSoup
+
+from escraper.parsers import ALL_EVENT_TAGS, QTickets
+
+
+TESTDATA = Path(__file__).parent / "test_data" / "test_qtickets"
+
+# title has random emoji
+TAGS = tuple(tag for tag in ALL_EVENT_TAGS if tag not in ("title", "date_from", "date_to"))
+
+
+@pytest.fixture
+def body():
+    return (TESTDATA / "event_card.html").read_text()
+
+
+def test_qtickets_event_fields(body):
+    soup = BeautifulSoup(body, "lxml")
+    fields = QTickets()._event_data(body)
+
+    # the same values as from full soup
+    assert fields["address"] == soup.find("div", {"class": "address"}).text.strip()
+    assert fields["date_from_to"] == soup.find("div", {"class": "event-info"}).find("time").text.strip()
+    assert fields["text"] == soup.find("div", {"class": "text"}).text
+    assert fields["poster_imag"] == soup.find("div", {"class": "center_area"}).find("img")["src"]
+    assert fields["title"] == soup.find("section", {"id": "modal_content"}).find("h1").text.strip()
+    assert fields["url"] == soup.find("link", {"rel": "canonical"})["href"]
+
+
+def test_qtickets_parse(body):
+    event = QTickets().parse(QTickets()._event_data(body), tags=TAGS)
+
+    assert event.id == "QT-12345"
+    assert event.url == "https://spb.qtickets.events/12345-kontsert-gruppy-test"
+    assert event.adress == "Бронницкая улица, 24, "
+    assert event.place_name == "Клуб Космонавт"
+    assert event.price == "1500 ₽"
+    assert event.is_registration_open
+    assert event.poster_imag == "https://qtickets.events/storage/poster.jpg"
+    assert event.date_from_to == "пятница 12 мая, 19:00"
+    assert event.full_text.startswith("Группа Test «впервые» в Петербурге.")
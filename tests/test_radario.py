@@ -1,11 +1,19 @@
+import json
+import threading
+import time
+
 import pytest
 import requests
 from datetime import datetime
 from pathlib import Path
 
 from escraper.parsers import Radario
+from escraper.parsers.fingerprints import FingerprintStore
+from escraper.parsers.retry import RetryPolicy
+from escraper.parsers.seen import SqliteSeenIndex
+from escraper.parsers.watermarks import WatermarkStore
 
-from .testing import Response
+from .testing import FakeServer, Response, patch_requests_get, radario_event
 
 
 TESTDATA = Path(__file__).parent / "test_data" / "test_radario"
@@ -35,7 +43,7 @@ def requests_get_events(monkeypatch):
 
         return Response(ok=True, text=text)
 
-    monkeypatch.setattr(requests, "get", get)
+    patch_requests_get(monkeypatch, get)
     monkeypatch.setattr(Radario, "BASE_URL", str(TESTDATA / "event_card_1"))
     monkeypatch.setattr(Radario, "BASE_EVENTS_API", str(TESTDATA) + "/")
 
@@ -68,7 +76,9 @@ def requests_get_empty(monkeypatch):
     def get(*args, **kwargs):
         return Response(ok=False)
 
-    monkeypatch.setattr(requests, "get", get)
+    patch_requests_get(monkeypatch, get)
+    monkeypatch.setattr(Radario, "LISTING_RETRY_POLICY", RetryPolicy(sleep=lambda delay: None))
+    monkeypatch.setattr(Radario, "DETAIL_RETRY_POLICY", RetryPolicy(sleep=lambda delay: None))
 
 
 def test_radario_get_events_empty_online(requests_get_empty):
@@ -111,7 +121,7 @@ def requests_get_adress_online(monkeypatch):
 
         return Response(ok=True, text=text)
 
-    monkeypatch.setattr(requests, "get", get)
+    patch_requests_get(monkeypatch, get)
     monkeypatch.setattr(Radario, "BASE_URL", str(TESTDATA / "event_card_2"))
     monkeypatch.setattr(Radario, "BASE_EVENTS_API", str(TESTDATA) + "/")
 
@@ -133,7 +143,7 @@ def requests_get_adress_saint_petersburg(monkeypatch):
 
         return Response(ok=True, text=text)
 
-    monkeypatch.setattr(requests, "get", get)
+    patch_requests_get(monkeypatch, get)
     monkeypatch.setattr(Radario, "BASE_URL", str(TESTDATA / "event_card_3"))
     monkeypatch.setattr(Radario, "BASE_EVENTS_API", str(TESTDATA) + "/")
 
@@ -155,7 +165,7 @@ def requests_get_adress_without_cityname(monkeypatch):
 
         return Response(ok=True, text=text)
 
-    monkeypatch.setattr(requests, "get", get)
+    patch_requests_get(monkeypatch, get)
     monkeypatch.setattr(Radario, "BASE_URL", str(TESTDATA / "event_card_4"))
     monkeypatch.setattr(Radario, "BASE_EVENTS_API", str(TESTDATA) + "/")
 
@@ -189,7 +199,7 @@ def test_radario_date_from_to(monkeypatch, test_file, date_from, date_to):
 
         return Response(ok=True, text=text)
 
-    monkeypatch.setattr(requests, "get", get)
+    patch_requests_get(monkeypatch, get)
     monkeypatch.setattr(Radario, "BASE_URL", str(TESTDATA / test_file))
     monkeypatch.setattr(Radario, "BASE_EVENTS_API", str(TESTDATA) + "/")
 
@@ -199,3 +209,94 @@ def test_radario_date_from_to(monkeypatch, test_file, date_from, date_to):
 
     event = events[0]
     assert event.date_from == date_from and event.date_to == date_to
+
+
+#######################################
+## radario concurrent get_events
+#######################################
+@pytest.fixture
+def radario_server(monkeypatch):
+    lock = threading.Lock()
+    state = dict(in_flight=0, max_in_flight=0, last_page=3)
+
+    def routes(path):
+        with lock:
+            state["in_flight"] += 1
+            state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        time.sleep(0.02)
+        with lock:
+            state["in_flight"] -= 1
+
+        if path.startswith("/events?"):
+            offset = int(path.split("offset=")[1].split("&")[0])
+            ids = range(offset, offset + (21 if offset == 0 else state["last_page"]))
+            return 200, json.dumps([radario_event(i) for i in ids])
+        return 200, json.dumps(radario_event(int(path.split("/")[-1])))
+
+    with FakeServer(routes) as server:
+        monkeypatch.setattr(Radario, "BASE_EVENTS_API", server.url + "/events")
+        server.state = state
+        yield server
+
+
+def test_radario_get_events_concurrent(radario_server):
+    existed_event_ids = ["RADARIO-5"]
+    events = Radario().get_events(existed_event_ids=existed_event_ids, max_workers=4)
+
+    expected_ids = [f"RADARIO-{i}" for i in range(23) if i != 5]
+    assert [event.id for event in events] == expected_ids
+    assert existed_event_ids == ["RADARIO-5"] + expected_ids
+    assert 1 < radario_server.state["max_in_flight"] <= 4
+
+
+def test_radario_get_events_sequential(radario_server):
+    events = Radario().get_events(existed_event_ids=[], max_workers=1)
+
+    assert [event.id for event in events] == [f"RADARIO-{i}" for i in range(23)]
+    assert radario_server.state["max_in_flight"] == 1
+
+
+def test_radario_get_events_seen_index(radario_server, tmp_path):
+    with SqliteSeenIndex(tmp_path / "seen.sqlite") as seen:
+        seen.add("RADARIO-5")
+        events = Radario().get_events(existed_event_ids=seen, max_workers=1)
+        assert len(events) == 22
+        assert len(seen) == 23
+
+    with SqliteSeenIndex(tmp_path / "seen.sqlite") as seen:
+        assert Radario().get_events(existed_event_ids=seen, max_workers=1) == []
+
+
+def test_radario_get_events_watermarks(radario_server, tmp_path):
+    radario = Radario()
+    radario.watermarks = WatermarkStore(tmp_path / "watermarks.sqlite")
+
+    radario.get_events(max_workers=1)
+    first_to = radario_server.requests[0].split("to=")[1].split("&")[0]
+    radario_server.requests.clear()
+
+    radario.get_events(max_workers=1)
+    assert radario_server.requests[0].split("from=")[1].split("&")[0] == first_to
+
+    radario_server.requests.clear()
+    radario.get_events(max_workers=1, full_refresh=True)
+    assert radario_server.requests[0].split("from=")[1].split("&")[0] != first_to
+
+
+def test_radario_get_events_watermarks_offset_cap(radario_server, tmp_path):
+    # listing is cut by offset cap, window is not crawled completely
+    radario_server.state["last_page"] = 21
+    radario = Radario()
+    radario.watermarks = WatermarkStore(tmp_path / "watermarks.sqlite")
+    radario.get_events(max_workers=1)
+
+    assert len(radario.watermarks) == 0
+
+
+def test_radario_get_events_fingerprints(radario_server, tmp_path):
+    radario = Radario()
+    radario.fingerprints = FingerprintStore(tmp_path / "fingerprints.sqlite")
+
+    assert len(radario.get_events(max_workers=1)) == 23
+    assert radario.get_events(max_workers=1) == []
+    assert radario.fingerprints.summary() == {"radario": dict(new=23, changed=0, unchanged=23)}
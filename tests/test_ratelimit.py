@@ -0,0 +1,78 @@
+import asyncio
+
+from escraper.parsers import VK, Radario
+from escraper.parsers.ratelimit import RateLimiter, TokenBucket
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = list()
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_token_bucket_sleeps_only_when_empty():
+    clock = Clock()
+    bucket = TokenBucket(rate=2, burst=3, clock=clock, sleep=clock.sleep)
+
+    for _ in range(3):
+        bucket.acquire()
+    assert clock.sleeps == []
+
+    bucket.acquire()
+    assert clock.sleeps == [0.5]
+
+    clock.now += 10
+    bucket.acquire()
+    assert clock.sleeps == [0.5]
+
+
+def test_token_bucket_async():
+    clock = Clock()
+    bucket = TokenBucket(rate=1000, burst=1, clock=clock)
+
+    async def acquire_all():
+        return [await bucket.acquire_async() for _ in range(2)]
+
+    assert asyncio.run(acquire_all()) == [0.0, 0.001]
+
+
+def test_rate_limiter_hosts():
+    clock = Clock()
+    limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+    limiter.set_rate("ticketscloud.org", rate=1, burst=1)
+
+    limiter.acquire("https://org1.ticketscloud.org/")
+    limiter.acquire("https://org2.ticketscloud.org/")
+    limiter.acquire("https://radario.ru/events")
+    assert clock.sleeps == []
+
+    limiter.acquire("https://org1.ticketscloud.org/event")
+    assert clock.sleeps == [1.0]
+
+
+def test_rate_limiter_overrides():
+    limiter = RateLimiter()
+    limiter.set_rate("api.vk.com", rate=10, burst=5)
+
+    vk = VK.__new__(VK)
+    vk.rate_limiter = limiter
+
+    assert limiter.bucket("api.vk.com").rate == 10
+    assert vk.rate_limiter is limiter
+
+
+def test_parser_default_rates():
+    limiter = RateLimiter()
+    radario = Radario()
+    radario.rate_limiter = limiter
+
+    bucket = limiter.bucket("radario.ru")
+    assert (bucket.rate, bucket.burst) == Radario.RATE_LIMITS["radario.ru"]
+    assert Radario().rate_limiter is RateLimiter.shared()
@@ -0,0 +1,79 @@
+import pickle
+
+from escraper.parsers import ALL_EVENT_TAGS, Radario
+from escraper.parsers.records import event_type
+
+from .testing import radario_event
+
+
+# title has random emoji
+TAGS = tuple(tag for tag in ALL_EVENT_TAGS if tag != "title")
+
+
+def test_event_type_cached():
+    radario = Radario()
+    first = radario.parse(radario_event(1), tags=ALL_EVENT_TAGS)
+    second = radario.parse(radario_event(2), tags=list(ALL_EVENT_TAGS))
+
+    assert type(first) is type(second) is event_type(ALL_EVENT_TAGS)
+    assert first._fields == ALL_EVENT_TAGS
+    assert not hasattr(first, "__dict__")
+    assert type(radario.parse(radario_event(1), tags=("id",))) is not type(first)
+
+
+def test_event_pickle():
+    events = [Radario().parse(radario_event(event_id), tags=ALL_EVENT_TAGS) for event_id in range(3)]
+    restored = pickle.loads(pickle.dumps(events))
+
+    assert restored == events
+    assert type(restored[0]) is type(events[0])
+    assert restored[0]._asdict() == events[0]._asdict()
+
+
+def test_lazy_event():
+    radario = Radario()
+    calls = list()
+    full_text = radario._full_text
+    radario._full_text = lambda event: calls.append(event["id"]) or full_text(event)
+
+    eager = radario.parse(radario_event(1), tags=TAGS, lazy=False)
+    calls.clear()
+    lazy = radario.parse(radario_event(1), tags=TAGS, lazy=True)
+
+    assert lazy.id == eager.id
+    assert lazy.date_from_to == eager.date_from_to  # date_from and date_to computed first
+    assert calls == []
+    assert lazy.materialize() == eager
+    assert type(lazy.materialize()) is type(eager)
+    assert pickle.loads(pickle.dumps(lazy)) == eager
+
+
+def test_lazy_records_snapshot():
+    events_data = [
+        dict(radario_event(event_id), beginDate=f"2024-01-0{event_id}T19:00:00.000+03:00") for event_id in (1, 2, 3)
+    ]
+    radario = Radario()
+    radario.lazy_records = True
+    lazy_events = [radario.parse(event_data, tags=("id", "date_from_to")) for event_data in events_data]
+
+    radario.lazy_records = False
+    eager_events = [
+        radario.parse(event_data, tags=("id", "date_from", "date_to", "date_from_to")) for event_data in events_data
+    ]
+
+    assert [(event.id, event.date_from_to) for event in lazy_events] == [
+        (event.id, event.date_from_to) for event in eager_events
+    ]
+
+
+def test_memo_per_event():
+    radario = Radario()
+    calls = list()
+    remove_html_tags = radario.remove_html_tags
+    radario.remove_html_tags = lambda data: calls.append(data) or remove_html_tags(data)
+
+    event = radario.parse(radario_event(1), tags=("full_text", "post_text"))
+    radario.parse(radario_event(2), tags=("post_text", "full_text"))
+
+    assert len(calls) == 2
+    assert event.post_text == radario.prepare_post_text(event.full_text)
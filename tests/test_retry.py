@@ -0,0 +1,126 @@
+import pytest
+import requests
+
+from escraper.parsers import Radario
+from escraper.parsers.retry import RetryBudget, RetryPolicy, parse_retry_after
+
+from .testing import FakeServer, Response
+
+
+@pytest.fixture
+def radario():
+    sleeps = list()
+
+    radario = Radario()
+    radario.sleeps = sleeps
+    radario.LISTING_RETRY_POLICY = RetryPolicy(max_retries=5, base_delay=0.01, sleep=sleeps.append)
+    radario.DETAIL_RETRY_POLICY = RetryPolicy(max_retries=1, base_delay=0.01, sleep=sleeps.append)
+    return radario
+
+
+def test_retry_on_server_errors(radario):
+    script = [(503, ""), (500, ""), (200, '{"ok": true}')]
+
+    with FakeServer(script) as server, pytest.warns(UserWarning, match="Retry"):
+        response = radario._request_get(server.url + "/events", listing=True)
+
+    assert response.json() == {"ok": True}
+    assert len(server.requests) == 3
+    assert len(radario.sleeps) == 2
+    assert all(0 <= delay <= 0.02 for delay in radario.sleeps)
+
+
+def test_retry_after(radario):
+    script = [(429, "", {"Retry-After": "7"}), (200, "[]")]
+
+    with FakeServer(script) as server, pytest.warns(UserWarning, match="Bad response: 429"):
+        response = radario._request_get(server.url + "/events", listing=True)
+
+    assert response.ok
+    assert radario.sleeps == [7.0]
+
+
+def test_retry_connection_reset(radario):
+    script = ["reset", "reset", (200, "[]")]
+
+    with FakeServer(script) as server, pytest.warns(UserWarning, match="Retry connection"):
+        response = radario._request_get(server.url + "/events", listing=True)
+
+    assert response.ok
+    assert len(server.requests) == 3
+
+
+def test_retry_connection_reset_raise(radario):
+    with FakeServer(["reset"]) as server, pytest.warns(UserWarning):
+        with pytest.raises(requests.ConnectionError):
+            radario._request_get(server.url + "/events/1")
+
+    assert len(server.requests) == 2
+
+
+def test_detail_policy_break(radario):
+    with FakeServer([(502, "")]) as server, pytest.warns(UserWarning, match="Break"):
+        response = radario._request_get(server.url + "/events/1")
+
+    assert response is None
+    assert len(server.requests) == 2
+
+
+def test_not_retryable_status(radario):
+    with FakeServer([(404, "")]) as server, pytest.warns(UserWarning, match="Break"):
+        response = radario._request_get(server.url + "/events/1", listing=True)
+
+    assert response is None
+    assert len(server.requests) == 1
+    assert radario.sleeps == []
+
+
+def test_response_without_status_not_retried():
+    policy = RetryPolicy()
+
+    assert not policy.is_retryable(Response(ok=False))
+    assert policy.is_retryable(Response(ok=False, status_code=503))
+    assert not policy.is_retryable(Response(ok=False, status_code=404))
+
+
+def test_retry_budget(radario):
+    budget = RetryBudget(max_retries=1, per_seconds=60)
+    radario.LISTING_RETRY_POLICY.budget = budget
+
+    with FakeServer([(500, "")]) as server, pytest.warns(UserWarning):
+        assert radario._request_get(server.url + "/events", listing=True) is None
+        assert radario._request_get(server.url + "/events", listing=True) is None
+
+    assert len(server.requests) == 3
+    assert budget.remaining(server.url.split("//")[-1]) == 0
+
+
+def test_retry_budget_window():
+    now = [0.0]
+    budget = RetryBudget(max_retries=2, per_seconds=10, clock=lambda: now[0])
+
+    assert budget.spend("radario.ru") and budget.spend("radario.ru")
+    assert not budget.spend("radario.ru")
+    assert budget.spend("live.mts.ru")
+
+    now[0] = 10.0
+    assert budget.spend("radario.ru")
+
+
+def test_backoff_is_capped():
+    policy = RetryPolicy(base_delay=1, max_delay=4)
+
+    assert all(0 <= policy.delay(attempt) <= 4 for attempt in range(10))
+
+
+@pytest.mark.parametrize(
+    "headers, delay",
+    [
+        ({}, None),
+        ({"Retry-After": "12"}, 12.0),
+        ({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, 0.0),
+        ({"Retry-After": "soon"}, None),
+    ],
+)
+def test_parse_retry_after(headers, delay):
+    assert parse_retry_after(headers) == delay
@@ -0,0 +1,123 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from escraper.parsers import VK
+from escraper.parsers.seen import BloomSeenIndex, MemorySeenIndex, SeenIndex, SqliteSeenIndex, seen_index
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def index(request, tmp_path):
+    if request.param == "memory":
+        return MemorySeenIndex(["RADARIO-1"])
+    index = SqliteSeenIndex(tmp_path / "seen.sqlite")
+    index.add("RADARIO-1")
+    return index
+
+
+def test_seen_index(index):
+    index.add("RADARIO-2")
+    index.update(["RADARIO-2", "RADARIO-3"])
+
+    assert "RADARIO-1" in index
+    assert "RADARIO-3" in index
+    assert "RADARIO-4" not in index
+    assert len(index) == 3
+
+
+def test_sqlite_seen_index_persistent(tmp_path):
+    with SqliteSeenIndex(tmp_path / "seen.sqlite") as index:
+        index.update(f"MTS-{i}" for i in range(1000))
+
+    with SqliteSeenIndex(tmp_path / "seen.sqlite") as index:
+        assert len(index) == 1000
+        assert "MTS-999" in index
+        assert "MTS-1000" not in index
+
+
+def test_seen_index_from_collection():
+    existed_event_ids = ["RADARIO-1"]
+    index = seen_index(existed_event_ids)
+    index.add("RADARIO-2")
+    index.add("RADARIO-2")
+
+    assert isinstance(index, SeenIndex)
+    assert "RADARIO-1" in index
+    assert existed_event_ids == ["RADARIO-1", "RADARIO-2"]
+
+    existed_event_ids = {"RADARIO-1"}
+    seen_index(existed_event_ids).update(["RADARIO-2"])
+    assert existed_event_ids == {"RADARIO-1", "RADARIO-2"}
+
+    assert seen_index(index) is index
+    assert seen_index() is not seen_index()
+
+
+def test_vk_get_ids(tmp_path):
+    vk = VK.__new__(VK)
+    events = [dict(id=1), dict(id=2), dict(id=3)]
+
+    assert vk.get_ids(events) == [1, 2, 3]
+    assert vk.get_ids(events, ["VK-2"]) == [1, 3]
+    with SqliteSeenIndex(tmp_path / "seen.sqlite") as index:
+        index.add("VK-3")
+        assert vk.get_ids(events, index) == [1, 2]
+
+
+
+def test_bloom_seen_index(tmp_path):
+    ids = [f"TIMEPAD-{i}" for i in range(20000)]
+    index = BloomSeenIndex.build(tmp_path / "seen.bloom", ids, error_rate=0.01)
+
+    assert all(event_id in index for event_id in ids)
+    false_positives = sum(f"RADARIO-{i}" in index for i in range(20000))
+    assert false_positives < 20000 * 0.02
+    assert len(index) == pytest.approx(20000, rel=0.01)
+    index.close()
+
+    # file is reopened with the same parameters
+    with BloomSeenIndex(tmp_path / "seen.bloom", readonly=True) as index:
+        assert "TIMEPAD-19999" in index
+        assert index.capacity == 20000
+        index.add("MTS-1")
+        assert "MTS-1" in index
+
+    with BloomSeenIndex(tmp_path / "seen.bloom", readonly=True) as index:
+        assert "MTS-1" not in index
+
+
+def test_bloom_seen_index_exact(tmp_path):
+    exact = SqliteSeenIndex(tmp_path / "seen.sqlite")
+    index = BloomSeenIndex(tmp_path / "seen.bloom", capacity=10, error_rate=0.5, exact=exact)
+    index.update(f"VK-{i}" for i in range(10))
+
+    assert all(f"VK-{i}" in index for i in range(10))
+    assert not any(f"VK-{i}" in index for i in range(10, 1000))
+    assert len(exact) == 10
+
+    with pytest.warns(UserWarning, match="capacity"):
+        index.update(f"VK-{i}" for i in range(10, 20))
+
+
+def test_bloom_seen_index_errors(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        BloomSeenIndex(tmp_path / "seen.bloom")
+
+    (tmp_path / "other").write_bytes(b"x" * 100)
+    with pytest.raises(ValueError):
+        BloomSeenIndex(tmp_path / "other")
+
+
+def test_bloom_seen_index_processes(tmp_path):
+    BloomSeenIndex.build(tmp_path / "seen.bloom", ["VK-2"], capacity=1000).close()
+    index = BloomSeenIndex(tmp_path / "seen.bloom", readonly=True)
+    vk = VK.__new__(VK)
+    events = [dict(id=1), dict(id=2), dict(id=3)]
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert list(executor.map(vk.get_ids, [events] * 2, [index] * 2)) == [[1, 3]] * 2
+
+
+def test_seen_index_abstract():
+    with pytest.raises(TypeError):
+        SeenIndex()
@@ -0,0 +1,55 @@
+import pytest
+
+from bs4 import BeautifulSoup
+from lxml import etree
+
+from escraper.parsers.selector import Selector, SelectorSpec, squash_whitespace
+
+
+BODY = """
+<html><head><link rel="stylesheet" href="a.css"><link rel="canonical" href="https://x.ru/1"></head>
+<body>
+  <div class="info"><span>no time</span></div>
+  <div class="info main"><time>
+     12 мая,   19:00 </time></div>
+  <article class="col-md-9 col-sm-12"><p>Раз<!-- c -->
+  <b>два</b></p><p>три</p></article>
+  <a id="buy" class="btn">Купить</a>
+</body></html>
+"""
+
+
+@pytest.fixture
+def soup():
+    return BeautifulSoup(BODY, "lxml")
+
+
+def test_selector_chain(soup):
+    # first div.info has no time, the same as soup.find(...).find(...)
+    values = SelectorSpec(
+        time="div.info time",
+        main_time=("div.main time", squash_whitespace),
+    ).extract_html(BODY)
+
+    assert soup.find("div", class_="info").find("time") is None
+    assert values == dict(time=None, main_time="12 мая, 19:00")
+
+
+def test_selector_values(soup):
+    values = SelectorSpec(
+        url="link[rel=canonical] @href",
+        text="article[class='col-md-9 col-sm-12'] p",
+        buy=("a#buy.btn", str.upper),
+        missing="section#missing h1",
+    ).extract(etree.HTML(BODY))
+
+    assert values["url"] == soup.find("link", {"rel": "canonical"})["href"]
+    assert values["text"] == soup.find("article", class_="col-md-9 col-sm-12").find("p").text
+    assert values["buy"] == "КУПИТЬ"
+    assert values["missing"] is None
+
+
+@pytest.mark.parametrize("selector", ["", "div..a", "div @href p", "@href", "div[class=a"])
+def test_bad_selector(selector):
+    with pytest.raises(ValueError):
+        Selector(selector)
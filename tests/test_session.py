@@ -0,0 +1,44 @@
+import requests
+
+from escraper.parsers import MTS, Radario
+from escraper.parsers.session import SessionPool
+
+
+def test_session_pool_shared():
+    assert SessionPool.shared() is SessionPool.shared()
+
+
+def test_session_pool_per_parser():
+    radario = Radario()
+
+    assert isinstance(radario.session_pool, SessionPool)
+    assert radario.session_pool is radario.session_pool
+    assert radario.session_pool is not MTS().session_pool
+
+
+def test_session_pool_assign():
+    pool = SessionPool(pool_maxsize=2)
+    radario, mts = Radario(), MTS()
+    radario.session_pool = pool
+    mts.session_pool = pool
+
+    assert radario.session_pool.session is mts.session_pool.session
+
+
+def test_session_pool_adapters():
+    session = SessionPool(pool_connections=3, pool_maxsize=5).session
+    adapter = session.get_adapter("https://radario.ru")
+
+    assert isinstance(session, requests.Session)
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 5
+    assert session.headers["Connection"] == "keep-alive"
+
+
+def test_session_pool_without_keep_alive():
+    pool = SessionPool(keep_alive=False)
+
+    assert pool.session.headers["Connection"] == "close"
+
+    pool.close()
+    assert pool._session is None
@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from escraper.parsers import Radario
+from escraper.parsers.cache import ResponseCache
+from escraper.parsers.ratelimit import RateLimiter
+from escraper.parsers.retry import RetryPolicy
+from escraper.parsers.stats import CrawlStats
+
+from .testing import FakeServer, radario_event
+
+
+@pytest.fixture
+def radario():
+    radario = Radario()
+    radario.rate_limiter = RateLimiter()
+    radario.LISTING_RETRY_POLICY = RetryPolicy(max_retries=5, base_delay=0.01, sleep=lambda delay: None)
+    radario.DETAIL_RETRY_POLICY = RetryPolicy(max_retries=1, base_delay=0.01, sleep=lambda delay: None)
+    radario.stats = CrawlStats()
+    return radario
+
+
+def test_stats_requests(radario):
+    script = [(503, ""), (200, "0123456789"), (404, "")]
+    with FakeServer(script) as server, pytest.warns(UserWarning):
+        radario._request_get(server.url + "/events", listing=True)
+        radario._request_get(server.url + "/events/1")
+
+    stats = radario.stats.sources["radario"]
+    assert stats.requests == 2
+    assert stats.failed == 1
+    assert stats.retries == 1
+    assert stats.bytes == 10
+    assert stats.status_codes == {200: 1}
+    assert stats.max_latency >= stats.mean_latency > 0
+
+
+def test_stats_on_request(radario):
+    records = list()
+    radario.stats.on_request = records.append
+
+    with FakeServer(["reset"]) as server, pytest.warns(UserWarning):
+        with pytest.raises(Exception):
+            radario._request_get(server.url + "/events/1")
+
+    assert len(records) == 1
+    assert records[0].status_code is None
+    assert records[0].retries == 1
+    assert records[0].error is not None
+    assert radario.stats.sources["radario"].failed == 1
+
+
+def test_stats_cache_hits(radario, tmp_path):
+    radario.response_cache = ResponseCache(tmp_path / "cache.sqlite")
+    with FakeServer(lambda path: (200, "{}")) as server:
+        radario._request_get(server.url + "/events/1")
+        radario._request_get(server.url + "/events/1")
+        asyncio.run(radario._arequest_get(server.url + "/events/1"))
+
+    stats = radario.stats.sources["radario"]
+    assert stats.requests == 3
+    assert stats.cache_hits == 2
+    assert stats.bytes == 2
+
+
+def test_stats_tag_time(radario):
+    radario.parse(radario_event(1), tags=("id", "title", "full_text"))
+    radario.parse(radario_event(2), tags=("id", "title"))
+
+    summary = radario.stats.summary()["radario"]
+    assert summary["events"] == 2
+    assert set(summary["tag_time"]) == {"id", "title", "full_text"}
+    assert summary["parse_time"] == pytest.approx(sum(summary["tag_time"].values()))
+    assert radario.stats.report().startswith("radario: 0 requests")
+
+
+def test_stats_disabled():
+    radario = Radario()
+    event = radario.parse(radario_event(1), tags=("id",))
+
+    assert radario.stats is None
+    assert event.id == "RADARIO-1"
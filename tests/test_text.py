@@ -0,0 +1,108 @@
+import random
+import warnings
+
+import pytest
+
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+from lxml import etree
+
+from escraper.parsers.text import element_text, html_to_text
+
+
+TESTDATA = Path(__file__).parent / "test_data"
+
+CASES = [
+    "",
+    "plain text",
+    "  leading whitespace",
+    " ",
+    "\n",
+    "a\r\nb",
+    "text\x00nul",
+    "\ufeffbom",
+    "Концерт &laquo;Кино&raquo;&nbsp;в 19:00",
+    "a & b < c > d",
+    "&unknown; &#1071; &#x41;",
+    "<p>Описание<br/>концерта</p>\n\n<p>Вход свободный</p>",
+    "<p>a</p>   <p>b</p>\n  <p>c</p>",
+    "<pre>  keep\n  spaces  </pre>",
+    "<textarea> <b>x</b> </textarea>",
+    "<!-- comment -->text<!DOCTYPE html><?pi x?>",
+    "<![CDATA[data]]>",
+    "<script>var a = 1;</script>text",
+    "<style>p {}</style>text",
+    "<template>t</template>",
+    "<html><head><title>T</title></head><body>b</body></html>\n",
+    "</p>a</div>b",
+    "<p>",
+]
+
+TOKENS = [
+    "<p>", "</p>", "<br/>", "<b>", "</b>", " ", "\n", "\t", "\r\n", "&nbsp;", "&amp;", "&laquo;", "&bogus;",
+    "&", "<", ">", "text", "Текст", "<pre>", "</pre>", "<!-- c -->", "<!DOCTYPE html>", "<table><tr><td>",
+    "</table>", "<html>", "</html>", "<body>", "</body>", "<a href='x>y'>", "</a>", "<li>", "\x00", "<script>",
+    "<div class='a'>", "</div>", "<style>p {}</style>", "<ruby>r<rt>rt</rt></ruby>", "<textarea>", "</textarea>",
+]
+
+
+def soup_text(data):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return BeautifulSoup(data, "lxml").text
+
+
+@pytest.mark.parametrize("data", CASES)
+def test_html_to_text(data):
+    assert html_to_text(data) == soup_text(data)
+
+
+def test_html_to_text_fixtures():
+    pages = [path.read_text() for path in sorted(TESTDATA.glob("*/*.html"))]
+    rnd = random.Random(0)
+
+    for _ in range(300):
+        page = rnd.choice(pages)
+        start = rnd.randrange(len(page))
+        data = page[start:start + rnd.randrange(1, 5000)]
+        assert html_to_text(data) == soup_text(data)
+
+
+def test_html_to_text_random_markup():
+    rnd = random.Random(0)
+
+    for _ in range(2000):
+        data = "".join(rnd.choice(TOKENS) for _ in range(rnd.randrange(1, 20)))
+        assert html_to_text(data) == soup_text(data)
+
+
+def test_plain_text_not_parsed(monkeypatch):
+    monkeypatch.setattr("escraper.parsers.text.etree.HTMLParser", None)
+    assert html_to_text("Двор Гостинки") == "Двор Гостинки"
+
+
+def test_element_text_random_markup():
+    rnd = random.Random(0)
+    # lxml tree has no doctype inside the page, so it doesn't split text there as soup does
+    tokens = [token for token in TOKENS if token != "<!DOCTYPE html>"]
+
+    for _ in range(1000):
+        data = "".join(rnd.choice(tokens) for _ in range(rnd.randrange(1, 20)))
+        root = etree.HTML(data)
+        if root is None:
+            continue
+
+        elements = [element for element in root.iter() if isinstance(element.tag, str)]
+        tags = soup_tags(data)
+        if [element.tag for element in elements] != [tag.name for tag in tags]:
+            continue  # soup and lxml trees differ (e.g. for broken markup)
+
+        for element, tag in zip(elements, tags):
+            assert element_text(element) == tag.text
+
+
+def soup_tags(data):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return BeautifulSoup(data, "lxml").find_all(True)
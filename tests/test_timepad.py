@@ -7,7 +7,7 @@ import find_metro
 
 from escraper.parsers import Timepad
 
-from .testing import Response
+from .testing import Response, patch_requests_get
 
 
 #######################################
@@ -61,7 +61,7 @@ def requests_get_event(monkeypatch):
     def get(*args, **kwargs):
         return Response(ok=True, json_items=timepad_response_event)
 
-    monkeypatch.setattr(requests, "get", get)
+    patch_requests_get(monkeypatch, get)
 
 
 def test_timepad_get_event_by_id(requests_get_event):
@@ -92,7 +92,7 @@ def requests_get_event_not_moderated(monkeypatch):
     def get(*args, **kwargs):
         return Response(ok=True, json_items=timepad_response_event)
 
-    monkeypatch.setattr(requests, "get", get)
+    patch_requests_get(monkeypatch, get)
 
 
 def test_timepad_get_event_not_moderated(requests_get_event_not_moderated):
@@ -107,7 +107,7 @@ def requests_get_events(monkeypatch):
     def get(*args, **kwargs):
         return Response(ok=True, json_items=dict(values=[timepad_response_event]))
 
-    monkeypatch.setattr(requests, "get", get)
+    patch_requests_get(monkeypatch, get)
 
 
 def test_timepad_get_events(requests_get_events):
@@ -123,7 +123,7 @@ def requests_get_events_not_moderated(monkeypatch):
     def get(*args, **kwargs):
         return Response(ok=True, json_items=dict(values=[timepad_response_event]))
 
-    monkeypatch.setattr(requests, "get", get)
+    patch_requests_get(monkeypatch, get)
 
 
 def test_timepad_get_events_not_moderated(requests_get_events_not_moderated):
@@ -146,7 +146,7 @@ def requests_get_event_adress(monkeypatch):
     def get_subway(*args, **kwargs):
         return "test subway"
 
-    monkeypatch.setattr(requests, "get", get)
+    patch_requests_get(monkeypatch, get)
     monkeypatch.setattr(find_metro.metro.get_subway_name, "get_subway", get_subway)
 
 
@@ -167,7 +167,7 @@ def requests_get_event_adress_city1(monkeypatch):
     def get(*args, **kwargs):
         return Response(ok=True, json_items=timepad_response_event)
 
-    monkeypatch.setattr(requests, "get", get)
+    patch_requests_get(monkeypatch, get)
 
 
 def test_timepad_adress_city1(requests_get_event_adress_city1):
@@ -187,7 +187,7 @@ def requests_get_event_adress_city2(monkeypatch):
     def get(*args, **kwargs):
         return Response(ok=True, json_items=timepad_response_event)
 
-    monkeypatch.setattr(requests, "get", get)
+    patch_requests_get(monkeypatch, get)
 
 
 def test_timepad_adress_city2(requests_get_event_adress_city2):
@@ -207,7 +207,7 @@ def requests_get_event_adress_city3(monkeypatch):
     def get(*args, **kwargs):
         return Response(ok=True, json_items=timepad_response_event)
 
-    monkeypatch.setattr(requests, "get", get)
+    patch_requests_get(monkeypatch, get)
 
 
 def test_timepad_adress_city3(requests_get_event_adress_city3):
@@ -227,7 +227,7 @@ def requests_get_event_adress_city4(monkeypatch):
     def get(*args, **kwargs):
         return Response(ok=True, json_items=timepad_response_event)
 
-    monkeypatch.setattr(requests, "get", get)
+    patch_requests_get(monkeypatch, get)
 
 
 def test_timepad_adress_city4(requests_get_event_adress_city4):
@@ -250,7 +250,7 @@ def requests_get_event_date_to(monkeypatch):
     def get(*args, **kwargs):
         return Response(ok=True, json_items=timepad_response_event)
 
-    monkeypatch.setattr(requests, "get", get)
+    patch_requests_get(monkeypatch, get)
 
 
 def test_timepad_date_to(requests_get_event_date_to):
@@ -283,7 +283,7 @@ def test_timepad_post_text(monkeypatch, description):
     def get(*args, **kwargs):
         return Response(ok=True, json_items=timepad_response_event)
 
-    monkeypatch.setattr(requests, "get", get)
+    patch_requests_get(monkeypatch, get)
 
     tags = ("post_text",)
     event = Timepad().get_event(event_id=12345, tags=tags)
@@ -304,7 +304,7 @@ def requests_get_event_poster_imag(monkeypatch):
     def get(*args, **kwargs):
         return Response(ok=True, json_items=timepad_response_event)
 
-    monkeypatch.setattr(requests, "get", get)
+    patch_requests_get(monkeypatch, get)
 
 
 def test_timepad_poster_imag(requests_get_event_poster_imag):
@@ -350,7 +350,7 @@ def test_timepad_price(monkeypatch, ticket_type, answ, is_registration_open):
     def get(*args, **kwargs):
         return Response(ok=True, json_items=timepad_response_event)
 
-    monkeypatch.setattr(requests, "get", get)
+    patch_requests_get(monkeypatch, get)
     tags = ("price",)
     event = Timepad().get_event(event_id=12345, tags=tags)
 
@@ -0,0 +1,112 @@
+import json
+from datetime import datetime
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from escraper.parsers import MTS, Timepad
+from escraper.parsers.ratelimit import RateLimiter
+from escraper.parsers.watermarks import WatermarkStore
+
+from .testing import FakeServer
+
+
+@pytest.fixture
+def watermarks(tmp_path):
+    store = WatermarkStore(tmp_path / "watermarks.sqlite")
+    yield store
+    store.close()
+
+
+def test_watermark_store(watermarks, tmp_path):
+    watermarks.set("mts", "sankt-peterburg/concerts", "2024-05-01")
+    watermarks.set("mts", "sankt-peterburg/concerts", "2024-05-02")
+    watermarks.set("timepad", "/", "2024-05-01T10:00:00+0300")
+
+    assert watermarks.get("mts", "sankt-peterburg/concerts") == "2024-05-02"
+    assert watermarks.get("mts", "moscow/concerts") is None
+    assert watermarks.items("timepad") == {("timepad", "/"): "2024-05-01T10:00:00+0300"}
+
+    watermarks.delete("mts")
+    assert len(watermarks) == 1
+    assert len(WatermarkStore(tmp_path / "watermarks.sqlite")) == 1
+
+
+def test_listing_days(watermarks):
+    mts = MTS()
+    mts.watermarks = watermarks
+    date_from, date_to = datetime(2024, 5, 1, 12), datetime(2024, 5, 5, 12)
+
+    # crawl is interrupted after the second day
+    days = mts._listing_days(date_from, date_to, "city/category")
+    assert [next(days), next(days)] == [datetime(2024, 5, 1, 12), datetime(2024, 5, 2, 12)]
+    assert watermarks.get("mts", "city/category") == "2024-05-01"
+
+    days = list(mts._listing_days(date_from, date_to, "city/category"))
+    assert days == [datetime(2024, 5, day, 12) for day in (2, 3, 4, 5)]
+    assert list(mts._listing_days(date_from, date_to, "city/category")) == []
+    assert len(list(mts._listing_days(date_from, date_to, "city/category", full_refresh=True))) == 5
+
+    mts.watermarks = None
+    assert len(list(mts._listing_days(date_from, date_to, "city/category"))) == 5
+
+
+def test_listing_days_stored_when_flow_returns(watermarks):
+    mts = MTS()
+    mts.watermarks = watermarks
+    date_from, date_to = datetime(2024, 5, 1, 12), datetime(2024, 5, 5, 12)
+
+    def flow(fail_day=None):
+        for day in mts._listing_days(date_from, date_to, "city/category"):
+            if day.day == fail_day:
+                raise AttributeError("'NoneType' object has no attribute 'text'")
+        return list()
+        yield
+
+    with pytest.raises(AttributeError):
+        mts._run(flow(fail_day=3), incremental=True)
+    assert watermarks.get("mts", "city/category") is None
+
+    mts._run(flow(), incremental=True)
+    assert watermarks.get("mts", "city/category") == "2024-05-05"
+
+
+def test_timepad_created_at_watermark(watermarks):
+    created_at = ["2024-05-01T10:00:00+03:00", "2024-05-02T09:00:00+03:00", "2024-05-01T23:00:00+00:00"]
+    values = [dict(created_at=value, moderation_status="not_moderated") for value in created_at]
+
+    with FakeServer(lambda path: (200, json.dumps(dict(values=values)))) as server:
+        timepad = Timepad(token="test")
+        timepad.events_api = server.url + "/events"
+        timepad.rate_limiter = RateLimiter()
+        timepad.watermarks = watermarks
+
+        params = dict(cities="Санкт-Петербург")
+        timepad.get_events(request_params=params)
+        timepad.get_events(request_params=params)
+        timepad.get_events(request_params=params, full_refresh=True)
+
+    queries = [parse_qs(urlsplit(path).query) for path in server.requests]
+    assert "created_at_min" not in queries[0]
+    assert queries[1]["created_at_min"] == ["2024-05-02T09:00:00+03:00"]
+    assert "created_at_min" not in queries[2]
+    assert queries[0]["sort"] == ["created_at"]
+    assert "created_at" in queries[0]["fields"][0]
+    assert params == dict(cities="Санкт-Петербург")
+
+
+def test_timepad_other_sort_without_watermark(watermarks):
+    values = [dict(created_at="2024-05-02T09:00:00+03:00", moderation_status="not_moderated")]
+    watermarks.set("timepad", "Санкт-Петербург/", "2024-05-01T10:00:00+03:00")
+
+    with FakeServer(lambda path: (200, json.dumps(dict(values=values)))) as server:
+        timepad = Timepad(token="test")
+        timepad.events_api = server.url + "/events"
+        timepad.rate_limiter = RateLimiter()
+        timepad.watermarks = watermarks
+        timepad.get_events(request_params=dict(cities="Санкт-Петербург", sort="starts_at"))
+
+    query = parse_qs(urlsplit(server.requests[0]).query)
+    assert query["sort"] == ["starts_at"]
+    assert "created_at_min" not in query
+    assert watermarks.get("timepad", "Санкт-Петербург/") == "2024-05-01T10:00:00+03:00"
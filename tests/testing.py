@@ -1,12 +1,279 @@
+import asyncio
+import gzip
+import json
+import socket
+import struct
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
 import pytest
+import requests
+
+from escraper.parsers.aio import AsyncSessionPool
 
 
 class Response:
-    def __init__(self, content=None, ok=None, json_items=None, text=None):
+    def __init__(self, content=None, ok=None, json_items=None, text=None, status_code=None, headers=None, url=None):
         self.content = content
         self.ok = ok
         self.json_items = json_items
         self.text = text
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.url = url
+        self.encoding = None
+
+    def __bool__(self):
+        return bool(self.ok)
 
     def json(self):
+        if self.json_items is None:
+            return json.loads(self.text)
         return dict(**self.json_items)
+
+
+def patch_requests_get(monkeypatch, get):
+    """Route parsers requests (plain and pooled sessions) to 'get'."""
+    monkeypatch.setattr(requests, "get", get)
+    monkeypatch.setattr(
+        requests.Session, "get", lambda session, *args, **kwargs: get(*args, **kwargs)
+    )
+
+
+class FakeServer:
+    """
+    Local HTTP server that answers with scripted responses.
+
+    Every request takes next item from 'script' (last item repeats):
+        (status, body) or (status, body, headers) - send response
+        "reset" - close connection with TCP reset
+    or 'script' is function of request path, that returns item.
+    """
+
+    def __init__(self, script):
+        self.script = script if callable(script) else list(script)
+        self.requests = list()
+        self.request_headers = list()
+
+        fake_server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                fake_server.requests.append(self.path)
+                fake_server.request_headers.append(dict(self.headers))
+                item = fake_server.next_item(self.path)
+
+                if item == "reset":
+                    self.connection.setsockopt(
+                        socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0)
+                    )
+                    self.connection.close()
+                    self.close_connection = True
+                    return
+
+                status, body, *headers = item
+                body = body.encode()
+                self.send_response(status)
+                for name, value in (headers[0] if headers else {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, kwargs=dict(poll_interval=0.01), daemon=True
+        )
+
+    def next_item(self, path):
+        if callable(self.script):
+            return self.script(path)
+        if len(self.script) > 1:
+            return self.script.pop(0)
+        return self.script[0]
+
+    @property
+    def url(self):
+        host, port = self.server.server_address
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def radario_event(event_id):
+    """Radario API event json."""
+    return dict(
+        id=event_id,
+        title=f"test title {event_id}",
+        placeAddress="Санкт-Петербург, Test avenue, 1",
+        cityName="Санкт-Петербург",
+        placeTitle="test place_name",
+        superTagName="test category",
+        beginDate="2024-01-01T19:00:00.000+03:00",
+        endDate="2024-01-01T21:00:00.000+03:00",
+        description="<p>test<br/>post_text</p>",
+        imageUri="test_image.png",
+        minPrice=500.0,
+        currency="RUB",
+        ticketCount=10,
+    )
+
+
+class Cassette:
+    """
+    Record / replay all requests of parsers.
+
+    In "record" mode real responses are passed to parsers and saved,
+    in "replay" mode saved responses (testing.Response) are returned
+    in the same order without network. Identical requests are replayed
+    in recorded order, the last one repeats.
+
+    Parameters:
+    -----------
+    path : str or Path
+        Cassette file (json, gzipped if name ends with ".gz").
+
+    mode : "replay" or "record", default "replay"
+
+    latency : float or "recorded", default 0
+        Latency added to every replayed response (seconds),
+        "recorded" - latency of recorded response.
+
+    Examples:
+    ---------
+    >>> with Cassette("mts.json.gz", mode="record"):
+    ...     events = MTS().get_events(request_params=params)
+
+    >>> with Cassette("mts.json.gz", latency=0.05):
+    ...     assert MTS().get_events(request_params=params) == events
+    """
+
+    def __init__(self, path, mode="replay", latency=0.0):
+        if mode not in ("replay", "record"):
+            raise ValueError(f"Unknown cassette mode: {mode!r}")
+
+        self.path = Path(path)
+        self.mode = mode
+        self.latency = latency
+        self.interactions = list()
+
+        self._lock = threading.Lock()
+        self._replay_index = defaultdict(int)
+        self._patched = list()
+
+        if mode == "replay":
+            self.load()
+
+    def __len__(self):
+        return len(self.interactions)
+
+    @staticmethod
+    def key(url, params=None):
+        return requests.Request("GET", url, params=params).prepare().url
+
+    def load(self):
+        opener = gzip.open if self.path.suffix == ".gz" else open
+        with opener(self.path, "rt", encoding="utf-8") as fp:
+            self.interactions = json.load(fp)
+
+        self._by_key = defaultdict(list)
+        for interaction in self.interactions:
+            self._by_key[interaction["key"]].append(interaction)
+
+    def save(self):
+        opener = gzip.open if self.path.suffix == ".gz" else open
+        with opener(self.path, "wt", encoding="utf-8") as fp:
+            json.dump(self.interactions, fp, ensure_ascii=False)
+
+    def record(self, response, key, elapsed):
+        with self._lock:
+            self.interactions.append(dict(
+                key=key,
+                url=response.url,
+                status_code=response.status_code,
+                headers=dict(response.headers),
+                encoding=response.encoding,
+                text=response.text,
+                elapsed=elapsed,
+            ))
+
+    def replay(self, key):
+        with self._lock:
+            interactions = self._by_key.get(key)
+            if not interactions:
+                raise KeyError(f"Request not found in cassette {self.path}: {key}")
+
+            index = min(self._replay_index[key], len(interactions) - 1)
+            self._replay_index[key] += 1
+
+        interaction = interactions[index]
+        response = Response(
+            content=interaction["text"].encode(interaction["encoding"] or "utf-8"),
+            ok=interaction["status_code"] < 400,
+            text=interaction["text"],
+            status_code=interaction["status_code"],
+            headers=interaction["headers"],
+            url=interaction["url"],
+        )
+        return response, self.replay_latency(interaction)
+
+    def replay_latency(self, interaction):
+        if self.latency == "recorded":
+            return interaction["elapsed"]
+        return self.latency
+
+    def __enter__(self):
+        cassette = self
+        session_get = requests.Session.get
+        async_get = AsyncSessionPool.get
+
+        if self.mode == "record":
+            def get(session, url, params=None, **kwargs):
+                start = time.perf_counter()
+                response = session_get(session, url, params=params, **kwargs)
+                cassette.record(response, cassette.key(url, params), time.perf_counter() - start)
+                return response
+
+            async def aget(pool, url, params=None, **kwargs):
+                start = time.perf_counter()
+                response = await async_get(pool, url, params=params, **kwargs)
+                cassette.record(response, cassette.key(url, params), time.perf_counter() - start)
+                return response
+
+        else:
+            def get(session, url, params=None, **kwargs):
+                response, latency = cassette.replay(cassette.key(url, params))
+                if latency:
+                    time.sleep(latency)
+                return response
+
+            async def aget(pool, url, params=None, **kwargs):
+                response, latency = cassette.replay(cassette.key(url, params))
+                if latency:
+                    await asyncio.sleep(latency)
+                return response
+
+        self._patched = [(requests.Session, "get", session_get), (AsyncSessionPool, "get", async_get)]
+        requests.Session.get = get
+        AsyncSessionPool.get = aget
+        return self
+
+    def __exit__(self, *exc):
+        for owner, name, value in self._patched:
+            setattr(owner, name, value)
+        self._patched = list()
+
+        if self.mode == "record" and exc[0] is None:
+            self.save()